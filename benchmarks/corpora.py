@@ -0,0 +1,146 @@
+"""Reproducible synthetic corpora for the benchmarks
+
+Each corpus is generated from a fixed seed and the loaded emoji data, so it's the same across runs of the same data version.
+:class:`.EmojiSequence` **MUST** be loaded before generating them.
+"""
+
+import random
+import string
+from typing import Callable, Dict, List
+
+from emoji_data import EmojiSequence
+
+SEED = 51
+"""Seed of the random generators"""
+
+ZWJ = "‍"
+VS16 = "️"
+TAG_TERM = "\U000e007f"
+
+
+def _keys(*type_fields: str) -> List[str]:
+    return sorted(k for k in EmojiSequence.keys() if EmojiSequence[k].type_field in type_fields)
+
+
+def _words(rng: random.Random, count: int) -> List[str]:
+    return ["".join(rng.choices(string.ascii_letters + string.digits, k=rng.randint(1, 10))) for _ in range(count)]
+
+
+def ascii_only(size: int) -> str:
+    """ASCII words and punctuation, without any emoji"""
+    rng = random.Random(SEED)
+    text = " ".join(w + rng.choice(",.!? ") for w in _words(rng, size // 6))
+    return text[:size]
+
+
+def emoji_dense(size: int) -> str:
+    """RGI emoji sequences of all kinds next to each other, with a few spaces"""
+    rng = random.Random(SEED)
+    keys = sorted(EmojiSequence.rgi_keys())
+    parts: List[str] = []
+    n = 0
+    while n < size:
+        s = rng.choice(keys) + rng.choice(("", "", "", " "))
+        parts.append(s)
+        n += len(s)
+    return "".join(parts)[:size]
+
+
+def zwj_heavy(size: int) -> str:
+    """RGI emoji ZWJ sequences, separated by spaces"""
+    rng = random.Random(SEED)
+    keys = _keys("RGI_Emoji_ZWJ_Sequence")
+    parts: List[str] = []
+    n = 0
+    while n < size:
+        s = rng.choice(keys) + " "
+        parts.append(s)
+        n += len(s)
+    return "".join(parts)
+
+
+def flags_tags(size: int) -> str:
+    """RGI flag and tag sequences, and words"""
+    rng = random.Random(SEED)
+    keys = _keys("RGI_Emoji_Flag_Sequence", "RGI_Emoji_Tag_Sequence")
+    parts: List[str] = []
+    n = 0
+    while n < size:
+        s = rng.choice(keys) + rng.choice(("", " ", " flag "))
+        parts.append(s)
+        n += len(s)
+    return "".join(parts)
+
+
+def cjk_mixed(size: int) -> str:
+    """Chinese characters and punctuation, sparsely mixed with ASCII words and emoji"""
+    rng = random.Random(SEED)
+    keys = sorted(EmojiSequence.rgi_keys())
+    parts: List[str] = []
+    n = 0
+    while n < size:
+        r = rng.random()
+        if r < 0.05:
+            s = rng.choice(keys)
+        elif r < 0.15:
+            s = rng.choice(_words(rng, 1)) + " "
+        else:
+            s = "".join(chr(rng.randint(0x4E00, 0x9FFF)) for _ in range(rng.randint(1, 8))) + rng.choice("，。！？、")
+        parts.append(s)
+        n += len(s)
+    return "".join(parts)
+
+
+def adversarial(size: int) -> str:
+    """Near misses which make a matcher try and fail hard:
+    dangling ZWJ chains, lone regional indicators, unterminated tag sequences, stray selectors and modifiers
+    """
+    rng = random.Random(SEED)
+    zwj_elements = sorted({e for k in _keys("RGI_Emoji_ZWJ_Sequence") for e in k.split(ZWJ)})
+    makers: List[Callable[[], str]] = [
+        lambda: ZWJ.join(rng.choices(zwj_elements, k=rng.randint(2, 6))) + ZWJ,
+        lambda: chr(rng.randint(0x1F1E6, 0x1F1FF)) + "x",
+        lambda: "🏴" + "".join(chr(rng.randint(0xE0061, 0xE007A)) for _ in range(rng.randint(1, 12))),
+        lambda: rng.choice("#*0123456789") + VS16 + rng.choice(("", "x")),
+        lambda: VS16 * rng.randint(1, 4) + "\U0001f3fb" * rng.randint(1, 4),
+        lambda: TAG_TERM * rng.randint(1, 3),
+    ]
+    parts: List[str] = []
+    n = 0
+    while n < size:
+        s = rng.choice(makers)()
+        parts.append(s)
+        n += len(s)
+    return "".join(parts)
+
+
+CORPORA: Dict[str, Callable[[int], str]] = {
+    "ascii": ascii_only,
+    "emoji_dense": emoji_dense,
+    "zwj_heavy": zwj_heavy,
+    "flags_tags": flags_tags,
+    "cjk_mixed": cjk_mixed,
+    "adversarial": adversarial,
+}
+"""Generators of all the corpora by name, each takes the approximate size in characters"""
+
+
+RUNS: Dict[str, Callable[[int], str]] = {
+    "zwj_run": lambda size: ("👨" + ZWJ) * (size // 3),
+    "regional_indicator_run": lambda size: "🇦" * size,
+    "tag_run": lambda size: "🏴" + "\U000e0067" * (size - 1),
+    "modifier_run": lambda size: "👍" + "\U0001f3fb" * (size - 1),
+    "selector_run": lambda size: "#" + VS16 * (size - 1),
+}
+"""Generators of long runs of a single construct by name, each takes the size in characters, for worst-case scaling"""
+
+
+def tokens(count: int) -> List[str]:
+    """Strings for predicates: emoji sequences, single characters of them, and non-emoji words, shuffled"""
+    rng = random.Random(SEED)
+    keys = sorted(EmojiSequence.keys())
+    result = rng.sample(keys, min(count // 2, len(keys)))
+    result += [c for k in result[: count // 4] for c in k][: count // 4]
+    result += _words(rng, count - len(result))
+    rng.shuffle(result)
+    return result
@@ -0,0 +1,58 @@
+"""Benchmark the cost of ``import emoji_data`` in fresh interpreters, by ``python -X importtime``
+
+Usage::
+
+    python benchmarks/importtime.py [--repeat N] [--module NAME] [--max-us US]
+
+It prints a JSON object of the import's cumulative microseconds,
+and exits with status 1 if the median exceeds ``--max-us``.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentParser
+
+
+def import_time_us(module: str) -> int:
+    """Cumulative microseconds of importing the module in a fresh interpreter"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], check=True, capture_output=True, text=True
+    ).stderr
+    for line in stderr.splitlines():
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if name == module:
+            return int(cumulative_us)
+    raise RuntimeError(f"{module} not found in the output of -X importtime")
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="count of fresh interpreters (default: %(default)s)")
+    parser.add_argument("--module", default="emoji_data", help="module to import (default: %(default)s)")
+    parser.add_argument("--max-us", type=int, help="fail if the median cumulative microseconds exceeds it")
+    args = parser.parse_args()
+
+    import_time_us(args.module)  # warm up, and write bytecode caches
+    samples = [import_time_us(args.module) for _ in range(args.repeat)]
+    median = statistics.median(samples)
+    print(
+        json.dumps(
+            {
+                "module": args.module,
+                "python": sys.version.split()[0],
+                "repeat": args.repeat,
+                "min_us": min(samples),
+                "median_us": median,
+                "max_us": max(samples),
+            }
+        )
+    )
+    if args.max_us is not None and median > args.max_us:
+        print(f"median import time {median} us exceeds {args.max_us} us", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
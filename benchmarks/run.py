@@ -0,0 +1,188 @@
+"""Benchmark loading, finding and the predicates of emoji data on reproducible synthetic corpora
+
+Usage::
+
+    python benchmarks/run.py [--quick] [--size N] [--repeat N] [--filter REGEX] [--import-time]
+                             [--output FILE] [--compare BASELINE] [--threshold RATIO]
+
+It prints a JSON object of the results, or writes it to ``--output``.
+Each result is the seconds of one operation, the minimum and the median of ``--repeat`` rounds.
+
+To verify a change, save a baseline before it, then compare the results after it against the baseline::
+
+    python benchmarks/run.py --output baseline.json
+    # ... change the code ...
+    python benchmarks/run.py --compare baseline.json
+
+Comparing prints a table of the ratios to stderr,
+and exits with status 1 if any minimum is slower than the baseline's by more than ``--threshold``.
+Baselines are specific to the machine and the Python they were measured on.
+"""
+
+import inspect
+import json
+import platform
+import re
+import statistics
+import sys
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpora import CORPORA, tokens  # noqa: E402
+from importtime import import_time_us  # noqa: E402
+
+import emoji_data  # noqa: E402
+from emoji_data import EmojiSequence, definitions, detect_qualified, load_emoji_data, unload_emoji_data  # noqa: E402
+
+Result = Dict[str, Any]
+
+
+def measure(func: Callable[[], Any], repeat: int, min_time: float, items: int = 1) -> Result:
+    """Time one call of the function, calibrating the count of calls per round to take at least ``min_time`` seconds"""
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= max(2, min(10, int(min_time / max(elapsed, 1e-9)) + 1))
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((perf_counter() - start) / number)
+    return {"min": min(samples), "median": statistics.median(samples), "number": number, "repeat": repeat, "items": items}
+
+
+def _load():
+    unload_emoji_data()
+    re.purge()  # don't let the cache of `re` skip compiling the patterns
+    load_emoji_data()
+
+
+def benchmarks(size: int, n_tokens: int) -> Iterator[Tuple[str, Callable[[], Any], int]]:
+    """Generate ``(name, function, items)`` of all the benchmarks, where ``items`` is the input size of one call
+
+    ``load_emoji_data`` comes first, and emoji data stays loaded after it for the others.
+    """
+    yield "load_emoji_data", _load, 1
+
+    for name, make in CORPORA.items():
+        text = make(size)
+        yield f"EmojiSequence.find[{name}]", lambda: list(EmojiSequence.find(text)), len(text)
+        yield f"EmojiSequence.find_all[{name}]", lambda: EmojiSequence.find_all(text), len(text)
+
+    # Predicates of a single character (parameter `c`) are given single characters, the others any of the strings.
+    strings = tokens(n_tokens)
+    chars = list(dict.fromkeys(c for s in strings for c in s))
+    for name in definitions.__all__:
+        if not name.startswith("is_"):
+            continue
+        func = getattr(definitions, name)
+        params = list(inspect.signature(func).parameters)
+        args = chars if params[0] == "c" else strings
+        if len(params) == 1:
+            yield name, lambda: [func(s) for s in args], len(args)
+        else:  # is_qualified_emoji_character(s, i)
+            yield name, lambda: [func(s, 0) for s in args], len(args)
+    yield "are_rgi_emoji_sequences", lambda: definitions.are_rgi_emoji_sequences(strings), len(strings)
+    yield "detect_qualified", lambda: [detect_qualified(s) for s in strings], len(strings)
+
+
+def run(size: int, repeat: int, min_time: float, pattern: Optional[str], import_time: bool) -> Dict[str, Result]:
+    results: Dict[str, Result] = {}
+    if import_time:
+        samples = [import_time_us("emoji_data") for _ in range(repeat + 1)][1:]  # the first one writes bytecode caches
+        results["import emoji_data"] = {
+            "min": min(samples) / 1e6,
+            "median": statistics.median(samples) / 1e6,
+            "number": 1,
+            "repeat": repeat,
+            "items": 1,
+        }
+    load_emoji_data()
+    for name, func, items in benchmarks(size, size // 10):
+        if pattern and not re.search(pattern, name):
+            continue
+        # Loading takes a long time, and isn't repeated within a round.
+        results[name] = measure(func, repeat, 0 if func is _load else min_time, items)
+    return results
+
+
+def compare(results: Dict[str, Result], baseline: Dict[str, Result], threshold: float) -> List[str]:
+    """Print the ratio of each result to its baseline, and return names of the regressed ones"""
+    regressions = []
+    width = max(map(len, results), default=0)
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<{width}}  {result['min']:.3e}s  (new)", file=sys.stderr)
+            continue
+        ratio = result["min"] / base["min"] if base["min"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            flag = "  improvement"
+        print(f"{name:<{width}}  {base['min']:.3e}s -> {result['min']:.3e}s  x{ratio:.2f}{flag}", file=sys.stderr)
+    for name in baseline.keys() - results.keys():
+        print(f"{name:<{width}}  (missing)", file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="small corpora and short rounds, for smoke tests")
+    parser.add_argument("--size", type=int, help="characters of each corpus (default: 100000, or 5000 if --quick)")
+    parser.add_argument("--repeat", type=int, help="rounds of each benchmark (default: 5, or 3 if --quick)")
+    parser.add_argument("--filter", metavar="REGEX", help="only report benchmarks whose names match it")
+    parser.add_argument("--import-time", action="store_true", help="also measure `import emoji_data`, see importtime.py")
+    parser.add_argument("--output", metavar="FILE", help="write the JSON results to the file instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against the JSON results of an earlier run")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="ratio of slowdown reported as a regression (default: %(default)s)"
+    )
+    args = parser.parse_args()
+
+    size = args.size or (5_000 if args.quick else 100_000)
+    repeat = args.repeat or (3 if args.quick else 5)
+    min_time = 0.01 if args.quick else 0.1
+    results = run(size, repeat, min_time, args.filter, args.import_time)
+    report = {
+        "meta": {
+            "emoji_data": emoji_data.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "size": size,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if baseline["meta"].get("size") != size:
+            print(f"corpora of the baseline are of size {baseline['meta'].get('size')}, not {size}", file=sys.stderr)
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark the scaling of finding emoji sequences in adversarial input, from kilobytes to megabytes
+
+Usage::
+
+    python benchmarks/scaling.py [--sizes N [N ...]] [--repeat N] [--max-growth RATIO] [--regex]
+
+It prints a JSON object of the microseconds per character at each size, of the adversarial corpus and the runs of :data:`corpora.RUNS`.
+Matching in linear time, the microseconds per character stay flat as the size grows,
+it exits with status 1 if the ones at the largest size exceed the ones at the smallest by more than ``--max-growth`` times.
+``--regex`` measures running the combined ``EmojiSequence.pattern`` instead, for comparison.
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpora import RUNS, adversarial  # noqa: E402
+
+from emoji_data import EmojiSequence, load_emoji_data  # noqa: E402
+
+
+def us_per_char(find: Callable[[str], object], text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        find(text)
+        best = min(best, perf_counter() - start)
+    return best / len(text) * 1e6
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="characters of input (default: %(default)s)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="rounds at each size (default: %(default)s)")
+    parser.add_argument(
+        "--max-growth", type=float, default=3.0, help="allowed growth of time per character (default: %(default)s)"
+    )
+    parser.add_argument("--regex", action="store_true", help="run `EmojiSequence.pattern` instead of `EmojiSequence.find_all`")
+    args = parser.parse_args()
+
+    load_emoji_data()
+    if args.regex:
+        EmojiSequence.pattern  # compiled on the first access
+        find: Callable[[str], object] = lambda s: list(EmojiSequence.pattern.finditer(s))  # noqa: E731
+    else:
+        find = EmojiSequence.find_all
+    generators = {"adversarial": adversarial, **RUNS}
+    results: Dict[str, Dict[str, float]] = {}
+    failures: List[str] = []
+    for name, make in generators.items():
+        results[name] = {str(size): us_per_char(find, make(size), args.repeat) for size in args.sizes}
+        first, last = results[name][str(args.sizes[0])], results[name][str(args.sizes[-1])]
+        if last > first * args.max_growth:
+            failures.append(name)
+    print(
+        json.dumps(
+            {"function": "pattern.finditer" if args.regex else "EmojiSequence.find_all", "us_per_char": results}, indent=2
+        )
+    )
+    if failures:
+        print(f"time per character grows over {args.max_growth} times: {', '.join(failures)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark the scaling of finding emoji sequences with the count of threads
+
+Usage::
+
+    python benchmarks/threads.py [--threads N [N ...]] [--size N] [--chunks N] [--repeat N] [--corpus NAME] [--min-efficiency RATIO]
+
+Each thread runs ``EmojiSequence.find_all`` over its share of ``--chunks`` texts of ``--size`` characters,
+reading the same loaded emoji data without any lock.
+It prints a JSON object of the throughput in characters per second and the speedup over the first count of threads (1 by default), at each count.
+
+On free-threaded CPython builds (3.13t and later, with the GIL disabled), the speedup is expected to be near-linear up to the count of cores;
+it exits with status 1 if the parallel efficiency (speedup divided by threads) at any count up to the cores is under ``--min-efficiency``.
+With the GIL, threads don't run Python code in parallel, the speedup stays around 1 and the efficiency isn't checked.
+"""
+
+import json
+import os
+import platform
+import sys
+import threading
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpora import CORPORA  # noqa: E402
+
+from emoji_data import EmojiSequence, load_emoji_data  # noqa: E402
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def run_threads(texts: List[str], n_threads: int) -> float:
+    """Find in all the texts by ``n_threads`` threads, and return the seconds from the start to the last thread's end"""
+    barrier = threading.Barrier(n_threads + 1)
+
+    def work(share: List[str]):
+        barrier.wait()
+        for text in share:
+            EmojiSequence.find_all(text)
+
+    threads = [threading.Thread(target=work, args=(texts[i::n_threads],)) for i in range(n_threads)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = perf_counter()
+    for t in threads:
+        t.join()
+    return perf_counter() - start
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, 8, cores}),
+        help="counts of threads (default: %(default)s)",
+    )
+    parser.add_argument("--size", type=int, default=20_000, help="characters of each text (default: %(default)s)")
+    parser.add_argument(
+        "--chunks", type=int, default=64, help="count of texts, shared among the threads (default: %(default)s)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="rounds at each count of threads (default: %(default)s)")
+    parser.add_argument(
+        "--corpus", choices=list(CORPORA), default="emoji_dense", help="corpus of the texts (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--min-efficiency",
+        type=float,
+        default=0.6,
+        help="minimum speedup per thread without the GIL (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    load_emoji_data()
+    text = CORPORA[args.corpus](args.size * args.chunks)
+    texts = [text[i : i + args.size] for i in range(0, len(text), args.size)]
+    EmojiSequence.find_all(texts[0])  # warm up
+
+    results: Dict[str, Dict[str, float]] = {}
+    base = None
+    for n in args.threads:
+        seconds = min(run_threads(texts, n) for _ in range(args.repeat))
+        throughput = len(text) / seconds
+        base = base or throughput
+        results[str(n)] = {"chars_per_second": throughput, "speedup": throughput / base}
+
+    gil = gil_enabled()
+    print(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "gil_enabled": gil,
+                "cores": cores,
+                "corpus": args.corpus,
+                "threads": results,
+            },
+            indent=2,
+        )
+    )
+    if not gil:
+        low = [n for n in args.threads if n <= cores and results[str(n)]["speedup"] / n < args.min_efficiency]
+        if low:
+            print(f"parallel efficiency under {args.min_efficiency} with threads: {low}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # !usr/bin/env python
 
 import asyncio
+import sys
 from pathlib import Path
 from urllib.parse import unquote
 
@@ -92,6 +93,21 @@ async def main():
             tasks = [progress.add_task(url, filename=url) for url in URLS]
             await asyncio.gather(*[download(client, url, progress, task_id) for url, task_id in zip(URLS, tasks)])
 
+    pack(console)
+
+
+def pack(console: Console):
+    """Regenerate the packed binary data file, and the generated tables module if it exists, from the downloaded text files"""
+    from emoji_data.packed import PACKED_DATA_FILE, TABLES_MODULE, write_packed_data, write_tables_module
+
+    output_path = OUTPUT_DIR / PACKED_DATA_FILE
+    write_packed_data(output_path)
+    console.print(f"[green]Packed {output_path}[/green]")
+    tables_path = OUTPUT_DIR.parent / f"{TABLES_MODULE}.py"
+    if "--tables" in sys.argv or tables_path.exists():
+        write_tables_module(tables_path)
+        console.print(f"[green]Generated {tables_path}[/green]")
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -3,13 +3,108 @@ A library represents emoji characters and sequences defined in `Unicode® Techni
 
 Starting with Version 11.0 of Unicode® Technical Standard #51(UNICODE EMOJI) specification, the repertoire of emoji characters is synchronized with the Unicode Standard, and has the same version numbering system.
 
+Note:
+    Public names of the submodules are imported lazily (:pep:`562`):
+    ``import emoji_data`` only reads the version, and a submodule is imported on the first access to one of its names.
+
 See also:
     https://www.unicode.org/reports/tr51/
 """
 
+from __future__ import annotations
+
+from importlib import import_module
+
 from ._version import __version__, __version_tuple__
-from .character import *
-from .definitions import *
-from .helpers import *
-from .sequence import *
-from .utils import *
+
+# Not importing `typing` at runtime, it costs more than the rest of the package's import.
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Dict, List
+
+    from .character import *
+    from .database import *
+    from .definitions import *
+    from .helpers import *
+    from .profiling import *
+    from .sequence import *
+    from .utils import *
+
+_LAZY_NAMES: Dict[str, List[str]] = {
+    "character": [
+        "EmojiCharProperty",
+        "EmojiCharacter",
+        "TEXT_PRESENTATION_SELECTOR",
+        "EMOJI_PRESENTATION_SELECTOR",
+        "EMOJI_KEYCAP",
+        "REGIONAL_INDICATORS",
+        "TAGS",
+        "ZWJ",
+    ],
+    "database": ["EmojiDatabase"],
+    "definitions": [
+        "get_emoji_patterns",
+        "initial_emoji_patterns",
+        "release_emoji_patterns",
+        "enable_cache",
+        "disable_cache",
+        "cache_info",
+        "cache_clear",
+        "QualifiedType",
+        "SequenceKind",
+        "classify_sequence",
+        "find_emoji_sequences",
+        "detect_qualified",
+        "is_extended_pictographic_character",
+        "is_emoji_component",
+        "is_default_emoji_presentation_character",
+        "is_default_text_presentation_character",
+        "is_emoji_character",
+        "is_emoji_core_sequence",
+        "is_emoji_flag_sequence",
+        "is_emoji_keycap_sequence",
+        "is_emoji_modifier",
+        "is_emoji_modifier_base",
+        "is_emoji_modifier_sequence",
+        "is_emoji_presentation_selector",
+        "is_emoji_presentation_sequence",
+        "is_emoji_sequence",
+        "is_emoji_tag_sequence",
+        "is_emoji_zwj_element",
+        "is_emoji_zwj_sequence",
+        "is_regional_indicator",
+        "is_tag_base",
+        "is_tag_spec",
+        "is_tag_term",
+        "is_text_presentation_selector",
+        "is_text_presentation_sequence",
+        "is_qualified_emoji_character",
+        "is_basic_emoji_character",
+        "is_rgi_emoji_sequence",
+        "are_rgi_emoji_sequences",
+        "is_emoji_combining_sequence",
+    ],
+    "helpers": ["load_emoji_data", "reload_emoji_data", "unload_emoji_data", "freeze_emoji_data"],
+    "profiling": ["PhaseStats", "RegistryStats", "LoadStats", "stats", "reset_stats"],
+    "sequence": ["EmojiSequence"],
+    "utils": ["emoji_data_lines", "code_points_to_string", "code_point_to_regex", "code_points_to_character_class"],
+}
+"""Public names of each submodule, the same as the submodule's ``__all__``"""
+
+_LAZY_MODULES = {name: module for module, names in _LAZY_NAMES.items() for name in names}
+
+__all__ = ["__version__", "__version_tuple__", *_LAZY_MODULES]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later access doesn't go through `__getattr__`
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_MODULES})
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic, Hashable, NamedTuple, Optional, TypeVar
+
+__all__ = ["CacheInfo", "LRUCache"]
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`LRUCache`"""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[KT, VT]):
+    """A bounded, thread-safe, least-recently-used cache with hit/miss/eviction statistics"""
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError(f"Argument `maxsize` expects to be a positive integer, but actual is {maxsize!r}")
+        self._maxsize = maxsize
+        self._data: OrderedDict[KT, VT] = OrderedDict()
+        self._lock = Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of cached values"""
+        return self._maxsize
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: KT) -> Optional[VT]:
+        """Return the cached value of the key, or ``None`` on a miss."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: KT, value: VT):
+        """Cache a value, and evict the least recently used one if the cache is full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """Remove all cached values and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return statistics of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._data))
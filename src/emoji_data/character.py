@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import re
+import sys
 from enum import Enum
-from typing import Iterable, Iterator, MutableSequence, Optional, Sequence, Tuple, Union, final
-
-from .container import BaseDictContainer
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Literal, Mapping, Optional, Sequence, Tuple, Union, final, overload
+
+from . import snapshot as _snapshot
+from .container import BaseDictContainer, _get_many
+from .packed import PackedData, read_packed_data
+from .profiling import CHARACTER_REGISTRY, PARSE, READ, phase
+from .sources import DataSource
 from .utils import code_point_to_regex, emoji_data_lines
 
 __all__ = [
@@ -84,8 +90,22 @@ class EmojiCharProperty(Enum):
     """
 
 
+PROPERTY_BITS: Mapping[EmojiCharProperty, int] = {p: 1 << i for i, p in enumerate(EmojiCharProperty)}
+"""Bit of each :class:`EmojiCharProperty` in packed property bitmasks, see :mod:`.vectorized` and :mod:`.shared`"""
+
+
+_PROPERTIES_TUPLES: Dict[Tuple[EmojiCharProperty, ...], Tuple[EmojiCharProperty, ...]] = {}
+"""Shared tuples of properties: there are only a few distinct combinations among thousands of characters"""
+
+
+def _shared_properties(properties: Tuple[EmojiCharProperty, ...]) -> Tuple[EmojiCharProperty, ...]:
+    return _PROPERTIES_TUPLES.setdefault(properties, properties)
+
+
 class MetaClass(BaseDictContainer[int, "EmojiCharacter"]):
-    pass
+    @property
+    def __data_dict__(cls) -> Mapping[int, EmojiCharacter]:
+        return _snapshot.current.characters
 
 
 @final
@@ -98,6 +118,8 @@ class EmojiCharacter(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeI
         http://www.unicode.org/reports/tr51/#Emoji_Characters
     """
 
+    __slots__ = ("_code_point", "_string", "_properties", "_version", "_description")
+
     def __init__(
         self,
         code_point: int,
@@ -107,23 +129,36 @@ class EmojiCharacter(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeI
     ):
         self._code_point = code_point
         self._string = chr(self._code_point)
-        self._regex = code_point_to_regex(code_point)
         #
-        self._properties: MutableSequence[EmojiCharProperty]
+        self._properties: Tuple[EmojiCharProperty, ...]
         if properties is None:
-            self._properties = []
+            self._properties = ()
         elif isinstance(properties, EmojiCharProperty):
-            self._properties = [properties]
+            self._properties = (properties,)
         elif isinstance(properties, Iterable):
-            if not all(isinstance(x, EmojiCharacter) for x in properties):
-                raise TypeError("not all elements of `properties` are `EmojiCharacter`")
-            self._properties = list(properties)
+            self._properties = tuple(properties)
+            if not all(isinstance(x, EmojiCharProperty) for x in self._properties):
+                raise TypeError("not all elements of `properties` are `EmojiCharProperty`")
         else:
             raise TypeError(f"{type(properties)}")
+        self._properties = _shared_properties(self._properties)
         #
-        self._version = version or ""
+        self._version = sys.intern(version or "")
         self._description = description or ""
 
+    @classmethod
+    def _from_record(
+        cls, code_point: int, properties: Tuple[EmojiCharProperty, ...], version: str, description: str
+    ) -> EmojiCharacter:
+        # Trusted data from the packed file skips the validation of `__init__`
+        inst = cls.__new__(cls)
+        inst._code_point = code_point
+        inst._string = chr(code_point)
+        inst._properties = _shared_properties(properties)
+        inst._version = sys.intern(version)
+        inst._description = description
+        return inst
+
     def __str__(self):
         return self._string
 
@@ -139,28 +174,64 @@ class EmojiCharacter(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeI
         """Initial the class
 
         Load emoji characters and their properties from the package data file into the class's internal dictionary.
+        Pre-parsed data is read instead if it's available, see :mod:`.packed`.
+        The dictionary is built aside, and published in a new snapshot when it's complete, see :mod:`.snapshot`.
         """
-        if cls.__data_dict__:
-            return
-        for content, comment in emoji_data_lines("emoji-data.txt"):
+        with _snapshot.lock:
+            if cls.__data_dict__:
+                return
+            with phase(READ):
+                packed = read_packed_data()
+            _snapshot.publish(_snapshot.current.replace(characters=cls._build(packed)))
+
+    @classmethod
+    def _parse_text(cls, source: DataSource = None) -> List[Tuple[int, int, EmojiCharProperty, str, str]]:
+        # Records of (first, last, property, version, description) in the order of the data file.
+        records = []
+        for content, comment in emoji_data_lines("emoji-data.txt", source):
             cps, property_text = (part.strip() for part in content.split(";", 1))
             cps_parts = cps.split("..", 1)
-            property_ = EmojiCharProperty(property_text)
             version, description = (s.strip() for s in cls._comment_split_regex.split(comment, maxsplit=1))
-            for cp in range(int(cps_parts[0], 16), 1 + int(cps_parts[-1], 16)):
-                try:
-                    inst = cls[cp]
-                except KeyError:
-                    cls[cp] = cls(cp, property_, version, description)
-                else:
-                    inst._add_property(property_)
-        for cp in (TEXT_PRESENTATION_SELECTOR, EMOJI_PRESENTATION_SELECTOR, EMOJI_KEYCAP):
-            if cp not in cls:
-                cls[cp] = cls(cp, [])
+            records.append(
+                (int(cps_parts[0], 16), int(cps_parts[-1], 16), EmojiCharProperty(property_text), version, description)
+            )
+        return records
+
+    @classmethod
+    def _build(cls, packed: Optional[PackedData], source: DataSource = None) -> Mapping[int, EmojiCharacter]:
+        # The internal dictionary of a snapshot, built from the packed data,
+        # or from the text data file of `source` if it's `None`. It doesn't publish anything.
+        d: Dict[int, EmojiCharacter] = {}
+        if packed is None:
+            with phase(PARSE):
+                records = cls._parse_text(source)
+            with phase(CHARACTER_REGISTRY):
+                for first, last, property_, version, description in records:
+                    for cp in range(first, 1 + last):
+                        try:
+                            inst = d[cp]
+                        except KeyError:
+                            d[cp] = cls(cp, property_, version, description)
+                        else:
+                            inst._add_property(property_)
+                for cp in (TEXT_PRESENTATION_SELECTOR, EMOJI_PRESENTATION_SELECTOR, EMOJI_KEYCAP):
+                    if cp not in d:
+                        d[cp] = cls(cp, [])
+        else:
+            with phase(CHARACTER_REGISTRY):
+                properties_of_bits: Dict[int, Tuple[EmojiCharProperty, ...]] = {}
+                for cp, bits, version, description in packed.characters():
+                    try:
+                        properties = properties_of_bits[bits]
+                    except KeyError:
+                        properties = properties_of_bits[bits] = tuple(p for p, b in PROPERTY_BITS.items() if bits & b)
+                    d[cp] = cls._from_record(cp, properties, version, description)
+        return MappingProxyType(d)
 
     @classmethod
     def release(cls):
-        cls.__data_dict__.clear()
+        with _snapshot.lock:
+            _snapshot.publish(_snapshot.current.replace(characters=_snapshot.EMPTY.characters))
 
     @classmethod
     def items(cls) -> Iterator[Tuple[int, EmojiCharacter]]:
@@ -169,7 +240,7 @@ class EmojiCharacter(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeI
         Yields:
             : A tuple containing a code point and its corresponding emoji character.
         """
-        return ((k, cls[k]) for k in cls)
+        return iter(cls.__data_dict__.items())
 
     @classmethod
     def keys(cls) -> Iterator[int]:
@@ -187,11 +258,11 @@ class EmojiCharacter(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeI
         Yields:
             : An emoji character instance.
         """
-        return (cls[k] for k in cls)
+        return iter(cls.__data_dict__.values())
 
     def _add_property(self, val: EmojiCharProperty):
         if val not in self._properties:
-            self._properties.append(val)
+            self._properties = _shared_properties(self._properties + (val,))
 
     @property
     def code_point(self) -> int:
@@ -209,8 +280,8 @@ class EmojiCharacter(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeI
 
     @property
     def properties(self) -> Sequence[EmojiCharProperty]:
-        """Property description text of the emoji-characters"""
-        return list(self._properties)
+        """Properties of the emoji-characters, in an immutable tuple shared with the instance"""
+        return self._properties
 
     @property
     def version(self) -> str:
@@ -229,7 +300,7 @@ class EmojiCharacter(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeI
     @property
     def regex(self) -> str:
         """Regular express for the emoji-characters"""
-        return self._regex
+        return code_point_to_regex(self._code_point)
 
     @property
     def hex(self) -> str:
@@ -279,3 +350,35 @@ class EmojiCharacter(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeI
         if isinstance(value, str):
             return cls[int(value, 16)]
         return cls[int(value)]
+
+    @overload
+    @classmethod
+    def from_hex_many(cls, values: Iterable[Union[int, str]], strict: Literal[True] = True) -> List[EmojiCharacter]: ...
+
+    @overload
+    @classmethod
+    def from_hex_many(cls, values: Iterable[Union[int, str]], strict: bool) -> List[Optional[EmojiCharacter]]: ...
+
+    @classmethod
+    def from_hex_many(cls, values, strict=True):
+        """Batch version of :meth:`from_hex`
+
+        The values are looked up all together, without a method call per value.
+        Integer values are the fast path, hex strings are converted one by one after missing the first lookup.
+
+        Args:
+            values: Code points, either integer values or hex strings.
+                It may be any iterable, e.g., a list, an :class:`array.array` or a NumPy integer array.
+            strict: Raise :class:`KeyError` for a value not found, or give ``None`` for it if ``False``.
+
+        Returns:
+            A list of :class:`EmojiCharacter` instances, each for the value at the same position.
+
+        Raises:
+            KeyError: If ``strict`` and a value is not found in the class's internal dictionary.
+        """
+        return _get_many(_snapshot.current.characters, values, strict, _code_point_of)
+
+
+def _code_point_of(value: Union[int, str]) -> int:
+    return int(value, 16) if isinstance(value, str) else int(value)
@@ -1,4 +1,6 @@
-from typing import Any, Dict, Generic, Iterator, MutableMapping, Tuple, Type, TypeVar
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Mapping, Optional, Sequence, TypeVar
+
+from . import snapshot as _snapshot
 
 __all__ = ["BaseDictContainer"]
 
@@ -7,17 +9,15 @@ VT = TypeVar("VT")
 
 
 class BaseDictContainer(type, Generic[KT, VT]):
-    __data_dict__: MutableMapping[KT, VT]
-
-    def __new__(cls, name: str, bases: Tuple[Type, ...], attrs: Dict[str, Any]):
-        cls.__data_dict__ = {}
-        return super().__new__(cls, name, bases, attrs)
+    """Metaclass of a registry class, which is a read-only mapping of its internal dictionary
 
-    def __setitem__(self, key: KT, value: VT):
-        self.__data_dict__[key] = value
+    The internal dictionary is a part of the current :class:`.Snapshot`, see :mod:`.snapshot`.
+    Each operation reads it once, so that it's consistent while another thread loads or releases emoji data.
+    """
 
-    def __delitem__(self, key: KT):
-        del self.__data_dict__[key]
+    @property
+    def __data_dict__(self) -> Mapping[KT, VT]:
+        raise NotImplementedError  # pragma: no cover
 
     def __getitem__(self, key: KT) -> VT:
         return self.__data_dict__[key]
@@ -26,7 +26,50 @@ class BaseDictContainer(type, Generic[KT, VT]):
         return key in self.__data_dict__
 
     def __iter__(self) -> Iterator[KT]:
-        yield from self.__data_dict__
+        return iter(self.__data_dict__)
 
     def __len__(self) -> int:
         return len(self.__data_dict__)
+
+    def freeze(self):
+        """Mark the loaded emoji data as frozen, see :func:`.freeze_emoji_data`.
+
+        The internal dictionary is always read-only, assignment or deletion raises :class:`TypeError`.
+        It lasts until the data is released or loaded again.
+        """
+        with _snapshot.lock:
+            if not _snapshot.current.frozen:
+                _snapshot.publish(_snapshot.current.replace(frozen=True))
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the loaded emoji data is frozen"""
+        return _snapshot.current.frozen
+
+
+def _get_many(
+    mapping: Mapping[KT, VT], keys: Iterable[Any], strict: bool, convert: Optional[Callable[[Any], Any]] = None
+) -> List[Optional[VT]]:
+    # Look all the keys up by one `map` over the bound `get`, without a Python level call per key.
+    # The keys not found are converted by `convert` (if any) and looked up again, one by one.
+    items = _as_list(keys)
+    values = list(map(mapping.get, items))
+    if None in values:
+        for i, value in enumerate(values):
+            if value is None:
+                key = items[i]
+                if convert is not None:
+                    value = values[i] = mapping.get(convert(key))
+                if value is None and strict:
+                    raise KeyError(key)
+    return values
+
+
+def _as_list(items: Iterable[Any]) -> Sequence[Any]:
+    # Arrays (`array.array`, NumPy) are converted to lists of Python scalars, which hash faster than NumPy ones
+    tolist = getattr(items, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    if isinstance(items, (list, tuple)):
+        return items
+    return list(items)
@@ -0,0 +1,234 @@
+"""Instances of emoji data, each owning its characters, sequences, patterns and matcher
+
+An :class:`EmojiDatabase` wraps a :class:`.Snapshot` of loaded emoji data.
+It's loaded from the package's data files, or other ones of a :data:`.DataSource`, or made of an existing snapshot,
+independently of the data loaded into :class:`.EmojiCharacter` and :class:`.EmojiSequence`.
+Databases are immutable, so they are shared by threads without locks,
+and a new database shares the immutable pieces of the one it's derived from, instead of loading them again.
+
+The class methods of :class:`.EmojiCharacter` and :class:`.EmojiSequence` and the functions of :mod:`.definitions`
+are a facade of the default database, see :meth:`EmojiDatabase.default`.
+
+Example:
+    ::
+
+        from emoji_data import EmojiDatabase
+
+        db = EmojiDatabase.load("/path/to/emoji/17.0")
+        db.find_all("Hi 👋🏽!")  # [(<EmojiSequence code_points='1F44B 1F3FD' ...>, 3, 5)]
+        db.sequences["👋🏽"].characters  # characters of the same database
+
+        flags = EmojiDatabase.load(type_fields=["RGI_Emoji_Flag_Sequence"], base=db)  # shares characters and patterns of `db`
+        db.publish()  # make it the default one
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Pattern, Sequence, Tuple, Union, final
+
+from . import metrics as _metrics
+from . import snapshot as _snapshot
+from .character import EmojiCharacter
+from .definitions import SequenceKind, _build_emoji_patterns, _classify_uncached, cache_clear
+from .packed import PackedData, read_packed_data
+from .profiling import READ, phase
+from .sequence import EmojiSequence, Offsets, _combined_pattern, _find, _find_ids, _scan_bytes
+from .sources import DataSource, data_source
+from .store import SequenceStore
+
+__all__ = ["EmojiDatabase"]
+
+_SEQUENCE_FIELDS = ("sequences", "store", "sequences_by_id", "rgi_keys", "trie", "trie_starts")
+"""Fields of a :class:`.Snapshot` built from the sequences"""
+
+
+@final
+class EmojiDatabase:
+    """Emoji characters, sequences, patterns and the matcher of :meth:`find`, of one load of emoji data
+
+    Args:
+        snapshot: The data of the database, e.g., :data:`.snapshot.current` at a moment or the snapshot of another database.
+            It's the default database if ``None``, see :meth:`default`.
+
+    Load a new one by :meth:`load`.
+    """
+
+    __slots__ = ("_snapshot",)
+
+    def __init__(self, snapshot: Optional[_snapshot.Snapshot] = None):
+        self._snapshot = snapshot
+
+    def __repr__(self):
+        snap = self.snapshot
+        name = "default" if self._snapshot is None else hex(id(snap))
+        return f"<{type(self).__name__} {name} characters={len(snap.characters)} sequences={len(snap.sequences)}>"
+
+    @classmethod
+    def load(
+        cls,
+        source: DataSource = None,
+        *,
+        sequences: bool = True,
+        type_fields: Optional[Iterable[str]] = None,
+        variations: bool = True,
+        patterns: Optional[Iterable[str]] = None,
+        base: Optional[EmojiDatabase] = None,
+    ) -> EmojiDatabase:
+        """Load a new database, without changing the default one.
+
+        Args:
+            source: Where to read the Unicode® emoji data files (see :data:`.SOURCE_DATA_FILES`) from,
+                the package's data directory if ``None``, or another directory, an archive, in-memory buffers, ... see :data:`.DataSource`.
+                Its packed binary data file is read instead if it's up to date, see :mod:`.packed`.
+            sequences: Whether to load the sequences.
+            type_fields: Only load the sequences of these ``type_field`` values, see :meth:`.EmojiSequence.initial`.
+            variations: Whether to load emoji variation sequences, see :meth:`.EmojiSequence.initial`.
+            patterns: Only compile the :mod:`.definitions` patterns of these names, see :func:`.initial_emoji_patterns`.
+            base: A database of the same data files, whose characters and patterns are shared instead of loaded again.
+                The sequences are always loaded by the filters.
+        """
+        snap = _snapshot.EMPTY if base is None else base.snapshot.replace(**_empty_fields(_SEQUENCE_FIELDS))
+        if sequences or not snap.characters or not snap.patterns:
+            if source is not None:
+                source = data_source(source)  # an archive is read only once
+            with phase(READ):
+                packed = read_packed_data(source=source)
+            snap = _build_snapshot(snap, packed, sequences, type_fields, variations, patterns, source)
+        return cls(snap)
+
+    @classmethod
+    def default(cls) -> EmojiDatabase:
+        """Return the default database, the one that :class:`.EmojiCharacter`, :class:`.EmojiSequence` and :mod:`.definitions` use
+
+        It always reads the current data, loaded by :func:`.load_emoji_data` and the ``initial`` methods.
+        """
+        return _DEFAULT
+
+    def publish(self):
+        """Make the data of the database the default one, by a single reference assignment, see :func:`.reload_emoji_data`."""
+        with _snapshot.lock:
+            _publish(self.snapshot)
+
+    @property
+    def snapshot(self) -> _snapshot.Snapshot:
+        """The snapshot of the data"""
+        snap = self._snapshot
+        return _snapshot.current if snap is None else snap
+
+    @property
+    def characters(self) -> Mapping[int, EmojiCharacter]:
+        """Read-only dictionary of the emoji characters, keyed by code point"""
+        return self.snapshot.characters
+
+    @property
+    def sequences(self) -> Mapping[str, EmojiSequence]:
+        """Read-only dictionary of the emoji sequences, keyed by string"""
+        return self.snapshot.sequences
+
+    @property
+    def patterns(self) -> Mapping[str, Pattern[str]]:
+        """Read-only dictionary of the compiled patterns of :mod:`.definitions`, keyed by name"""
+        return self.snapshot.patterns
+
+    @property
+    def pattern(self) -> Pattern[str]:
+        """Compiled regular expression of all the sequences, see :attr:`.EmojiSequence.pattern`"""
+        return _combined_pattern(self.snapshot)
+
+    @property
+    def store(self) -> SequenceStore:
+        """Columnar storage of the sequences, see :meth:`.EmojiSequence.store`"""
+        return self.snapshot.store
+
+    @property
+    def rgi_keys(self) -> FrozenSet[str]:
+        """Strings of the RGI emoji sequences, see :meth:`.EmojiSequence.rgi_keys`"""
+        return self.snapshot.rgi_keys
+
+    def is_rgi(self, s: str) -> bool:
+        """Test if a string is an RGI emoji sequence of the database"""
+        return s in self.snapshot.rgi_keys
+
+    def from_id(self, value: int) -> EmojiSequence:
+        """Get an emoji sequence by its ID, see :meth:`.EmojiSequence.from_id`
+
+        Raises:
+            KeyError: If there is no emoji sequence of the ID, or it's not loaded.
+        """
+        by_id: Sequence[Optional[EmojiSequence]] = self.snapshot.sequences_by_id
+        seq = by_id[value] if 0 <= value < len(by_id) else None
+        if seq is None:
+            raise KeyError(value)
+        return seq
+
+    @_metrics.observed
+    def find(self, s: str, *, offsets: Offsets = "code_point") -> Iterator[Tuple[EmojiSequence, int, int]]:
+        """Iterate over the emoji sequences of the database in a string, see :meth:`.EmojiSequence.find`"""
+        yield from _find(self.snapshot, s, offsets)
+
+    @_metrics.observed
+    def find_all(self, s: str, *, offsets: Offsets = "code_point") -> Sequence[Tuple[EmojiSequence, int, int]]:
+        """Find all emoji sequences of the database in a string, see :meth:`.EmojiSequence.find_all`"""
+        return list(_find(self.snapshot, s, offsets))
+
+    @_metrics.observed
+    def find_spans(self, s: str, *, offsets: Offsets = "code_point") -> List[Tuple[int, int]]:
+        """Find the positions of all emoji sequences of the database in a string, see :meth:`.EmojiSequence.find_spans`"""
+        return [(start, end) for _, start, end in _find(self.snapshot, s, offsets)]
+
+    @_metrics.observed
+    def find_bytes(self, data: Union[bytes, bytearray, memoryview]) -> Iterator[Tuple[EmojiSequence, int, int]]:
+        """Iterate over the emoji sequences of the database in UTF-8 encoded text, see :meth:`.EmojiSequence.find_bytes`"""
+        yield from _scan_bytes(self.snapshot, data)
+
+    @_metrics.observed(matches=lambda out: len(out) // 3)
+    def find_ids(self, s: str, out: Optional[array] = None) -> array:
+        """Find all emoji sequences of the database in a string into an array of ``(id, start, end)``, see :meth:`.EmojiSequence.find_ids`"""
+        return _find_ids(self.snapshot, s, out)
+
+    def classify_sequence(self, s: str) -> SequenceKind:
+        """Classify a string by the emoji characters of the database, see :func:`.classify_sequence`
+
+        It's not cached, the caches of :func:`.enable_cache` are of the default database.
+        """
+        return SequenceKind(_classify_uncached(s, self.snapshot.character_classes))
+
+
+_DEFAULT = EmojiDatabase()
+
+
+def _empty_fields(names: Iterable[str]) -> Dict[str, Any]:
+    return {name: getattr(_snapshot.EMPTY, name) for name in names}
+
+
+def _build_snapshot(
+    base: _snapshot.Snapshot,
+    packed: Optional[PackedData],
+    sequences: bool = True,
+    type_fields: Optional[Iterable[str]] = None,
+    variations: bool = True,
+    patterns: Optional[Iterable[str]] = None,
+    source: DataSource = None,
+) -> _snapshot.Snapshot:
+    # A copy of the base snapshot with the data it lacks,
+    # built from the packed data, or the text data files in `source` if it's `None`. It doesn't publish anything.
+    changes: Dict[str, Any] = {}
+    characters = base.characters
+    if not characters:
+        characters = changes["characters"] = EmojiCharacter._build(packed, source)
+    if not base.patterns:
+        changes.update(_build_emoji_patterns(characters, patterns))
+    if sequences and not base.sequences:
+        changes.update(EmojiSequence._build(EmojiSequence._records(packed, source), characters, type_fields, variations))
+    return base.replace(**changes)
+
+
+def _publish(snapshot: _snapshot.Snapshot):
+    # Publish a snapshot, and drop everything derived from the former one. The caller holds the lock.
+    _snapshot.publish(snapshot)
+    cache_clear()
+    vectorized = sys.modules.get(f"{__package__}.vectorized")
+    if vectorized is not None:
+        vectorized.release_property_table()
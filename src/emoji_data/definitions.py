@@ -9,9 +9,13 @@ See also:
 """
 
 import re
-from enum import Enum
-from typing import Mapping, Pattern
+from enum import Enum, Flag, auto
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Pattern, Tuple
 
+from . import metrics as _metrics
+from . import snapshot as _snapshot
+from .cache import CacheInfo, LRUCache
 from .character import (
     EMOJI_KEYCAP,
     EMOJI_PRESENTATION_SELECTOR,
@@ -22,13 +26,22 @@ from .character import (
     EmojiCharacter,
     EmojiCharProperty,
 )
-from .utils import code_point_to_regex
+from .profiling import DEFINITIONS_PATTERNS, phase
+from .sequence import EmojiSequence
+from .utils import code_point_to_regex, code_points_to_character_class
 
 __all__ = [
     "get_emoji_patterns",
     "initial_emoji_patterns",
     "release_emoji_patterns",
+    "enable_cache",
+    "disable_cache",
+    "cache_info",
+    "cache_clear",
     "QualifiedType",
+    "SequenceKind",
+    "classify_sequence",
+    "find_emoji_sequences",
     "detect_qualified",
     "is_extended_pictographic_character",
     "is_emoji_component",
@@ -56,6 +69,7 @@ __all__ = [
     "is_qualified_emoji_character",
     "is_basic_emoji_character",
     "is_rgi_emoji_sequence",
+    "are_rgi_emoji_sequences",
     "is_emoji_combining_sequence",
 ]
 
@@ -81,48 +95,249 @@ class QualifiedType(Enum):
     UNQUALIFIED = "UQE"
 
 
-_EMOJI_PATTERNS: Mapping[str, Pattern[str]] = {}
+class SequenceKind(Flag):
+    """Kinds of emoji characters and sequences defined in the module
 
+    Each member corresponds to a pattern of the same name in :func:`get_emoji_patterns` (except :attr:`BASIC_EMOJI`),
+    and a string may be of several kinds at the same time. It's returned by :func:`classify_sequence`.
 
-def initial_emoji_patterns():
+    See also:
+        http://www.unicode.org/reports/tr51/#Definitions
+    """
+
+    EMOJI_CHARACTER = auto()
+    """see :func:`is_emoji_character`"""
+    BASIC_EMOJI = auto()
+    """see :func:`is_basic_emoji_character`"""
+    TEXT_PRESENTATION_SEQUENCE = auto()
+    """see :func:`is_text_presentation_sequence`"""
+    EMOJI_PRESENTATION_SEQUENCE = auto()
+    """see :func:`is_emoji_presentation_sequence`"""
+    EMOJI_MODIFIER_SEQUENCE = auto()
+    """see :func:`is_emoji_modifier_sequence`"""
+    EMOJI_FLAG_SEQUENCE = auto()
+    """see :func:`is_emoji_flag_sequence`"""
+    TAG_BASE = auto()
+    """see :func:`is_tag_base`"""
+    EMOJI_TAG_SEQUENCE = auto()
+    """see :func:`is_emoji_tag_sequence`"""
+    EMOJI_KEYCAP_SEQUENCE = auto()
+    """see :func:`is_emoji_keycap_sequence`"""
+    EMOJI_CORE_SEQUENCE = auto()
+    """see :func:`is_emoji_core_sequence`"""
+    EMOJI_ZWJ_ELEMENT = auto()
+    """see :func:`is_emoji_zwj_element`"""
+    EMOJI_ZWJ_SEQUENCE = auto()
+    """see :func:`is_emoji_zwj_sequence`"""
+    EMOJI_SEQUENCE = auto()
+    """see :func:`is_emoji_sequence`"""
+
+
+# Plain integer values of SequenceKind, bitwise operations on them are much cheaper than on Flag members
+_K_EMOJI_CHARACTER = SequenceKind.EMOJI_CHARACTER.value
+_K_BASIC_EMOJI = SequenceKind.BASIC_EMOJI.value
+_K_TEXT_PRESENTATION_SEQUENCE = SequenceKind.TEXT_PRESENTATION_SEQUENCE.value
+_K_EMOJI_PRESENTATION_SEQUENCE = SequenceKind.EMOJI_PRESENTATION_SEQUENCE.value
+_K_EMOJI_MODIFIER_SEQUENCE = SequenceKind.EMOJI_MODIFIER_SEQUENCE.value
+_K_EMOJI_FLAG_SEQUENCE = SequenceKind.EMOJI_FLAG_SEQUENCE.value
+_K_TAG_BASE = SequenceKind.TAG_BASE.value
+_K_EMOJI_TAG_SEQUENCE = SequenceKind.EMOJI_TAG_SEQUENCE.value
+_K_EMOJI_KEYCAP_SEQUENCE = SequenceKind.EMOJI_KEYCAP_SEQUENCE.value
+_K_EMOJI_CORE_SEQUENCE = SequenceKind.EMOJI_CORE_SEQUENCE.value
+_K_EMOJI_ZWJ_ELEMENT = SequenceKind.EMOJI_ZWJ_ELEMENT.value
+_K_EMOJI_ZWJ_SEQUENCE = SequenceKind.EMOJI_ZWJ_SEQUENCE.value
+_K_EMOJI_SEQUENCE = SequenceKind.EMOJI_SEQUENCE.value
+
+# Kinds implied by each kind of ZWJ element
+_K_CORE = _K_EMOJI_CORE_SEQUENCE | _K_EMOJI_ZWJ_ELEMENT | _K_EMOJI_SEQUENCE
+_K_TAG = _K_EMOJI_TAG_SEQUENCE | _K_EMOJI_ZWJ_ELEMENT | _K_EMOJI_SEQUENCE
+
+# Property bits of characters
+_B_EMOJI = 1
+_B_EMOJI_COMPONENT = 2
+_B_EMOJI_MODIFIER = 4
+_B_EMOJI_MODIFIER_BASE = 8
+_B_EMOJI_PRESENTATION = 16
+
+_CHAR_ZWJ = chr(ZWJ)
+_CHAR_TEXT_PRESENTATION_SELECTOR = chr(TEXT_PRESENTATION_SELECTOR)
+_CHAR_EMOJI_PRESENTATION_SELECTOR = chr(EMOJI_PRESENTATION_SELECTOR)
+_CHAR_EMOJI_KEYCAP = chr(EMOJI_KEYCAP)
+_CHAR_TAG_TERM = chr(TAGS[-1])
+_KEYCAP_BASES = frozenset("0123456789#*")
+
+# Grammar of emoji sequences as a state machine over classes of code points, used by `classify_sequence` and `find_emoji_sequences`.
+#
+# Classes of code points, each code point is of one class:
+_C_OTHER = 0
+_C_EMOJI = 1  # emoji character, which isn't a component nor of any other class
+_C_COMPONENT = 2  # emoji character and component, which isn't of any other class (e.g., hair components)
+_C_MODIFIER_BASE = 3
+_C_MODIFIER = 4
+_C_REGIONAL_INDICATOR = 5
+_C_KEYCAP_BASE = 6
+_C_EMOJI_PRESENTATION_SELECTOR = 7
+_C_TEXT_PRESENTATION_SELECTOR = 8
+_C_KEYCAP = 9
+_C_ZWJ = 10
+_C_TAG_SPEC = 11
+_C_TAG_TERM = 12
+_N_CLASSES = 13
+
+# States of one ZWJ element (or a text presentation sequence), after the code points of:
+_S_START = 0  # nothing
+_S_EMOJI = 1  # _C_EMOJI
+_S_MODIFIER_BASE = 2  # _C_MODIFIER_BASE
+_S_COMPONENT = 3  # _C_COMPONENT or _C_MODIFIER
+_S_REGIONAL_INDICATOR = 4  # _C_REGIONAL_INDICATOR
+_S_KEYCAP_BASE = 5  # _C_KEYCAP_BASE
+_S_PRESENTATION = 6  # emoji_presentation_sequence
+_S_KEYCAP_PRESENTATION = 7  # keycap base and emoji presentation selector
+_S_KEYCAP = 8  # emoji_keycap_sequence
+_S_TEXT = 9  # text_presentation_sequence
+_S_MODIFIER_SEQUENCE = 10  # emoji_modifier_sequence
+_S_FLAG = 11  # emoji_flag_sequence
+_S_TAG_SPEC = 12  # tag_base tag_spec+
+_S_TAG = 13  # emoji_tag_sequence
+_N_ELEMENT_STATES = 14
+# Inside a ZWJ sequence, each element state is offset by _N_ELEMENT_STATES, where _S_ZWJ is the start of the element after a ZWJ.
+_S_ZWJ = _N_ELEMENT_STATES + _S_START
+
+_ELEMENT_TRANSITIONS: Dict[int, Dict[int, int]] = {
+    _S_START: {
+        _C_EMOJI: _S_EMOJI,
+        _C_COMPONENT: _S_COMPONENT,
+        _C_MODIFIER_BASE: _S_MODIFIER_BASE,
+        _C_MODIFIER: _S_COMPONENT,
+        _C_REGIONAL_INDICATOR: _S_REGIONAL_INDICATOR,
+        _C_KEYCAP_BASE: _S_KEYCAP_BASE,
+    },
+    _S_EMOJI: {
+        _C_EMOJI_PRESENTATION_SELECTOR: _S_PRESENTATION,
+        _C_TEXT_PRESENTATION_SELECTOR: _S_TEXT,
+        _C_TAG_SPEC: _S_TAG_SPEC,
+    },
+    _S_MODIFIER_BASE: {
+        _C_MODIFIER: _S_MODIFIER_SEQUENCE,
+        _C_EMOJI_PRESENTATION_SELECTOR: _S_PRESENTATION,
+        _C_TEXT_PRESENTATION_SELECTOR: _S_TEXT,
+        _C_TAG_SPEC: _S_TAG_SPEC,
+    },
+    _S_COMPONENT: {
+        _C_EMOJI_PRESENTATION_SELECTOR: _S_PRESENTATION,
+        _C_TEXT_PRESENTATION_SELECTOR: _S_TEXT,
+        _C_TAG_SPEC: _S_TAG_SPEC,
+    },
+    _S_REGIONAL_INDICATOR: {
+        _C_REGIONAL_INDICATOR: _S_FLAG,
+        _C_EMOJI_PRESENTATION_SELECTOR: _S_PRESENTATION,
+        _C_TEXT_PRESENTATION_SELECTOR: _S_TEXT,
+        _C_TAG_SPEC: _S_TAG_SPEC,
+    },
+    _S_KEYCAP_BASE: {
+        _C_EMOJI_PRESENTATION_SELECTOR: _S_KEYCAP_PRESENTATION,
+        _C_TEXT_PRESENTATION_SELECTOR: _S_TEXT,
+        _C_TAG_SPEC: _S_TAG_SPEC,
+    },
+    _S_PRESENTATION: {_C_TAG_SPEC: _S_TAG_SPEC},
+    _S_KEYCAP_PRESENTATION: {_C_KEYCAP: _S_KEYCAP, _C_TAG_SPEC: _S_TAG_SPEC},
+    _S_MODIFIER_SEQUENCE: {_C_TAG_SPEC: _S_TAG_SPEC},
+    _S_TAG_SPEC: {_C_TAG_SPEC: _S_TAG_SPEC, _C_TAG_TERM: _S_TAG},
+}
+"""Transitions of element states by class, ZWJ transitions are added to the ones of ZWJ elements"""
+
+_ELEMENT_KINDS: Dict[int, int] = {
+    _S_EMOJI: _K_EMOJI_CHARACTER | _K_BASIC_EMOJI | _K_TAG_BASE | _K_CORE,
+    _S_MODIFIER_BASE: _K_EMOJI_CHARACTER | _K_BASIC_EMOJI | _K_TAG_BASE | _K_CORE,
+    _S_COMPONENT: _K_EMOJI_CHARACTER | _K_TAG_BASE | _K_CORE,
+    _S_REGIONAL_INDICATOR: _K_EMOJI_CHARACTER | _K_TAG_BASE | _K_CORE,
+    _S_KEYCAP_BASE: _K_EMOJI_CHARACTER | _K_TAG_BASE | _K_CORE,
+    _S_PRESENTATION: _K_EMOJI_PRESENTATION_SEQUENCE | _K_TAG_BASE | _K_CORE,
+    _S_KEYCAP_PRESENTATION: _K_EMOJI_PRESENTATION_SEQUENCE | _K_TAG_BASE | _K_CORE,
+    _S_KEYCAP: _K_EMOJI_KEYCAP_SEQUENCE | _K_CORE,
+    _S_TEXT: _K_TEXT_PRESENTATION_SEQUENCE,
+    _S_MODIFIER_SEQUENCE: _K_EMOJI_MODIFIER_SEQUENCE | _K_TAG_BASE | _K_CORE,
+    _S_FLAG: _K_EMOJI_FLAG_SEQUENCE | _K_CORE,
+    _S_TAG: _K_TAG,
+}
+"""Kinds of the string ending in each element state, other states are not accepting"""
+
+
+def _build_state_machine() -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[int, ...]]:
+    # Transition table `[state][class]` of the next state or -1, and kinds of the string ending in each state.
+    table = [[-1] * _N_CLASSES for _ in range(2 * _N_ELEMENT_STATES)]
+    kinds = [0] * (2 * _N_ELEMENT_STATES)
+    for offset in (0, _N_ELEMENT_STATES):
+        for state, transitions in _ELEMENT_TRANSITIONS.items():
+            for cls, target in transitions.items():
+                table[offset + state][cls] = offset + target
+        for state, element_kinds in _ELEMENT_KINDS.items():
+            if element_kinds & _K_EMOJI_ZWJ_ELEMENT:
+                table[offset + state][_C_ZWJ] = _S_ZWJ
+            if offset:
+                kinds[offset + state] = _K_EMOJI_ZWJ_SEQUENCE | _K_EMOJI_SEQUENCE if element_kinds & _K_EMOJI_ZWJ_ELEMENT else 0
+            else:
+                kinds[state] = element_kinds
+    return tuple(map(tuple, table)), tuple(kinds)
+
+
+_TRANSITIONS, _STATE_KINDS = _build_state_machine()
+
+_CLASSIFY_CACHE: Optional[LRUCache[str, int]] = None
+_QUALIFIED_CACHE: Optional[LRUCache[str, "QualifiedType"]] = None
+
+
+def initial_emoji_patterns(names: Optional[Iterable[str]] = None):
     """Initial the emoji patterns dictionary
 
     **MUST** be called first before using any of the functions in the module.
+
+    Args:
+        names: Only compile the patterns of these names, e.g., ``["EMOJI_CHARACTER", "EMOJI_MODIFIER"]``.
+            All of them are compiled if it's ``None``.
+            Functions using a pattern which is not compiled raise :class:`KeyError`,
+            and the ones based on :func:`classify_sequence` work without any pattern.
+
+    Raises:
+        ValueError: If there is an unknown name.
     """
-    global _EMOJI_PATTERNS
-    if _EMOJI_PATTERNS:
-        return
+    with _snapshot.lock:
+        if not _snapshot.current.patterns:
+            _snapshot.publish(_snapshot.current.replace(**_build_emoji_patterns(_snapshot.current.characters, names)))
+            cache_clear()
+
 
+def _build_emoji_patterns(characters: Mapping[int, EmojiCharacter], names: Optional[Iterable[str]]) -> Dict[str, Any]:
+    # Fields of a snapshot: the patterns and tables of the state machine, built from the characters.
+    # It doesn't publish anything.
     d = {}
 
     d["EMOJI_CHARACTER"] = (
-        r"[" + "".join(m.regex for m in EmojiCharacter.values() if EmojiCharProperty.EMOJI in m.properties) + r"]"
+        r"[" + "".join(m.regex for m in characters.values() if EmojiCharProperty.EMOJI in m.properties) + r"]"
     )
 
     d["EXTENDED_PICTOGRAPHIC_CHARACTER"] = (
-        r"[" + "".join(m.regex for m in EmojiCharacter.values() if EmojiCharProperty.EXTPICT in m.properties) + r"]"
+        r"[" + "".join(m.regex for m in characters.values() if EmojiCharProperty.EXTPICT in m.properties) + r"]"
     )
 
     d["EMOJI_COMPONENT"] = (
-        r"[" + "".join(m.regex for m in EmojiCharacter.values() if EmojiCharProperty.ECOMP in m.properties) + r"]"
+        r"[" + "".join(m.regex for m in characters.values() if EmojiCharProperty.ECOMP in m.properties) + r"]"
     )
 
     d["DEFAULT_EMOJI_PRESENTATION_CHARACTER"] = (
-        r"[" + "".join(m.regex for m in EmojiCharacter.values() if EmojiCharProperty.EPRES in m.properties) + r"]"
+        r"[" + "".join(m.regex for m in characters.values() if EmojiCharProperty.EPRES in m.properties) + r"]"
     )
 
     d["DEFAULT_TEXT_PRESENTATION_CHARACTER"] = (
-        r"[" + "".join(m.regex for m in EmojiCharacter.values() if EmojiCharProperty.EPRES not in m.properties) + r"]"
+        r"[" + "".join(m.regex for m in characters.values() if EmojiCharProperty.EPRES not in m.properties) + r"]"
     )
     d["TEXT_PRESENTATION_SELECTOR"] = code_point_to_regex(TEXT_PRESENTATION_SELECTOR)
     d["TEXT_PRESENTATION_SEQUENCE"] = r"({EMOJI_CHARACTER}{TEXT_PRESENTATION_SELECTOR})".format(**d)
     d["EMOJI_PRESENTATION_SELECTOR"] = code_point_to_regex(EMOJI_PRESENTATION_SELECTOR)
     d["EMOJI_PRESENTATION_SEQUENCE"] = r"({EMOJI_CHARACTER}{EMOJI_PRESENTATION_SELECTOR})".format(**d)
-    d["EMOJI_MODIFIER"] = (
-        r"[" + "".join(m.regex for m in EmojiCharacter.values() if EmojiCharProperty.EMOD in m.properties) + r"]"
-    )
+    d["EMOJI_MODIFIER"] = r"[" + "".join(m.regex for m in characters.values() if EmojiCharProperty.EMOD in m.properties) + r"]"
     d["EMOJI_MODIFIER_BASE"] = (
-        r"[" + "".join(m.regex for m in EmojiCharacter.values() if EmojiCharProperty.EBASE in m.properties) + r"]"
+        r"[" + "".join(m.regex for m in characters.values() if EmojiCharProperty.EBASE in m.properties) + r"]"
     )
     d["EMOJI_MODIFIER_SEQUENCE"] = r"({EMOJI_MODIFIER_BASE}{EMOJI_MODIFIER})".format(**d)
     d["REGIONAL_INDICATOR"] = (
@@ -132,7 +347,7 @@ def initial_emoji_patterns():
     d["TAG_BASE"] = r"({EMOJI_CHARACTER}|{EMOJI_MODIFIER_SEQUENCE}|{EMOJI_PRESENTATION_SEQUENCE})".format(**d)
     d["TAG_SPEC"] = r"[" + code_point_to_regex(TAGS[0]) + r"-" + code_point_to_regex(TAGS[-2]) + r"]"
     d["TAG_TERM"] = code_point_to_regex(TAGS[-1])
-    d["EMOJI_TAG_SEQUENCE"] = r"({TAG_BASE}{TAG_SPEC}{TAG_TERM})".format(**d)
+    d["EMOJI_TAG_SEQUENCE"] = r"({TAG_BASE}{TAG_SPEC}+{TAG_TERM})".format(**d)
     d["EMOJI_KEYCAP_SEQUENCE"] = r"([0-9#*]{}{})".format(
         *(code_point_to_regex(x) for x in (EMOJI_PRESENTATION_SELECTOR, EMOJI_KEYCAP))
     )
@@ -149,19 +364,235 @@ def initial_emoji_patterns():
     d["EMOJI_ZWJ_SEQUENCE"] = r"({EMOJI_ZWJ_ELEMENT}({0}{EMOJI_ZWJ_ELEMENT})+)".format(code_point_to_regex(ZWJ), **d)
     d["EMOJI_SEQUENCE"] = r"({EMOJI_CORE_SEQUENCE}|{EMOJI_ZWJ_SEQUENCE}|{EMOJI_TAG_SEQUENCE})".format(**d)
 
-    _EMOJI_PATTERNS = {k: re.compile(v) for k, v in d.items()}
+    if names is None:
+        names = list(d)
+    else:
+        names = list(names)
+        unknown = set(names) - d.keys()
+        if unknown:
+            raise ValueError(f"Unknown emoji pattern names: {sorted(unknown)}")
+    with phase(DEFINITIONS_PATTERNS):
+        patterns = {k: re.compile(d[k]) for k in names}
+
+    bits: Dict[str, int] = {}
+    for m in characters.values():
+        props = m.properties
+        b = (
+            (_B_EMOJI if EmojiCharProperty.EMOJI in props else 0)
+            | (_B_EMOJI_COMPONENT if EmojiCharProperty.ECOMP in props else 0)
+            | (_B_EMOJI_MODIFIER if EmojiCharProperty.EMOD in props else 0)
+            | (_B_EMOJI_MODIFIER_BASE if EmojiCharProperty.EBASE in props else 0)
+            | (_B_EMOJI_PRESENTATION if EmojiCharProperty.EPRES in props else 0)
+        )
+        if b:
+            bits[m.string] = b
+
+    classes: Dict[str, int] = {}
+    for c, b in bits.items():
+        if c in _KEYCAP_BASES:
+            classes[c] = _C_KEYCAP_BASE
+        elif REGIONAL_INDICATORS[0] <= ord(c) <= REGIONAL_INDICATORS[-1]:
+            classes[c] = _C_REGIONAL_INDICATOR
+        elif b & _B_EMOJI_MODIFIER:
+            classes[c] = _C_MODIFIER
+        elif b & _B_EMOJI_MODIFIER_BASE:
+            classes[c] = _C_MODIFIER_BASE
+        elif b & _B_EMOJI:
+            classes[c] = _C_COMPONENT if b & _B_EMOJI_COMPONENT else _C_EMOJI
+    sequence_starts = re.compile(code_points_to_character_class(map(ord, classes))) if classes else _snapshot.NEVER
+    classes[_CHAR_EMOJI_PRESENTATION_SELECTOR] = _C_EMOJI_PRESENTATION_SELECTOR
+    classes[_CHAR_TEXT_PRESENTATION_SELECTOR] = _C_TEXT_PRESENTATION_SELECTOR
+    classes[_CHAR_EMOJI_KEYCAP] = _C_KEYCAP
+    classes[_CHAR_ZWJ] = _C_ZWJ
+    for cp in TAGS[:-1]:
+        classes[chr(cp)] = _C_TAG_SPEC
+    classes[_CHAR_TAG_TERM] = _C_TAG_TERM
+
+    return {
+        "patterns": MappingProxyType(patterns),
+        "character_bits": MappingProxyType(bits),
+        "character_classes": MappingProxyType(classes),
+        "sequence_starts": sequence_starts,
+    }
 
 
 def release_emoji_patterns():
-    """Release emoji patterns dictionary"""
-    global _EMOJI_PATTERNS
-    _EMOJI_PATTERNS = {}
+    """Release emoji patterns dictionary
+
+    Results cached by :func:`enable_cache` are cleared too.
+    """
+    empty = _snapshot.EMPTY
+    with _snapshot.lock:
+        _snapshot.publish(
+            _snapshot.current.replace(
+                patterns=empty.patterns,
+                character_bits=empty.character_bits,
+                character_classes=empty.character_classes,
+                sequence_starts=empty.sequence_starts,
+            )
+        )
+    cache_clear()
+
+
+def enable_cache(maxsize: int = 4096):
+    """Enable bounded LRU caches in front of :func:`classify_sequence` (hence all sequence predicates built on it) and :func:`detect_qualified`
+
+    Real world text usually reuses a small working set of emoji strings,
+    caching saves re-scanning them on each call.
+    The caches are thread-safe, and disabled by default.
+
+    Calling it again replaces the caches with new empty ones of the new size.
+
+    Args:
+        maxsize: Maximum number of strings to cache for each function.
+    """
+    global _CLASSIFY_CACHE, _QUALIFIED_CACHE
+    _CLASSIFY_CACHE, _QUALIFIED_CACHE = LRUCache(maxsize), LRUCache(maxsize)
+
+
+def disable_cache():
+    """Disable and drop the caches enabled by :func:`enable_cache`"""
+    global _CLASSIFY_CACHE, _QUALIFIED_CACHE
+    _CLASSIFY_CACHE = _QUALIFIED_CACHE = None
+
+
+def cache_info() -> Mapping[str, CacheInfo]:
+    """Return statistics of the caches enabled by :func:`enable_cache`
+
+    Returns:
+        A dictionary whose keys are ``"classify_sequence"`` and ``"detect_qualified"``, and values are :class:`.CacheInfo` named tuples with ``hits``, ``misses``, ``evictions``, ``maxsize`` and ``currsize`` fields.
+        It's empty if the caches are not enabled.
+    """
+    if _CLASSIFY_CACHE is None or _QUALIFIED_CACHE is None:
+        return {}
+    return {"classify_sequence": _CLASSIFY_CACHE.info(), "detect_qualified": _QUALIFIED_CACHE.info()}
+
+
+def cache_clear():
+    """Clear results and statistics of the caches enabled by :func:`enable_cache`
+
+    It's called whenever emoji data is loaded, reloaded or released, so that the caches never keep stale results.
+    """
+    # The caches are replaced by new empty ones rather than emptied in place.
+    # A cached function takes its cache before reading the snapshot, and the new snapshot is published before this,
+    # so a call still running on the old snapshot can only store its result in the old, dropped cache.
+    global _CLASSIFY_CACHE, _QUALIFIED_CACHE
+    classify_cache, qualified_cache = _CLASSIFY_CACHE, _QUALIFIED_CACHE
+    if classify_cache is not None:
+        _CLASSIFY_CACHE = LRUCache(classify_cache.maxsize)
+    if qualified_cache is not None:
+        _QUALIFIED_CACHE = LRUCache(qualified_cache.maxsize)
+
+
+def get_emoji_patterns() -> Dict[str, Pattern[str]]:
+    """Return a new dictionary of the compiled patterns, keyed by name
+
+    Changing it doesn't change the patterns used by the functions of the module.
+    """
+    return dict(_snapshot.current.patterns)
+
+
+def _classify(s: str) -> int:
+    # Kinds of a string, as plain integer bits of SequenceKind
+    cache = _CLASSIFY_CACHE
+    if cache is None:
+        return _classify_uncached(s)
+    kinds = cache.get(s)
+    if kinds is None:
+        kinds = _classify_uncached(s)
+        cache.put(s, kinds)
+    return kinds
 
 
-def get_emoji_patterns() -> Mapping[str, Pattern[str]]:
-    return _EMOJI_PATTERNS
+def _classify_uncached(s: str, classes: Optional[Mapping[str, int]] = None) -> int:
+    if classes is None:
+        classes = _snapshot.current.character_classes
+    table = _TRANSITIONS
+    state = _S_START
+    for c in s:
+        state = table[state][classes.get(c, _C_OTHER)]
+        if state < 0:
+            return 0
+    return _STATE_KINDS[state]
 
 
+def classify_sequence(s: str) -> SequenceKind:
+    """Classify a string by all kinds of emoji characters and sequences it satisfies, in one pass.
+
+    It's equivalent to testing the string with each ``is_*`` function of the corresponding :class:`SequenceKind` member,
+    but scans the string only once, instead of full-matching it against each big regular expression:
+    it runs a state machine of the grammar of emoji sequences over classes of code points,
+    the same as :func:`find_emoji_sequences` does.
+
+    Args:
+        s: The string to classify
+
+    Returns:
+        Combination of all satisfied kinds, or ``SequenceKind(0)`` if the string satisfies none of them.
+
+    Example:
+        ::
+
+            >>> SequenceKind.EMOJI_MODIFIER_SEQUENCE in classify_sequence("👍🏿")
+            True
+    """
+    return SequenceKind(_classify(s))
+
+
+@_metrics.observed
+def find_emoji_sequences(s: str, text_default: bool = False) -> Iterator[Tuple[str, int, int]]:
+    """Find all well-formed emoji sequences in a string, including the ones not listed in the data files.
+
+    Unlike :meth:`.EmojiSequence.find`, which only finds the loaded sequences,
+    it scans the string by the grammar of :func:`is_emoji_sequence`, so that it also finds
+    non-RGI but well-formed sequences, e.g., a ZWJ sequence of any emoji or a flag of any two regional indicators.
+
+    Args:
+        s: The string to search for emoji sequences.
+        text_default: Whether to find single emoji characters of default text presentation (e.g., digits, ``"©"``),
+            which are usually displayed as text. Text presentation sequences are never found.
+
+    Yields:
+        : A 3-member tuple for each found emoji sequence: the sequence string, its start and end positions in the string.
+
+    Note:
+        Sequences are matched leftmost-longest. It takes time linear in the length of the string for any input:
+        a character is visited at most twice, because the only unbounded lookahead is a run of tag characters, which can't start a sequence.
+
+    Example:
+        ::
+
+            >>> list(find_emoji_sequences("I ❤️ 🧑🏽‍🦰!"))
+            [('❤️', 2, 4), ('🧑🏽\\u200d🦰', 5, 9)]
+    """
+    snap = _snapshot.current
+    classes, table, state_kinds, bits = snap.character_classes, _TRANSITIONS, _STATE_KINDS, snap.character_bits
+    search = snap.sequence_starts.search
+    n = len(s)
+    m = search(s)
+    while m is not None:
+        i = j = end = m.start()
+        state = _S_START
+        while j < n:
+            state = table[state][classes.get(s[j], _C_OTHER)]
+            if state < 0:
+                break
+            j += 1
+            if state_kinds[state] & _K_EMOJI_SEQUENCE:
+                end = j
+            elif state == _S_TEXT:  # text presentation sequence
+                end = -j
+                break
+        if end < 0:
+            m = search(s, -end)
+        elif end == i or (end == i + 1 and not text_default and not bits[s[i]] & _B_EMOJI_PRESENTATION):
+            m = search(s, i + 1)
+        else:
+            yield s[i:end], i, end
+            m = search(s, end)
+
+
+@_metrics.observed
 def is_emoji_character(c: str) -> bool:
     """detect emoji character
 
@@ -179,9 +610,10 @@ def is_emoji_character(c: str) -> bool:
 
     """
     c = chr(ord(c))
-    return _EMOJI_PATTERNS["EMOJI_CHARACTER"].fullmatch(c) is not None
+    return _snapshot.current.patterns["EMOJI_CHARACTER"].fullmatch(c) is not None
 
 
+@_metrics.observed
 def is_extended_pictographic_character(c: str) -> bool:
     """extended pictographic character — a character that has the **Extended_Pictographic** property.
 
@@ -195,9 +627,10 @@ def is_extended_pictographic_character(c: str) -> bool:
 
     """
     c = chr(ord(c))
-    return _EMOJI_PATTERNS["EXTENDED_PICTOGRAPHIC_CHARACTER"].fullmatch(c) is not None
+    return _snapshot.current.patterns["EXTENDED_PICTOGRAPHIC_CHARACTER"].fullmatch(c) is not None
 
 
+@_metrics.observed
 def is_emoji_component(c: str) -> bool:
     """emoji component — A character that has the **Emoji_Component** property.
 
@@ -209,9 +642,10 @@ def is_emoji_component(c: str) -> bool:
 
     """
     c = chr(ord(c))
-    return _EMOJI_PATTERNS["EMOJI_COMPONENT"].fullmatch(c) is not None
+    return _snapshot.current.patterns["EMOJI_COMPONENT"].fullmatch(c) is not None
 
 
+@_metrics.observed
 def is_default_emoji_presentation_character(c: str) -> bool:
     """default emoji presentation character — A character that, by default, should appear with an emoji presentation, rather than a text presentation.
 
@@ -226,9 +660,10 @@ def is_default_emoji_presentation_character(c: str) -> bool:
         https://unicode.org/reports/tr51/#def_emoji_presentation
     """
     c = chr(ord(c))
-    return _EMOJI_PATTERNS["DEFAULT_EMOJI_PRESENTATION_CHARACTER"].fullmatch(c) is not None
+    return _snapshot.current.patterns["DEFAULT_EMOJI_PRESENTATION_CHARACTER"].fullmatch(c) is not None
 
 
+@_metrics.observed
 def is_default_text_presentation_character(c: str) -> bool:
     """default text presentation character — A character that, by default, should appear with a text presentation, rather than an emoji presentation.
 
@@ -244,9 +679,10 @@ def is_default_text_presentation_character(c: str) -> bool:
         https://unicode.org/reports/tr51/#def_text_presentation
     """
     c = chr(ord(c))
-    return _EMOJI_PATTERNS["DEFAULT_TEXT_PRESENTATION_CHARACTER"].fullmatch(c) is not None
+    return _snapshot.current.patterns["DEFAULT_TEXT_PRESENTATION_CHARACTER"].fullmatch(c) is not None
 
 
+@_metrics.observed
 def is_text_presentation_selector(c: str) -> bool:
     """text presentation selector
     — The character U+FE0E VARIATION SELECTOR-15 (VS15), used to request a text presentation for an emoji character.
@@ -260,9 +696,10 @@ def is_text_presentation_selector(c: str) -> bool:
     See also:
         https://unicode.org/reports/tr51/#def_text_presentation_selector
     """
-    return _EMOJI_PATTERNS["TEXT_PRESENTATION_SELECTOR"].fullmatch(c) is not None
+    return _snapshot.current.patterns["TEXT_PRESENTATION_SELECTOR"].fullmatch(c) is not None
 
 
+@_metrics.observed
 def is_text_presentation_sequence(s: str) -> bool:
     """text presentation sequence
     — A variation sequence consisting of an emoji character followed by a text presentation selector.
@@ -277,9 +714,10 @@ def is_text_presentation_sequence(s: str) -> bool:
     See also:
         https://unicode.org/reports/tr51/#def_text_presentation_sequence
     """
-    return _EMOJI_PATTERNS["TEXT_PRESENTATION_SEQUENCE"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_TEXT_PRESENTATION_SEQUENCE)
 
 
+@_metrics.observed
 def is_emoji_presentation_selector(c: str) -> bool:
     """emoji presentation selector
     — The character U+FE0F VARIATION SELECTOR-16 (VS16), used to request an emoji presentation for an emoji character.
@@ -293,9 +731,10 @@ def is_emoji_presentation_selector(c: str) -> bool:
     See also:
         https://unicode.org/reports/tr51/#def_emoji_presentation_selector
     """
-    return _EMOJI_PATTERNS["EMOJI_PRESENTATION_SELECTOR"].fullmatch(c) is not None
+    return _snapshot.current.patterns["EMOJI_PRESENTATION_SELECTOR"].fullmatch(c) is not None
 
 
+@_metrics.observed
 def is_emoji_presentation_sequence(s: str) -> bool:
     """emoji presentation sequence
     — A variation sequence consisting of an emoji character followed by a emoji presentation selector.
@@ -310,9 +749,10 @@ def is_emoji_presentation_sequence(s: str) -> bool:
     See also:
         https://unicode.org/reports/tr51/#def_emoji_presentation_sequence
     """
-    return _EMOJI_PATTERNS["EMOJI_PRESENTATION_SEQUENCE"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_EMOJI_PRESENTATION_SEQUENCE)
 
 
+@_metrics.observed
 def is_emoji_modifier(c: str) -> bool:
     """emoji modifier
     — A character that can be used to modify the appearance of a preceding emoji in an emoji modifier sequence.
@@ -328,9 +768,10 @@ def is_emoji_modifier(c: str) -> bool:
         https://unicode.org/reports/tr51/#def_emoji_modifier
     """
     _c = chr(ord(c))
-    return _EMOJI_PATTERNS["EMOJI_MODIFIER"].fullmatch(_c) is not None
+    return _snapshot.current.patterns["EMOJI_MODIFIER"].fullmatch(_c) is not None
 
 
+@_metrics.observed
 def is_emoji_modifier_base(c: str) -> bool:
     """emoji modifier base
     — A character whose appearance can be modified by a subsequent emoji modifier in an emoji modifier sequence.
@@ -347,9 +788,10 @@ def is_emoji_modifier_base(c: str) -> bool:
         https://unicode.org/reports/tr51/#def_emoji_modifier_base
     """
     _c = chr(ord(c))
-    return _EMOJI_PATTERNS["EMOJI_MODIFIER_BASE"].fullmatch(_c) is not None
+    return _snapshot.current.patterns["EMOJI_MODIFIER_BASE"].fullmatch(_c) is not None
 
 
+@_metrics.observed
 def is_emoji_modifier_sequence(s: str) -> bool:
     """emoji modifier sequence
     — A sequence of the following form::
@@ -357,14 +799,16 @@ def is_emoji_modifier_sequence(s: str) -> bool:
         emoji_modifier_sequence :=
             emoji_modifier_base emoji_modifier
     """
-    return _EMOJI_PATTERNS["EMOJI_MODIFIER_SEQUENCE"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_EMOJI_MODIFIER_SEQUENCE)
 
 
+@_metrics.observed
 def is_regional_indicator(s: str) -> bool:
     """A singleton Regional Indicator character is not a well-formed emoji flag sequence."""
-    return _EMOJI_PATTERNS["REGIONAL_INDICATOR"].fullmatch(s) is not None
+    return _snapshot.current.patterns["REGIONAL_INDICATOR"].fullmatch(s) is not None
 
 
+@_metrics.observed
 def is_emoji_flag_sequence(s: str) -> bool:
     """emoji flag sequence
     — A sequence of two Regional Indicator characters,
@@ -388,21 +832,25 @@ def is_emoji_flag_sequence(s: str) -> bool:
 
 
     """
-    return _EMOJI_PATTERNS["EMOJI_FLAG_SEQUENCE"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_EMOJI_FLAG_SEQUENCE)
 
 
+@_metrics.observed
 def is_tag_base(s: str) -> bool:
-    return _EMOJI_PATTERNS["TAG_BASE"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_TAG_BASE)
 
 
+@_metrics.observed
 def is_tag_spec(s: str) -> bool:
-    return _EMOJI_PATTERNS["TAG_SPEC"].fullmatch(s) is not None
+    return _snapshot.current.patterns["TAG_SPEC"].fullmatch(s) is not None
 
 
+@_metrics.observed
 def is_tag_term(c: str) -> bool:
-    return _EMOJI_PATTERNS["TAG_TERM"].fullmatch(c) is not None
+    return _snapshot.current.patterns["TAG_TERM"].fullmatch(c) is not None
 
 
+@_metrics.observed
 def is_emoji_tag_sequence(s: str) -> bool:
     """emoji tag sequence (ETS)
     — A sequence of the following form::
@@ -422,9 +870,10 @@ def is_emoji_tag_sequence(s: str) -> bool:
     See also:
         https://www.unicode.org/reports/tr51/#def_emoji_tag_sequence
     """
-    return _EMOJI_PATTERNS["EMOJI_TAG_SEQUENCE"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_EMOJI_TAG_SEQUENCE)
 
 
+@_metrics.observed
 def is_emoji_keycap_sequence(s: str) -> bool:
     """emoji keycap sequence
     — A sequence of the following form::
@@ -437,9 +886,10 @@ def is_emoji_keycap_sequence(s: str) -> bool:
     See also:
         https://www.unicode.org/reports/tr51/#def_emoji_keycap_sequence
     """
-    return _EMOJI_PATTERNS["EMOJI_KEYCAP_SEQUENCE"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_EMOJI_KEYCAP_SEQUENCE)
 
 
+@_metrics.observed
 def is_emoji_core_sequence(s: str) -> bool:
     """emoji core sequence
     — A sequence of the following form::
@@ -455,9 +905,10 @@ def is_emoji_core_sequence(s: str) -> bool:
     See also:
         https://www.unicode.org/reports/tr51/#def_emoji_core_sequence
     """
-    return _EMOJI_PATTERNS["EMOJI_CORE_SEQUENCE"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_EMOJI_CORE_SEQUENCE)
 
 
+@_metrics.observed
 def is_emoji_zwj_element(s: str) -> bool:
     """emoji ZWJ element
     — An element that can be used in an emoji ZWJ sequence, as follows::
@@ -470,9 +921,10 @@ def is_emoji_zwj_element(s: str) -> bool:
     See also:
         https://www.unicode.org/reports/tr51/#def_emoji_zwj_element
     """
-    return _EMOJI_PATTERNS["EMOJI_ZWJ_ELEMENT"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_EMOJI_ZWJ_ELEMENT)
 
 
+@_metrics.observed
 def is_emoji_zwj_sequence(s: str) -> bool:
     """emoji ZWJ sequence
     — An emoji sequence with at least one joiner character.
@@ -488,9 +940,10 @@ def is_emoji_zwj_sequence(s: str) -> bool:
     See also:
         https://www.unicode.org/reports/tr51/#def_emoji_zwj_sequence
     """
-    return _EMOJI_PATTERNS["EMOJI_ZWJ_SEQUENCE"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_EMOJI_ZWJ_SEQUENCE)
 
 
+@_metrics.observed
 def is_emoji_sequence(s: str) -> bool:
     """emoji sequence
     — A core sequence, tag sequence, or ZWJ sequence, as follows::
@@ -509,9 +962,10 @@ def is_emoji_sequence(s: str) -> bool:
     See also:
         https://www.unicode.org/reports/tr51/#def_emoji_sequence
     """
-    return _EMOJI_PATTERNS["EMOJI_SEQUENCE"].fullmatch(s) is not None
+    return bool(_classify(s) & _K_EMOJI_SEQUENCE)
 
 
+@_metrics.observed
 def is_qualified_emoji_character(s: str, i: int) -> bool:
     """An emoji character in a string that
 
@@ -532,13 +986,20 @@ def is_qualified_emoji_character(s: str, i: int) -> bool:
         return False
     if is_default_emoji_presentation_character(c):  # default emoji presentation
         return True
-    if _EMOJI_PATTERNS["EMOJI_MODIFIER_SEQUENCE"].match(s[i:]):  # first character in an emoji modifier sequence
+    if _snapshot.current.patterns["EMOJI_MODIFIER_SEQUENCE"].match(s[i:]):  # first character in an emoji modifier sequence
         return True
-    if _EMOJI_PATTERNS["EMOJI_PRESENTATION_SEQUENCE"].match(s[i:]):  # first character in an emoji presentation sequence
+    if _snapshot.current.patterns["EMOJI_PRESENTATION_SEQUENCE"].match(
+        s[i:]
+    ):  # first character in an emoji presentation sequence
         return True
     return False
 
 
+def _qualified_matches(result: QualifiedType) -> int:
+    return result is not QualifiedType.UNQUALIFIED
+
+
+@_metrics.observed(matches=_qualified_matches)
 def detect_qualified(s: str) -> QualifiedType:
     """Detect qualified type of emoji string
 
@@ -561,6 +1022,17 @@ def detect_qualified(s: str) -> QualifiedType:
         - https://www.unicode.org/reports/tr51/#def_unqualified_emoji
 
     """
+    cache = _QUALIFIED_CACHE
+    if cache is None:
+        return _detect_qualified(s)
+    result = cache.get(s)
+    if result is None:
+        result = _detect_qualified(s)
+        cache.put(s, result)
+    return result
+
+
+def _detect_qualified(s: str) -> QualifiedType:
     if is_qualified_emoji_character(s, 0):
         n = len(s)
         if n == 1:
@@ -571,24 +1043,43 @@ def detect_qualified(s: str) -> QualifiedType:
     return QualifiedType.UNQUALIFIED
 
 
+@_metrics.observed
 def is_rgi_emoji_sequence(s: str) -> bool:
     """RGI emoji sequence - Recommended for General Interchange emoji sequences
 
     These are the only emoji sequences that are recommended for general interchange.
 
+    The string is looked up in the RGI emoji set of :class:`.EmojiSequence` (see :meth:`.EmojiSequence.rgi_keys`),
+    so only the sequences listed in the data files are accepted, rather than every structurally valid one.
+
+    Note:
+        :class:`.EmojiSequence` **MUST** be loaded first, see :func:`.load_emoji_data`.
+        It returns ``False`` for the sequences not loaded, e.g., all of them after ``load_emoji_data(sequences=False)``.
+
+    Tip:
+        To test if a string is only well-formed, use :func:`classify_sequence`.
+
     See also:
         https://www.unicode.org/reports/tr51/#def_rgi
     """
-    return (
-        (len(s) == 1 and is_basic_emoji_character(s))
-        or is_emoji_keycap_sequence(s)
-        or is_emoji_modifier_sequence(s)
-        or is_emoji_flag_sequence(s)
-        or is_emoji_tag_sequence(s)
-        or is_emoji_zwj_sequence(s)
-    )
+    return EmojiSequence.is_rgi(s)
+
+
+@_metrics.observed(matches=sum, batch=True)
+def are_rgi_emoji_sequences(strings: Iterable[str]) -> List[bool]:
+    """Batch version of :func:`is_rgi_emoji_sequence`
+
+    Args:
+        strings: Strings to test, e.g., user supplied reaction emojis.
+
+    Returns:
+        A list of booleans, each for the string at the same position.
+    """
+    keys = EmojiSequence.rgi_keys()
+    return [s in keys for s in strings]
 
 
+@_metrics.observed
 def is_basic_emoji_character(c: str) -> bool:
     """basic emoji — Emoji characters excluding Emoji Components
 
@@ -606,6 +1097,7 @@ def is_basic_emoji_character(c: str) -> bool:
     return is_emoji_character(c) and not is_emoji_component(c)
 
 
+@_metrics.observed
 def is_emoji_combining_sequence(s: str) -> bool:
     """Emoji combining sequence
 
@@ -624,9 +1116,7 @@ def is_emoji_combining_sequence(s: str) -> bool:
     See also:
         https://www.unicode.org/reports/tr51/#def_emoji_combining_sequence
     """
-    return (
-        is_emoji_modifier_sequence(s)
-        or is_emoji_zwj_sequence(s)
-        or is_emoji_presentation_sequence(s)
-        or is_text_presentation_sequence(s)
+    return bool(
+        _classify(s)
+        & (_K_EMOJI_MODIFIER_SEQUENCE | _K_EMOJI_ZWJ_SEQUENCE | _K_EMOJI_PRESENTATION_SEQUENCE | _K_TEXT_PRESENTATION_SEQUENCE)
     )
@@ -1,24 +1,127 @@
+import gc
+from typing import Iterable, Optional
+
+from . import snapshot as _snapshot
 from .character import EmojiCharacter
-from .definitions import initial_emoji_patterns, release_emoji_patterns
+from .database import _build_snapshot, _publish
+from .packed import read_packed_data
+from .profiling import READ, phase
 from .sequence import EmojiSequence
+from .sources import DataSource, data_source
 
-__all__ = ["load_emoji_data", "unload_emoji_data"]
+__all__ = ["load_emoji_data", "reload_emoji_data", "unload_emoji_data", "freeze_emoji_data"]
 
 
-def load_emoji_data():
+def load_emoji_data(
+    freeze: bool = False,
+    *,
+    sequences: bool = True,
+    type_fields: Optional[Iterable[str]] = None,
+    variations: bool = True,
+    patterns: Optional[Iterable[str]] = None,
+    source: DataSource = None,
+):
     """Load all emoji data to memory.
 
     Including internal data of :class:`.EmojiCharacter`, :class:`.EmojiSequence` and :mod:`.definitions`
 
-    Its equivalent to calling :meth:`.EmojiCharacter.initial`, :func:`.initial_emoji_patterns` and :meth:`.EmojiSequence.initial`
+    Its equivalent to calling :meth:`.EmojiCharacter.initial`, :func:`.initial_emoji_patterns` and :meth:`.EmojiSequence.initial`,
+    but all the data not loaded yet is built aside, and published at once in a new snapshot, see :mod:`.snapshot`.
+    Data already loaded is kept, use :func:`reload_emoji_data` to replace it.
+
+    Args:
+        freeze: Call :func:`freeze_emoji_data` after loading.
+        sequences: Whether to load :class:`.EmojiSequence`. Single character functions only need :class:`.EmojiCharacter`.
+            Without it, :func:`.is_rgi_emoji_sequence` returns ``False`` for any string, because the RGI emoji set is empty,
+            while the grammar based predicates such as :func:`.is_emoji_sequence` work as usual.
+        type_fields: Only load emoji sequences of these ``type_field`` values, see :meth:`.EmojiSequence.initial`.
+            The RGI emoji set, hence :func:`.is_rgi_emoji_sequence`, only covers the loaded ones.
+        variations: Whether to load emoji variation sequences, see :meth:`.EmojiSequence.initial`.
+        patterns: Only compile the :mod:`.definitions` patterns of these names, see :func:`.initial_emoji_patterns`.
+        source: Where to read the data files from, the package's data directory if ``None``.
+            It may be another directory, a zip or tar archive, a mapping of in-memory buffers or a callable opening files,
+            see :data:`.DataSource`.
+
+    Example:
+        Only flags and keycaps, without variation sequences nor big patterns::
+
+            load_emoji_data(type_fields=["RGI_Emoji_Flag_Sequence", "Emoji_Keycap_Sequence"], variations=False, patterns=[])
+    """
+    with _snapshot.lock:
+        current = _snapshot.current
+        if not (current.characters and current.patterns and (current.sequences or not sequences)):
+            if source is not None:
+                source = data_source(source)  # an archive is read only once
+            with phase(READ):
+                packed = read_packed_data(source=source)
+            _publish(_build_snapshot(current, packed, sequences, type_fields, variations, patterns, source))
+    if freeze:
+        freeze_emoji_data()
+
+
+def reload_emoji_data(
+    freeze: bool = False,
+    *,
+    sequences: bool = True,
+    type_fields: Optional[Iterable[str]] = None,
+    variations: bool = True,
+    patterns: Optional[Iterable[str]] = None,
+    source: DataSource = None,
+):
+    """Load all emoji data again, replacing the loaded data in place.
+
+    The new data is completely built aside, then published by a single reference assignment (see :mod:`.snapshot`),
+    so that threads calling :meth:`.EmojiSequence.find`, :meth:`.EmojiSequence.from_string` or the predicates meanwhile
+    keep using the old data until the swap, and the new data after it,
+    instead of failing or finding nothing as they may do between :func:`unload_emoji_data` and :func:`load_emoji_data`.
+    The old data is freed once no running call references it.
+
+    The arguments are the same as :func:`load_emoji_data`'s, e.g., ``source`` to switch to the data files of a newer version.
+    """
+    with _snapshot.lock:
+        if source is not None:
+            source = data_source(source)
+        with phase(READ):
+            packed = read_packed_data(source=source)
+        _publish(_build_snapshot(_snapshot.EMPTY, packed, sequences, type_fields, variations, patterns, source))
+    if freeze:
+        freeze_emoji_data()
+
+
+def freeze_emoji_data():
+    """Finalize loaded emoji data, for sharing it with forked child processes.
+
+    Pre-fork servers (e.g., gunicorn with ``preload_app``) load emoji data in the master process, then fork workers.
+    Memory pages of the data are shared copy-on-write, but a garbage collection in a worker writes to every object it traverses,
+    so each worker gradually gets private copies of all the pages.
+
+    This function:
+
+    - marks the loaded data as frozen, see :attr:`.EmojiSequence.frozen` (the internal dictionaries are always read-only);
+    - computes the lazily computed attributes of the sequences and the combined pattern, see :meth:`.EmojiSequence.freeze`;
+    - collects garbage, then moves all objects tracked by the garbage collector into a permanent generation by :func:`gc.freeze`,
+      so that they are never traversed by later collections.
+
+    Call it in the master process after loading, and before forking.
+
+    Note:
+        :func:`gc.freeze` moves **all** objects tracked at the moment, not only emoji data.
+        See the :mod:`gc` module's documentation.
     """
-    EmojiCharacter.initial()
-    initial_emoji_patterns()
-    EmojiSequence.initial()
+    EmojiCharacter.freeze()
+    EmojiSequence.freeze()
+    gc.collect()
+    gc.freeze()
 
 
 def unload_emoji_data():
-    """Release emoji data stored"""
-    EmojiSequence.release()
-    release_emoji_patterns()
-    EmojiCharacter.release()
+    """Release emoji data stored
+
+    All of it is released at once, by publishing an empty snapshot.
+    The lookup table of :mod:`.vectorized` is released too, if that module is imported.
+
+    Tip:
+        To replace loaded data while other threads are using it, call :func:`reload_emoji_data` instead of this and :func:`load_emoji_data`.
+    """
+    with _snapshot.lock:
+        _publish(_snapshot.EMPTY)
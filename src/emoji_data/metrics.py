@@ -0,0 +1,229 @@
+"""Runtime metrics of the hot-path functions
+
+:meth:`.EmojiSequence.find`, :meth:`.EmojiSequence.find_all`, :meth:`.EmojiSequence.find_ids`, :func:`.find_emoji_sequences`,
+:func:`.detect_qualified`, :func:`.are_rgi_emoji_sequences` and the ``is_*`` predicates of :mod:`.definitions` report a :class:`CallMetrics` of each call to a sink callback, once it's set by :func:`set_metrics_sink`.
+The sink may export them to a metrics system (e.g., Prometheus or StatsD), or aggregate them by :class:`MetricsAggregator`.
+
+Calls made inside an observed call (e.g., :func:`.is_emoji_character` called by :func:`.detect_qualified`) are not reported on their own.
+
+They are instrumented by the :func:`observed` decorator.
+When no sink is set, which is the default, each call only goes through the wrapper, which tests a module attribute against ``None``.
+
+Example:
+    ::
+
+        from emoji_data.metrics import MetricsAggregator, set_metrics_sink
+
+        aggregator = MetricsAggregator()
+        set_metrics_sink(aggregator)
+        ...
+        aggregator.snapshot()["EmojiSequence.find_all"]  # FunctionMetrics(calls=..., length=..., matches=..., seconds=...)
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import partial, wraps
+from inspect import isgeneratorfunction, signature
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple, TypeVar, overload
+
+__all__ = ["CallMetrics", "FunctionMetrics", "MetricsSink", "MetricsAggregator", "set_metrics_sink", "get_metrics_sink"]
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class CallMetrics(NamedTuple):
+    """Metrics of one call"""
+
+    function: str
+    """Name of the function, e.g., ``"is_emoji_character"`` or ``"EmojiSequence.find"``"""
+    length: int
+    """Length of the input string, or the count of the input strings for :func:`.are_rgi_emoji_sequences`"""
+    matches: int
+    """Count of found sequences for ``find`` functions, ``1`` or ``0`` for predicates,
+    and ``1`` for a fully or minimally qualified result of :func:`.detect_qualified`.
+    For :func:`.are_rgi_emoji_sequences`, it's the count of RGI ones."""
+    seconds: float
+    """Time spent in the function. For :meth:`.EmojiSequence.find`, it's the time of producing all the items, excluding the consumer's"""
+
+
+MetricsSink = Callable[[CallMetrics], None]
+"""A callback receiving the metrics of each call"""
+
+sink: Optional[MetricsSink] = None
+"""The current sink, read by the instrumented functions. Use :func:`set_metrics_sink` to change it."""
+
+_state = threading.local()
+
+
+def set_metrics_sink(value: Optional[MetricsSink]):
+    """Set the sink callback of metrics, or disable the metrics with ``None``
+
+    The sink is called in the thread of the observed function, right after the function returns.
+    Exceptions raised by the sink propagate to the caller of the function.
+    """
+    global sink
+    sink = value
+
+
+def get_metrics_sink() -> Optional[MetricsSink]:
+    """Return the current sink callback of metrics, ``None`` if metrics are disabled"""
+    return sink
+
+
+def busy() -> bool:
+    """Whether the current thread is inside an observed call"""
+    return getattr(_state, "busy", False)
+
+
+def _count(result: Any) -> int:
+    return len(result) if isinstance(result, list) else int(bool(result))
+
+
+def observe(
+    name: str,
+    length: Optional[int],
+    func: Callable[..., T],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    matches: Callable[[T], int] = _count,
+) -> T:
+    """Call the function, and report its metrics to the sink
+
+    ``length`` is the length of the input, or ``None`` for a batch function, whose length is of the returned list.
+    """
+    state = _state
+    state.busy = True
+    start = perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        seconds = perf_counter() - start
+        state.busy = False
+    sink_ = sink
+    if sink_ is not None:
+        sink_(CallMetrics(name, len(result) if length is None else length, matches(result), seconds))  # type: ignore[arg-type]
+    return result
+
+
+def observe_iter(
+    name: str, length: int, func: Callable[..., Iterator[T]], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Iterator[T]:
+    """Iterate over a generator function's items, and report its metrics to the sink when the iteration ends"""
+    state = _state
+    count, seconds = 0, 0.0
+    it = func(*args, **kwargs)
+    try:
+        while True:
+            state.busy = True
+            start = perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                break
+            finally:
+                seconds += perf_counter() - start
+                state.busy = False
+            count += 1
+            yield item
+    finally:
+        sink_ = sink
+        if sink_ is not None:
+            sink_(CallMetrics(name, length, count, seconds))
+
+
+@overload
+def observed(func: F) -> F: ...
+
+
+@overload
+def observed(*, matches: Callable[[Any], int] = _count, batch: bool = False) -> Callable[[F], F]: ...
+
+
+def observed(func=None, *, matches=_count, batch=False):
+    """Decorate a function to report the metrics of each call, named by its qualified name
+
+    The input is the first argument after ``cls`` or ``self``.
+    A generator function is observed by :func:`observe_iter`, the others by :func:`observe`.
+    When no sink is set, or the call is inside an observed call, the wrapper calls the function straight.
+
+    Args:
+        matches: Count of matches in the result of a call, see :attr:`CallMetrics.matches`.
+        batch: The input is an iterable of strings and the result is a list, one item per string.
+            The reported length is the count of the strings.
+    """
+    if func is None:
+        return partial(observed, matches=matches, batch=batch)
+    name = func.__qualname__
+    params = list(signature(func).parameters)
+    index = 1 if params[0] in ("cls", "self") else 0
+    param = params[index]
+
+    def length(args, kwargs) -> int:
+        return len(args[index] if len(args) > index else kwargs[param])
+
+    if isgeneratorfunction(func):
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if sink is None or busy():
+                return func(*args, **kwargs)
+            return observe_iter(name, length(args, kwargs), func, args, kwargs)
+
+    elif params == [param] and not batch:
+        # Most of the predicates take exactly one string, a wrapper of the same arity is several times cheaper.
+
+        @wraps(func)
+        def wrapper(s):
+            if sink is None or busy():
+                return func(s)
+            return observe(name, len(s), func, (s,), {}, matches)
+
+    else:
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if sink is None or busy():
+                return func(*args, **kwargs)
+            return observe(name, None if batch else length(args, kwargs), func, args, kwargs, matches)
+
+    return wrapper
+
+
+class FunctionMetrics(NamedTuple):
+    """Aggregated metrics of a function"""
+
+    calls: int
+    length: int
+    """Total length of the input strings"""
+    matches: int
+    """Total matches"""
+    seconds: float
+    """Cumulative seconds"""
+
+
+class MetricsAggregator:
+    """A thread-safe sink which sums up metrics by function"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: Dict[str, FunctionMetrics] = {}
+
+    def __call__(self, metrics: CallMetrics):
+        with self._lock:
+            calls, length, matches, seconds = self._data.get(metrics.function, (0, 0, 0, 0.0))
+            self._data[metrics.function] = FunctionMetrics(
+                calls + 1, length + metrics.length, matches + metrics.matches, seconds + metrics.seconds
+            )
+
+    def snapshot(self) -> Dict[str, FunctionMetrics]:
+        """Return the aggregated metrics of each function so far"""
+        with self._lock:
+            return dict(self._data)
+
+    def reset(self):
+        """Drop the aggregated metrics"""
+        with self._lock:
+            self._data.clear()
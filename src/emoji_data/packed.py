@@ -0,0 +1,400 @@
+"""Pre-parsed emoji data of characters and sequences
+
+Parsing the Unicode® text data files line by line is the most of the time to load emoji data.
+:meth:`.EmojiCharacter.initial` and :meth:`.EmojiSequence.initial` read pre-parsed records instead, from the first available one of:
+
+1. The generated Python module ``emoji_data._tables`` of literal tuples, see :func:`write_tables_module`.
+   Python loads it from its ``.pyc`` file by one unmarshal, without :mod:`mmap` or a writable cache directory.
+   It's not shipped with the package, generate it (and compile it by :mod:`compileall`) when building a read-only image.
+   It's removed from :data:`sys.modules` once its tables are read, so they are freed after loading like the other sources.
+2. The packed binary data file :data:`PACKED_DATA_FILE` of fixed-layout records, shipped next to the text files and read through :mod:`mmap`,
+   see :func:`write_packed_data`.
+
+Either of them is only used if it was generated from the text data files in the package, judged by a cheap stamp of their sizes,
+otherwise the text files are parsed.
+The full SHA-256 digest of the text files is stored too, and verified by the tests rather than on each load.
+Both are regenerated by ``scripts/download.py`` after downloading the text files.
+
+Layout of the file, all integers are little-endian unsigned 32-bit:
+
+- Header, see ``_HEADER``.
+- String table: ``n_strings + 1`` offsets in code point units, followed by the UTF-8 encoded strings, padded to 4 bytes.
+- Character records: ``(code_point, property_bits, version, description)``, where the strings are indices into the string table.
+- Sequence records: ``(end, type_field, version, variation, description)``, in the order of the text data files,
+  where ``end`` is the end offset of the sequence's code points. A sequence defined by several files has a record of each.
+- Code points of all the sequences, one after another.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from functools import partial
+from importlib import import_module
+from os import PathLike
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+if sys.version_info < (3, 9):  # pragma: no cover
+    import importlib_resources  # type: ignore[import-not-found]
+else:  # pragma: no cover
+    import importlib.resources as importlib_resources
+
+from .sources import DataSource, data_source
+
+__all__ = [
+    "PACKED_DATA_FILE",
+    "SOURCE_DATA_FILES",
+    "TABLES_MODULE",
+    "PackedData",
+    "source_digest",
+    "source_sizes",
+    "read_packed_data",
+    "pack_emoji_data",
+    "write_packed_data",
+    "write_tables_module",
+]
+
+PACKED_DATA_FILE = "emoji-data.bin"
+"""File name of the packed binary data file in the package's data directory"""
+
+TABLES_MODULE = "_tables"
+"""Name of the generated Python tables module in the package"""
+
+SOURCE_DATA_FILES = (
+    "emoji-data.txt",
+    "emoji-sequences.txt",
+    "emoji-zwj-sequences.txt",
+    "emoji-variation-sequences.txt",
+)
+"""Text data files that the packed binary data file is generated from"""
+
+_MAGIC = b"EMJP"
+_FORMAT_VERSION = 3
+# magic, format version, SHA-256 of source data files, sizes of the 4 source data files,
+# count of strings, bytes of strings, count of characters, count of sequences, count of sequences' code points
+_HEADER = struct.Struct("<4sI32s4IIIIII")
+_CHARACTER = struct.Struct("<IIII")
+_SEQUENCE = struct.Struct("<IIIII")
+
+
+def _u32_array(buffer: memoryview) -> array:
+    arr = array("I")
+    arr.frombytes(buffer)
+    if sys.byteorder != "little":  # pragma: no cover
+        arr.byteswap()
+    return arr
+
+
+def source_digest(source: DataSource = None) -> bytes:
+    """SHA-256 digest of the text data files of a source, the package's data directory if ``source`` is ``None``"""
+    h = hashlib.sha256()
+    directory = data_source(source)
+    for name in SOURCE_DATA_FILES:
+        h.update(directory.joinpath(name).read_bytes())
+    return h.digest()
+
+
+def source_sizes(source: DataSource = None) -> Tuple[int, ...]:
+    """Sizes in bytes of the text data files of a source, a stamp which is cheap to check on each load
+
+    The source is the package's data directory if it's ``None``, see :data:`.DataSource`.
+    """
+    sizes = []
+    directory = data_source(source)
+    for name in SOURCE_DATA_FILES:
+        resource = directory.joinpath(name)
+        if isinstance(resource, PathLike):
+            sizes.append(os.stat(resource).st_size)
+        elif hasattr(resource, "buffer"):  # in memory
+            sizes.append(resource.buffer().nbytes)
+        else:
+            sizes.append(len(resource.read_bytes()))
+    return tuple(sizes)
+
+
+class PackedData:
+    """Pre-parsed records of emoji characters and sequences
+
+    Don't instantiate it directly, use :func:`read_packed_data`.
+    """
+
+    def __init__(
+        self,
+        digest: bytes,
+        sizes: Sequence[int],
+        strings: Sequence[str],
+        characters: Union[Sequence[Tuple[int, int, int, int]], memoryview],
+        sequences: Union[Sequence[Tuple[int, int, int, int, int]], memoryview],
+        text: Union[str, memoryview],
+    ):
+        self.digest = digest
+        """SHA-256 digest of the text data files that it was generated from"""
+        self.sizes = tuple(sizes)
+        """Sizes of the text data files that it was generated from, see :func:`source_sizes`"""
+        self._strings = strings
+        self._characters = characters
+        self._sequences = sequences
+        self._text = text
+
+    @classmethod
+    def from_buffer(cls, buffer: memoryview) -> PackedData:
+        """Read records from a buffer in the packed binary format"""
+        magic, fmt, digest, *sizes, n_strings, strings_size, n_chars, n_seqs, n_cps = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or fmt != _FORMAT_VERSION:
+            raise ValueError("Not a packed emoji data file, or of an unsupported format version")
+        pos = _HEADER.size
+        string_offsets = _u32_array(buffer[pos : pos + 4 * (n_strings + 1)])
+        pos += 4 * (n_strings + 1)
+        text = str(buffer[pos : pos + strings_size], "utf-8")
+        pos += -(-strings_size // 4) * 4
+        strings = [text[string_offsets[i] : string_offsets[i + 1]] for i in range(n_strings)]
+        # The records stay in the buffer, and are decoded when they're iterated.
+        characters = buffer[pos : pos + _CHARACTER.size * n_chars]
+        pos += _CHARACTER.size * n_chars
+        sequences = buffer[pos : pos + _SEQUENCE.size * n_seqs]
+        pos += _SEQUENCE.size * n_seqs
+        code_points = buffer[pos : pos + 4 * n_cps]
+        if len(code_points) != 4 * n_cps:
+            raise ValueError("Packed emoji data is truncated")
+        return cls(digest, sizes, strings, characters, sequences, code_points)
+
+    @classmethod
+    def from_module(cls, module: Any) -> PackedData:
+        """Read records from a generated tables module"""
+        if module.FORMAT_VERSION != _FORMAT_VERSION:
+            raise ValueError("Generated emoji tables module is of an unsupported format version")
+        return cls(module.DIGEST, module.SIZES, module.STRINGS, module.CHARACTERS, module.SEQUENCES, module.TEXT)
+
+    def characters(self) -> Iterator[Tuple[int, int, str, str]]:
+        """Iterate over character records.
+
+        Yields:
+            : ``(code_point, property_bits, version, description)``, where the bits are defined in :data:`.PROPERTY_BITS`.
+        """
+        strings = self._strings
+        records: Iterable[Tuple[int, ...]] = (
+            _CHARACTER.iter_unpack(self._characters) if isinstance(self._characters, memoryview) else self._characters
+        )
+        for cp, bits, version, description in records:
+            yield cp, bits, strings[version], strings[description]
+
+    def sequences(self) -> Iterator[Tuple[str, Sequence[int], str, str, str, str]]:
+        """Iterate over sequence records, in the order of the text data files.
+
+        Yields:
+            : ``(string, code_points, type_field, version, variation, description)``,
+            records from ``emoji-variation-sequences.txt`` are the ones with a ``variation``.
+        """
+        strings, text = self._strings, self._text
+        if isinstance(text, memoryview):
+            cps = _u32_array(text)
+            text = str(text, "utf-32-le")
+        else:
+            cps = array("I")
+            cps.frombytes(text.encode("utf-32-le" if sys.byteorder == "little" else "utf-32-be"))
+        records: Iterable[Tuple[int, ...]] = (
+            _SEQUENCE.iter_unpack(self._sequences) if isinstance(self._sequences, memoryview) else self._sequences
+        )
+        start = 0
+        for end, type_field, version, variation, description in records:
+            yield (
+                text[start:end],
+                cps[start:end],
+                strings[type_field],
+                strings[version],
+                strings[variation],
+                strings[description],
+            )
+            start = end
+
+
+def _read_tables_module() -> Optional[PackedData]:
+    name = f"{__package__}.{TABLES_MODULE}"
+    try:
+        module = import_module(name)
+    except ImportError:
+        return None
+    # Don't keep the module imported, so that its tables are freed with the records once they're loaded,
+    # it's imported from its `.pyc` again on the next load.
+    sys.modules.pop(name, None)
+    vars(sys.modules[__package__]).pop(TABLES_MODULE, None)
+    try:
+        return PackedData.from_module(module)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _read_packed_file(source: DataSource = None) -> Optional[PackedData]:
+    resource = data_source(source).joinpath(PACKED_DATA_FILE)
+    if not resource.is_file():
+        return None
+    mm = None
+    if isinstance(resource, PathLike):
+        with open(resource, "rb") as fp:
+            # The mapping is unmapped when the returned records are freed, after loading.
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(mm)
+    elif hasattr(resource, "buffer"):  # in memory, read in place
+        buffer = resource.buffer()
+    else:
+        buffer = memoryview(resource.read_bytes())
+    try:
+        return PackedData.from_buffer(buffer)
+    except (ValueError, struct.error, UnicodeDecodeError):
+        if mm is not None:
+            mm.close()
+        return None
+
+
+def read_packed_data(check: bool = True, source: DataSource = None) -> Optional[PackedData]:
+    """Read pre-parsed emoji data from the generated tables module or the packed binary data file, whichever is available first.
+
+    Args:
+        check: Only use data generated from the text data files in the data directory, by comparing :func:`source_sizes`.
+            It doesn't read the text files, the full :func:`source_digest` is left to the tests and the build.
+        source: Where to read the text data files and the packed binary data file from, the package's data directory if ``None``,
+            see :data:`.DataSource`. The tables module, which is generated in the package, is only read for the package's data directory.
+
+    Returns:
+        The pre-parsed data, or ``None`` if neither is available, valid and up to date with the text data files.
+    """
+    if source is not None:
+        source = data_source(source)  # an archive is read only once
+    sizes = source_sizes(source) if check else None
+    readers = (_read_tables_module, _read_packed_file) if source is None else (partial(_read_packed_file, source),)
+    for reader in readers:
+        packed = reader()
+        if packed is not None and (sizes is None or packed.sizes == sizes):
+            return packed
+    return None
+
+
+def _collect(
+    source: DataSource = None,
+) -> Tuple[List[str], List[Tuple[int, int, int, int]], List[Tuple[int, int, int, int, int]], str]:
+    # Parse the text data files, and collect the records: strings, characters, sequences, text of sequences
+    from .character import EMOJI_KEYCAP, EMOJI_PRESENTATION_SELECTOR, PROPERTY_BITS, TEXT_PRESENTATION_SELECTOR, EmojiCharacter
+    from .sequence import EmojiSequence
+
+    string_indices: Dict[str, int] = {}
+
+    def index_of(s: str) -> int:
+        return string_indices.setdefault(s, len(string_indices))
+
+    # The same characters as `EmojiCharacter._build` registers from the text data file, without touching the loaded classes:
+    # the version and description of a code point are of its first record, and its properties are of all the records.
+    records: Dict[int, List[Any]] = {}
+    for first, last, property_, version, description in EmojiCharacter._parse_text(source):
+        for cp in range(first, 1 + last):
+            try:
+                records[cp][1] |= PROPERTY_BITS[property_]
+            except KeyError:
+                records[cp] = [cp, PROPERTY_BITS[property_], version, description]
+    for cp in (TEXT_PRESENTATION_SELECTOR, EMOJI_PRESENTATION_SELECTOR, EMOJI_KEYCAP):
+        records.setdefault(cp, [cp, 0, "", ""])
+    characters = [(cp, bits, index_of(version), index_of(description)) for cp, bits, version, description in records.values()]
+    texts = []
+    sequences = []
+    end = 0
+    for s, _, type_field, version, variation, description in EmojiSequence._parse_text(source):
+        texts.append(s)
+        end += len(s)
+        sequences.append((end, index_of(type_field), index_of(version), index_of(variation), index_of(description)))
+    return list(string_indices), characters, sequences, "".join(texts)
+
+
+def pack_emoji_data(source: DataSource = None) -> bytes:
+    """Parse the text data files of a source, and pack them into the binary format.
+
+    Args:
+        source: Where to read the text data files from, the package's data directory if ``None``, see :data:`.DataSource`.
+
+    It doesn't change the loaded emoji data, if any.
+    """
+    if source is not None:
+        source = data_source(source)
+    strings, characters, sequences, text = _collect(source)
+    string_offsets = array("I", [0])
+    for s in strings:
+        string_offsets.append(string_offsets[-1] + len(s))
+    if sys.byteorder != "little":  # pragma: no cover
+        string_offsets.byteswap()
+    strings_blob = "".join(strings).encode("utf-8")
+    header = _HEADER.pack(
+        _MAGIC,
+        _FORMAT_VERSION,
+        source_digest(source),
+        *source_sizes(source),
+        len(strings),
+        len(strings_blob),
+        len(characters),
+        len(sequences),
+        len(text),
+    )
+    return b"".join(
+        (
+            header,
+            string_offsets.tobytes(),
+            strings_blob,
+            bytes(-len(strings_blob) % 4),
+            b"".join(_CHARACTER.pack(*record) for record in characters),
+            b"".join(_SEQUENCE.pack(*record) for record in sequences),
+            text.encode("utf-32-le"),
+        )
+    )
+
+
+def write_packed_data(path: Union[str, PathLike, None] = None, source: DataSource = None):
+    """Write the packed binary data file, see :func:`pack_emoji_data`.
+
+    Args:
+        path: Path of the file to write. It's :data:`PACKED_DATA_FILE` in the data directory if ``None``,
+            which must be a directory then.
+        source: Where to read the text data files to pack from, the package's data directory if ``None``, see :data:`.DataSource`.
+    """
+    data = pack_emoji_data(source)
+    if path is None:
+        with importlib_resources.as_file(data_source(source).joinpath(PACKED_DATA_FILE)) as p:
+            p.write_bytes(data)
+    else:
+        with open(path, "wb") as fp:
+            fp.write(data)
+
+
+def write_tables_module(path: Union[str, PathLike, None] = None):
+    """Write the generated Python tables module, of the same records as the packed binary data file in literal tuples.
+
+    Args:
+        path: Path of the module file to write. It's :data:`TABLES_MODULE` in the package's directory if ``None``.
+
+    It doesn't change the loaded emoji data, if any.
+    """
+    strings, characters, sequences, text = _collect()
+    lines = [
+        "# Generated by emoji_data.packed.write_tables_module, DO NOT EDIT.",
+        "# fmt: off",
+        f"FORMAT_VERSION = {_FORMAT_VERSION!r}",
+        f"DIGEST = {source_digest()!r}",
+        f"SIZES = {source_sizes()!r}",
+        f"TEXT = {text!r}",
+        "STRINGS = (",
+        *(f"    {s!r}," for s in strings),
+        ")",
+        "CHARACTERS = (",
+        *(f"    {record!r}," for record in characters),
+        ")",
+        "SEQUENCES = (",
+        *(f"    {record!r}," for record in sequences),
+        ")",
+        "",
+    ]
+    if path is None:
+        with importlib_resources.as_file(importlib_resources.files(__package__).joinpath(f"{TABLES_MODULE}.py")) as p:
+            p.write_text("\n".join(lines), encoding="utf-8")
+    else:
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write("\n".join(lines))
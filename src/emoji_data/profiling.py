@@ -0,0 +1,179 @@
+"""Profiling of loading emoji data
+
+Loading records the time spent in each of its phases, and :func:`stats` reports them together with object counts and approximate memory of each registry.
+
+Example:
+    ::
+
+        >>> from emoji_data import load_emoji_data, stats
+        >>> load_emoji_data()
+        >>> report = stats()
+        >>> report.phases["sequence_pattern"]
+        PhaseStats(calls=1, seconds=0.23...)
+        >>> report.registries["EmojiSequence"]
+        RegistryStats(objects=4488, bytes=...)
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from contextlib import contextmanager
+from enum import Enum
+from time import perf_counter
+from types import FunctionType, MappingProxyType, ModuleType
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Set
+
+__all__ = ["PhaseStats", "RegistryStats", "LoadStats", "stats", "reset_stats"]
+
+logger = logging.getLogger(__package__)
+
+READ = "read"
+"""Reading the text data files, or the pre-parsed data of :mod:`.packed`"""
+PARSE = "parse"
+"""Parsing lines of the text data files"""
+CHARACTER_REGISTRY = "character_registry"
+"""Building the internal dictionary of :class:`.EmojiCharacter`"""
+SEQUENCE_REGISTRY = "sequence_registry"
+"""Building the internal dictionary and store of :class:`.EmojiSequence`"""
+SEQUENCE_REGEX = "sequence_regex"
+"""Compiling :attr:`.EmojiSequence.regex_pattern` of single sequences, on their first access"""
+DEFINITIONS_PATTERNS = "definitions_patterns"
+"""Compiling the patterns of :mod:`.definitions`"""
+SEQUENCE_PATTERN = "sequence_pattern"
+"""Building the matcher of :meth:`.EmojiSequence.find`, and compiling the combined :attr:`.EmojiSequence.pattern` on its first access"""
+
+PHASES = (READ, PARSE, CHARACTER_REGISTRY, SEQUENCE_REGISTRY, SEQUENCE_REGEX, DEFINITIONS_PATTERNS, SEQUENCE_PATTERN)
+"""Names of all the phases"""
+
+
+class PhaseStats(NamedTuple):
+    """Time spent in a phase"""
+
+    calls: int
+    """Count of times the phase was entered"""
+    seconds: float
+    """Cumulative seconds, excluding nested phases"""
+
+
+class RegistryStats(NamedTuple):
+    """Size of a registry"""
+
+    objects: int
+    """Count of entries"""
+    bytes: int
+    """Approximate bytes of the entries and the objects they own, by :func:`sys.getsizeof`"""
+
+
+class LoadStats(NamedTuple):
+    """Report of :func:`stats`"""
+
+    phases: Mapping[str, PhaseStats]
+    """Time of each phase in :data:`PHASES`, since the process started or :func:`reset_stats`"""
+    registries: Mapping[str, RegistryStats]
+    """Size of ``"EmojiCharacter"``, ``"EmojiSequence"`` and ``"definitions"`` as loaded now"""
+
+
+_lock = threading.Lock()
+_calls: Dict[str, int] = dict.fromkeys(PHASES, 0)
+_seconds: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+_local = threading.local()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Record the time spent in the block as the phase, excluding phases nested in it"""
+    stack: List[float] = _local.__dict__.setdefault("stack", [])
+    stack.append(0.0)  # seconds of nested phases
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - start
+        nested = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        with _lock:
+            _calls[name] += 1
+            _seconds[name] += elapsed - nested
+
+
+def reset_stats():
+    """Reset the recorded time of all phases"""
+    with _lock:
+        for name in PHASES:
+            _calls[name], _seconds[name] = 0, 0.0
+
+
+def _sizeof(obj: Any, seen: Set[int]) -> int:
+    # Approximate deep size of an object, counting each object once across calls sharing `seen`.
+    # Classes, modules, functions and enum members are shared by everything, they are not counted.
+    size = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or isinstance(o, (type, ModuleType, FunctionType, Enum)):
+            continue
+        seen.add(id(o))
+        size += sys.getsizeof(o)
+        if isinstance(o, (dict, MappingProxyType)):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        else:
+            for cls in type(o).__mro__:
+                for attr in cls.__dict__.get("__slots__", ()):
+                    try:
+                        stack.append(getattr(o, attr))
+                    except AttributeError:
+                        pass
+            if hasattr(o, "__dict__"):
+                stack.append(o.__dict__)
+    return size
+
+
+def stats(memory: bool = True, log: bool = False) -> LoadStats:
+    """Report the time spent in each phase of loading, and the size of each registry.
+
+    Args:
+        memory: Measure the approximate bytes of the registries. It traverses all the loaded objects, which takes some time.
+            The bytes are ``0`` if it's ``False``.
+        log: Also log the report to the ``emoji_data`` logger, at ``INFO`` level.
+
+    Returns:
+        The report, which may be converted to JSON by ``json.dumps(report._asdict())``.
+    """
+    from .snapshot import current as snap
+
+    with _lock:
+        phases = {name: PhaseStats(_calls[name], _seconds[name]) for name in PHASES}
+
+    seen: Set[int] = set()
+    owned: Dict[str, List[Any]] = {
+        # EmojiSequence objects share EmojiCharacter objects, so that characters are counted first.
+        "EmojiCharacter": [snap.characters],
+        "EmojiSequence": [
+            snap.sequences,
+            snap.store,
+            snap.sequences_by_id,
+            snap.rgi_keys,
+            snap.trie,
+            snap.pattern,
+            snap.byte_trie,
+        ],
+        "definitions": [snap.patterns, snap.character_bits, snap.character_classes],
+    }
+    counts = {"EmojiCharacter": len(snap.characters), "EmojiSequence": len(snap.sequences), "definitions": len(snap.patterns)}
+    registries = {
+        name: RegistryStats(counts[name], sum(_sizeof(o, seen) for o in objs) if memory else 0) for name, objs in owned.items()
+    }
+
+    report = LoadStats(phases, registries)
+    if log:
+        for name, p in phases.items():
+            logger.info("phase %s: %d calls, %.6f seconds", name, p.calls, p.seconds)
+        for name, r in registries.items():
+            logger.info("registry %s: %d objects, %d bytes", name, r.objects, r.bytes)
+    return report
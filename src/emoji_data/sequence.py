@@ -1,17 +1,200 @@
 from __future__ import annotations
 
 import re
-from typing import ClassVar, Iterable, Iterator, Literal, Optional, Pattern, Sequence, Tuple, Union, final
-
+from array import array
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+    final,
+    overload,
+)
+
+from . import metrics as _metrics
+from . import snapshot as _snapshot
 from .character import EmojiCharacter
-from .container import BaseDictContainer
-from .utils import emoji_data_lines
+from .container import BaseDictContainer, _as_list, _get_many
+from .packed import PackedData, read_packed_data
+from .profiling import PARSE, READ, SEQUENCE_PATTERN, SEQUENCE_REGEX, SEQUENCE_REGISTRY, phase
+from .sources import DataSource
+from .store import SequenceStore
+from .utils import code_point_to_regex, code_points_to_character_class, code_points_to_string, emoji_data_lines
 
 __all__ = ["EmojiSequence"]
 
 
+Trie = Dict[str, Any]
+"""Nested dictionaries keyed by character, where the ``""`` key of a node is the :class:`EmojiSequence` ending there"""
+
+Offsets = Literal["code_point", "utf-16", "utf-8"]
+"""Unit of the offsets reported by :meth:`EmojiSequence.find`: code points of the string (Python's indices),
+UTF-16 code units (JavaScript's indices) or UTF-8 bytes"""
+
+_OFFSET_ENCODINGS = {"utf-16": ("utf-16-le", 2), "utf-8": ("utf-8", 1)}
+
+_NEVER_BYTES = re.compile(rb"(?!)")
+
+
+def _trie(items: Iterable[Tuple[Any, EmojiSequence]]) -> Dict[Any, Any]:
+    # The trie of all sequences, keyed by the items of their keys, i.e., characters of strings or bytes of encoded ones.
+    # A node that no sequence continues from is replaced by its EmojiSequence, most of the nodes are such leaves.
+    root: Dict[Any, Any] = {}
+    for key, seq in items:
+        node = root
+        for c in key:
+            node = node.setdefault(c, {})
+        node[""] = seq
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for c, child in node.items():
+            if c != "":
+                if len(child) == 1 and "" in child:
+                    node[c] = child[""]
+                else:
+                    stack.append(child)
+    return root
+
+
+def _build_trie(items: Iterable[Tuple[str, EmojiSequence]]) -> Tuple[Trie, Pattern[str]]:
+    # The trie of all sequences, and a character class of their first characters to skip to the next possible start.
+    root = _trie(items)
+    if not root:
+        return root, _snapshot.NEVER
+    return root, re.compile(code_points_to_character_class(map(ord, root)))
+
+
+def _byte_trie(snap: _snapshot.Snapshot) -> Tuple[Dict[int, Any], Pattern[bytes]]:
+    # The trie of the UTF-8 encoded sequences, and a class of their first bytes, built on the first call and kept in the snapshot.
+    # The first bytes are lead bytes of UTF-8, so that the search never stops in the middle of a character.
+    tries = snap.byte_trie
+    if tries is None:
+        root = _trie((s.encode("utf-8"), seq) for s, seq in snap.sequences.items())
+        starts = re.compile(b"[" + b"".join(re.escape(bytes((b,))) for b in sorted(root)) + b"]") if root else _NEVER_BYTES
+        tries = snap.byte_trie = root, starts
+    return tries
+
+
+def _combined_pattern(snap: _snapshot.Snapshot) -> Pattern[str]:
+    # The combined pattern of the snapshot's sequences, compiled on the first call and kept in the snapshot
+    pattern = snap.pattern
+    if pattern is None:
+        with phase(SEQUENCE_PATTERN):
+            pattern = re.compile(r"|".join(m.regex for m in sorted(snap.sequences.values(), key=len, reverse=True)))
+        snap.pattern = pattern
+    return pattern
+
+
+def _scan(snap: _snapshot.Snapshot, s: str) -> Iterator[Tuple[EmojiSequence, int, int]]:
+    return _walk(snap.trie, snap.trie_starts, s)
+
+
+def _walk(trie: Dict[Any, Any], starts: Pattern, s: Any) -> Iterator[Tuple[EmojiSequence, int, int]]:
+    # Leftmost-longest matching by the trie, the same matches as `pattern`, whose alternatives are sorted by length.
+    # Each start position is found by one pass of the character class search, and the trie is walked from it
+    # for at most the length of the longest sequence, so that it's linear in the length of the string for any input,
+    # without backtracking over a big alternation.
+    # `s` is a string walked by characters, or a UTF-8 buffer walked by bytes with the trie of `_byte_trie`.
+    search = starts.search
+    n = len(s)
+    m = search(s)
+    while m is not None:
+        i = j = end = m.start()
+        node: Optional[Trie] = trie
+        found = None
+        while j < n:
+            node = node.get(s[j])  # type: ignore[union-attr]
+            if node is None:
+                break
+            j += 1
+            if type(node) is not dict:  # a leaf
+                found, end = node, j
+                break
+            seq = node.get("")
+            if seq is not None:
+                found, end = seq, j
+        if found is None:
+            m = search(s, i + 1)
+        else:
+            yield found, i, end
+            m = search(s, end)
+
+
+def _find(snap: _snapshot.Snapshot, s: str, offsets: Offsets = "code_point") -> Iterator[Tuple[EmojiSequence, int, int]]:
+    # The matches of `_scan`, with offsets in the unit of `offsets`
+    if offsets == "code_point":
+        return _scan(snap, s)
+    try:
+        encoding, width = _OFFSET_ENCODINGS[offsets]
+    except KeyError:
+        raise ValueError(f"Argument `offsets` expects 'code_point', 'utf-16' or 'utf-8', but actual is {offsets!r}") from None
+    if s.isascii():
+        return _scan(snap, s)
+    return _recount(_scan(snap, s), s, encoding, width)
+
+
+def _recount(
+    matches: Iterator[Tuple[EmojiSequence, int, int]], s: str, encoding: str, width: int
+) -> Iterator[Tuple[EmojiSequence, int, int]]:
+    # Convert code point offsets of the matches to code units of an encoding, as they are found.
+    # Each piece of the string, between two matches or in a match, is encoded once,
+    # so that it's linear in the length of the string, instead of encoding the prefix before each match.
+    pos = units = 0
+    for seq, start, end in matches:
+        units += _count_units(s[pos:start], encoding, width)
+        begin = units
+        units += _count_units(s[start:end], encoding, width)
+        pos = end
+        yield seq, begin, units
+
+
+def _count_units(s: str, encoding: str, width: int) -> int:
+    # Lone surrogates are kept by "surrogatepass", 2 UTF-16 code units or 3 UTF-8 bytes each
+    return len(s) if s.isascii() else len(s.encode(encoding, "surrogatepass")) // width
+
+
+def _scan_bytes(
+    snap: _snapshot.Snapshot, data: Union[bytes, bytearray, memoryview]
+) -> Iterator[Tuple[EmojiSequence, int, int]]:
+    if isinstance(data, memoryview) and (data.ndim != 1 or data.format != "B"):
+        data = data.cast("B")
+    return _walk(*_byte_trie(snap), data)
+
+
+def _find_ids(snap: _snapshot.Snapshot, s: str, out: Optional[array]) -> array:
+    if out is None:
+        out = array("I")
+    elif out.typecode != "I":
+        raise TypeError(f"Argument `out` expects an array of typecode 'I', but actual is {out.typecode!r}")
+    for seq, start, end in _scan(snap, s):
+        out.extend((seq._index, start, end))
+    return out
+
+
 class MetaClass(BaseDictContainer[str, "EmojiSequence"]):
-    pass
+    @property
+    def __data_dict__(cls) -> Mapping[str, EmojiSequence]:
+        return _snapshot.current.sequences
+
+    @property
+    def pattern(cls) -> Pattern[str]:
+        """Compiled regular expression pattern object for all-together Emoji sequences.
+
+        It's compiled on the first access, and kept in the current snapshot.
+        :meth:`EmojiSequence.find` doesn't use it, but matches the same sequences in linear time.
+        """
+        return _combined_pattern(_snapshot.current)
 
 
 @final
@@ -22,6 +205,17 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
         http://www.unicode.org/reports/tr51/#Emoji_Sequences
     """
 
+    __slots__ = (
+        "_store",
+        "_index",
+        "_string",
+        "_code_points",
+        "_characters",
+        "_regex_pat",
+        "_hex",
+        "_code_points_string",
+    )
+
     def __init__(
         self,
         code_points: Union[int, Iterable[int]],
@@ -31,23 +225,37 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
         description: Optional[str] = None,
     ):
         if isinstance(code_points, Iterable):
-            self._code_points = [int(x) for x in code_points]
+            cps = tuple(int(x) for x in code_points)
         else:
-            self._code_points = [int(code_points)]
-        self._string = "".join(chr(n) for n in self._code_points)
-        self._characters = [EmojiCharacter.from_hex(n) for n in self._code_points]
-        self._type_field = type_field or ""
-        self._version = version or ""
-        self._variation = variation or ""
-        self._description = description or ""
-        # regex
-        self._regex = r""
-        if not self._regex:
-            self._regex = "".join(m.regex for m in self._characters)
-        self._regex_pat = re.compile(self._regex)
+            cps = (int(code_points),)
+        for n in cps:
+            EmojiCharacter.from_hex(n)  # raises KeyError for a non-emoji character
+        # A standalone instance has a store of its own
+        store = SequenceStore()
+        index = store.append(cps, type_field or "", version or "", variation or "", description or "")
+        self._init_view(store, index, "".join(chr(n) for n in cps))
+
+    def _init_view(self, store: SequenceStore, index: int, string: str):
+        self._store = store
+        self._index = index
+        self._string = string
+        # materialized from the store on the first access
+        self._code_points: Optional[Tuple[int, ...]] = None
+        self._characters: Optional[Tuple[EmojiCharacter, ...]] = None
+        # compiled lazily, most sequences never use their own pattern
+        self._regex_pat: Optional[Pattern[str]] = None
+        # derived strings, built on the first access
+        self._hex: Optional[str] = None
+        self._code_points_string: Optional[str] = None
+
+    @classmethod
+    def _from_store(cls, store: SequenceStore, index: int, string: str) -> EmojiSequence:
+        seq = cls.__new__(cls)
+        seq._init_view(store, index, string)
+        return seq
 
     def __len__(self):
-        return len(self._code_points)
+        return self._store.length_of(self._index)
 
     def __str__(self):
         return self._string
@@ -57,62 +265,163 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
             type(self).__name__, self.code_points_string, self.string, self.version, self.description
         )
 
-    pattern: ClassVar[Pattern[str]]
-    """Compiled regular expression pattern object for all-together Emoji sequences.
-    """
-
     @classmethod
-    def initial(cls):
+    def initial(cls, type_fields: Optional[Iterable[str]] = None, variations: bool = True):
         """Initial the class
 
-        Load Emoji Sequences from package data file into class internal dictionary
+        Load Emoji Sequences from package data file into class internal dictionary.
+        Pre-parsed data is read instead if it's available, see :mod:`.packed`.
+
+        Args:
+            type_fields: Only load sequences of these ``type_field`` values from ``emoji-sequences.txt`` and ``emoji-zwj-sequences.txt``,
+                e.g., ``["RGI_Emoji_Flag_Sequence", "Emoji_Keycap_Sequence"]``. All of them are loaded if it's ``None``.
+            variations: Whether to load sequences from ``emoji-variation-sequences.txt``.
+
+        Note:
+            :meth:`find`, :attr:`pattern`, :attr:`id` and :meth:`rgi_keys` only cover the loaded sequences.
+            The class is not reloaded with other filters until it's released, see :meth:`release`.
+
+        The dictionary, store and matcher are built aside, and published together in a new snapshot when they're complete,
+        see :mod:`.snapshot`.
         """
-        if cls.__data_dict__:  # pyright: ignore[reportGeneralTypeIssues]
-            return
+        with _snapshot.lock:
+            if cls.__data_dict__:  # pyright: ignore[reportGeneralTypeIssues]
+                return
+
+            EmojiCharacter.initial()
 
-        EmojiCharacter.initial()
+            with phase(READ):
+                packed = read_packed_data()
+            current = _snapshot.current
+            records = cls._records(packed)
+            _snapshot.publish(current.replace(**cls._build(records, current.characters, type_fields, variations)))
 
+    @classmethod
+    def _records(
+        cls, packed: Optional[PackedData], source: DataSource = None
+    ) -> Iterable[Tuple[str, Sequence[int], str, str, str, str]]:
+        # Records of the packed data, or parsed from the text data files of `source` if it's `None`
+        if packed is None:
+            with phase(PARSE):
+                return list(cls._parse_text(source))
+        return packed.sequences()
+
+    @classmethod
+    def _parse_text(cls, source: DataSource = None) -> Iterator[Tuple[str, Sequence[int], str, str, str, str]]:
+        # Records of (string, code_points, type_field, version, variation, description) in the order of the data files.
+        # Records from emoji-variation-sequences.txt are the ones with a variation.
         for file in ("emoji-sequences.txt", "emoji-zwj-sequences.txt"):
-            for content, comment in emoji_data_lines(file):
+            for content, comment in emoji_data_lines(file, source):
                 cps, type_field, description = (part.strip() for part in content.split(";", 2))
                 version = comment.split(maxsplit=1)[0]
-                cls._decode_code_points(cps, type_field=type_field, version=version, description=description)
-        for content, comment in emoji_data_lines("emoji-variation-sequences.txt"):
+                for code_points in cls._decode_code_points(cps):
+                    yield "".join(map(chr, code_points)), code_points, type_field, version, "", description
+        for content, comment in emoji_data_lines("emoji-variation-sequences.txt", source):
             cps, variation, _ = (part.strip() for part in content.split(";", 2))
             version, description = (x.strip() for x in comment.split(maxsplit=1))
             version = "E" + version.lstrip("(").rstrip(")").strip()
-            cls._decode_code_points(cps, version=version, variation=variation, description=description)
-
-        # build regex
-        cls.pattern = re.compile(
-            r"|".join(
-                m.regex
-                for m in sorted(
-                    (m for m in cls.values()),
-                    key=lambda x: len(x.code_points),
-                    reverse=True,
-                )
-            )
-        )
+            for code_points in cls._decode_code_points(cps):
+                yield "".join(map(chr, code_points)), code_points, "", version, variation, description
 
-    @classmethod
-    def _decode_code_points(cls, cps, **kwargs):
+    @staticmethod
+    def _decode_code_points(cps: str) -> Iterator[Tuple[int, ...]]:
         try:
             head, tail = cps.split("..", 1)  # begin..end form
         except ValueError:
-            _arr_cp = [int(x, 16) for x in cps.split()]
-            seq = cls(_arr_cp, **kwargs)
-            cls[seq.string] = seq
+            yield tuple(int(x, 16) for x in cps.split())
         else:
             # begin..end form: A range of single char emoji-seq
             for cp in range(int(head, 16), 1 + int(tail, 16)):
-                seq = cls(cp, **kwargs)
-                cls[seq.string] = seq
+                yield (cp,)
+
+    @classmethod
+    def _build(
+        cls,
+        records: Iterable[Tuple[str, Sequence[int], str, str, str, str]],
+        characters: Mapping[int, EmojiCharacter],
+        type_fields: Optional[Iterable[str]] = None,
+        variations: bool = True,
+    ) -> Dict[str, Any]:
+        # Fields of a snapshot: the internal dictionary, store, IDs, RGI keys and matcher. It doesn't publish anything.
+        # The sequences are made of the given characters.
+        wanted = None if type_fields is None else frozenset(type_fields)
+        store = SequenceStore()
+        store.characters = characters
+        d: Dict[str, EmojiSequence] = {}
+        by_id: List[Optional[EmojiSequence]] = []
+        # IDs are row indices of the store, assigned in the order that keys first appear in the data files,
+        # a sequence defined again by a later file replaces the former one's fields but keeps its ID.
+        # Sequences filtered out keep their rows too, so that IDs are the same whatever the filters.
+        rows: Dict[str, int] = {}
+        # All sequences listed in emoji-sequences.txt and emoji-zwj-sequences.txt are RGI,
+        # even if a variation sequence replaces one of them in the dictionary later.
+        rgi_keys = []
+        with phase(SEQUENCE_REGISTRY):
+            for s, code_points, type_field, version, variation, description in records:
+                index = rows.get(s)
+                if index is None:
+                    index = rows[s] = store.append(code_points, type_field, version, variation, description)
+                    by_id.append(None)
+                if variation:
+                    if not variations:
+                        continue
+                elif wanted is None or type_field in wanted:
+                    rgi_keys.append(s)
+                else:
+                    continue
+                if by_id[index] is None:
+                    seq = by_id[index] = cls._from_store(store, index, s)
+                    d[s] = seq
+                store.update(index, type_field, version, variation, description)
+        # build the matcher of `find`, the combined regex is compiled on first access to `pattern`
+        with phase(SEQUENCE_PATTERN):
+            trie, trie_starts = _build_trie(d.items())
+        return {
+            "sequences": MappingProxyType(d),
+            "store": store,
+            "sequences_by_id": tuple(by_id),
+            "rgi_keys": frozenset(rgi_keys),
+            "trie": trie,
+            "trie_starts": trie_starts,
+        }
 
     @classmethod
     def release(cls):
-        cls.__data_dict__.clear()  # pyright: ignore[reportGeneralTypeIssues]
-        cls.pattern = re.compile(r"")
+        empty = _snapshot.EMPTY
+        with _snapshot.lock:
+            _snapshot.publish(
+                _snapshot.current.replace(
+                    sequences=empty.sequences,
+                    store=empty.store,
+                    sequences_by_id=empty.sequences_by_id,
+                    rgi_keys=empty.rgi_keys,
+                    trie=empty.trie,
+                    trie_starts=empty.trie_starts,
+                )
+            )
+
+    @classmethod
+    def freeze(cls):
+        """Mark the loaded data as frozen, until it's released or loaded again.
+
+        The internal dictionary is always read-only, assignment or deletion raises :class:`TypeError`.
+        Attributes computed on first access (:attr:`code_points`, :attr:`characters`, :attr:`hex`, :attr:`code_points_string`
+        and :attr:`regex_pattern` of each sequence, and :attr:`pattern` of the class) are computed now,
+        so that reading them later doesn't write to the objects.
+        """
+        for seq in cls.values():
+            _ = seq.characters, seq.hex, seq.code_points_string, seq.regex_pattern
+        _ = cls.pattern
+        type(cls).freeze(cls)
+
+    @classmethod
+    def store(cls) -> SequenceStore:
+        """Return the columnar storage of all emoji sequences in the class
+
+        Row ``i`` of the store is the emoji sequence whose :attr:`id` is ``i``.
+        It has rows of the sequences filtered out by :meth:`initial` too, which are not loaded.
+        """
+        return _snapshot.current.store
 
     @classmethod
     def items(cls) -> Iterator[Tuple[str, EmojiSequence]]:
@@ -121,7 +430,7 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
         Yields:
             : A key string of an emoji sequence.
         """
-        return ((k, cls[k]) for k in cls)
+        return iter(cls.__data_dict__.items())  # pyright: ignore[reportGeneralTypeIssues]
 
     @classmethod
     def keys(cls) -> Iterator[str]:
@@ -139,7 +448,24 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
         Yields:
             : An emoji sequence instance.
         """
-        return (cls[k] for k in cls)
+        return iter(cls.__data_dict__.values())  # pyright: ignore[reportGeneralTypeIssues]
+
+    @classmethod
+    def rgi_keys(cls) -> FrozenSet[str]:
+        """Return the set of key strings of all RGI emoji sequences in the class.
+
+        They are the sequences listed in ``emoji-sequences.txt`` and ``emoji-zwj-sequences.txt``,
+        but not those only in ``emoji-variation-sequences.txt``.
+
+        See also:
+            https://www.unicode.org/reports/tr51/#def_rgi_set
+        """
+        return _snapshot.current.rgi_keys
+
+    @classmethod
+    def is_rgi(cls, s: str) -> bool:
+        """Test if a string is an RGI emoji sequence, by looking it up in :meth:`rgi_keys`."""
+        return s in _snapshot.current.rgi_keys
 
     @classmethod
     def from_string(cls, s: str) -> "EmojiSequence":
@@ -156,6 +482,27 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
         """
         return cls[s]
 
+    @classmethod
+    def from_id(cls, value: int) -> EmojiSequence:
+        """Get an :class:`EmojiSequence` instance by its dense integer ID.
+
+        Args:
+            value (int): ID of the emoji sequence, see :attr:`id`.
+
+        Returns:
+            An instance retrieved from the class's internal list.
+
+        Raises:
+            KeyError: If there is no emoji sequence with the ID, or it's not loaded because of the filters of :meth:`initial`.
+        """
+        by_id = _snapshot.current.sequences_by_id
+        if value < 0 or value >= len(by_id):
+            raise KeyError(value)
+        seq = by_id[value]
+        if seq is None:
+            raise KeyError(value)
+        return seq
+
     @classmethod
     def from_characters(cls, value: Union[EmojiCharacter, Iterable[EmojiCharacter]]) -> EmojiSequence:
         """Get an :class:`EmojiSequence` instance from :class:`EmojiCharacter` object or list
@@ -211,6 +558,84 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
             )
         return cls.from_characters(EmojiCharacter.from_hex(cp) for cp in cps_array)
 
+    @overload
+    @classmethod
+    def from_string_many(cls, strings: Iterable[str], strict: Literal[True] = True) -> List[EmojiSequence]: ...
+
+    @overload
+    @classmethod
+    def from_string_many(cls, strings: Iterable[str], strict: bool) -> List[Optional[EmojiSequence]]: ...
+
+    @classmethod
+    def from_string_many(cls, strings, strict=True):
+        """Batch version of :meth:`from_string`
+
+        The strings are looked up all together, without a method call per string.
+
+        Args:
+            strings: Emoji strings, e.g., user supplied reaction emojis.
+            strict: Raise :class:`KeyError` for a string not found, or give ``None`` for it if ``False``.
+
+        Returns:
+            A list of :class:`EmojiSequence` instances, each for the string at the same position.
+
+        Raises:
+            KeyError: If ``strict`` and a string is not found in the class's internal dictionary.
+        """
+        return _get_many(_snapshot.current.sequences, strings, strict)
+
+    @overload
+    @classmethod
+    def from_hex_many(
+        cls, values: Iterable[Union[int, str, Iterable[Union[int, str]]]], strict: Literal[True] = True
+    ) -> List[EmojiSequence]: ...
+
+    @overload
+    @classmethod
+    def from_hex_many(
+        cls, values: Iterable[Union[int, str, Iterable[Union[int, str]]]], strict: bool
+    ) -> List[Optional[EmojiSequence]]: ...
+
+    @classmethod
+    def from_hex_many(cls, values, strict=True):
+        """Batch version of :meth:`from_hex`
+
+        Each value is converted to a string, then all the strings are looked up together, see :meth:`from_string_many`.
+
+        Args:
+            values: Code points of the sequences, each of them in any form that :meth:`from_hex` accepts.
+                It may be any iterable, e.g., a list of hex strings like ``"1F44B 1F3FD"``, or a 2-D NumPy integer array.
+            strict: Raise :class:`KeyError` for a sequence not found, or give ``None`` for it if ``False``.
+
+        Returns:
+            A list of :class:`EmojiSequence` instances, each for the value at the same position.
+
+        Raises:
+            KeyError: If ``strict`` and a sequence is not found in the class's internal dictionary.
+        """
+        values = _as_list(values)
+        strings = list(map(code_points_to_string, values))
+        try:
+            return _get_many(_snapshot.current.sequences, strings, strict)
+        except KeyError as e:
+            # report the value as given, rather than the string of it
+            raise KeyError(values[strings.index(e.args[0])]) from None
+
+    @property
+    def id(self) -> Optional[int]:
+        """Dense integer ID of the Emoji Sequence, in the range ``0 <= id < len(EmojiSequence.store())``.
+
+        IDs are assigned in the order that sequences first appear in the package data files,
+        so they are reproducible across processes as long as the data files are the same,
+        whatever the filters of :meth:`initial`: sequences filtered out keep their IDs, and rows in :meth:`store`.
+
+        It's ``None`` for a standalone instance, which is not loaded from the data files.
+        The IDs of the sequences of an :class:`.EmojiDatabase` are the same as the ones loaded into the class from the same data.
+        """
+        if self._store.characters is None:
+            return None
+        return self._index
+
     @property
     def type_field(
         self,
@@ -223,12 +648,12 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
         "RGI_Emoji_ZWJ_Sequence",
     ]:
         """A convenience for parsing the emoji sequence files, and is not intended to be maintained as a property."""
-        return self._type_field  # type: ignore
+        return self._store.type_field_of(self._index)  # type: ignore
 
     @property
     def description(self) -> str:
         """Description"""
-        return self._description
+        return self._store.description_of(self._index)
 
     @property
     def version(self) -> str:
@@ -237,7 +662,7 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
         Example:
             ``E0.0``, ``E0.6``, ``E11.0``
         """
-        return self._version
+        return self._store.version_of(self._index)
 
     @property
     def variation(self) -> Literal["emoji style", "text style", ""]:
@@ -246,12 +671,18 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
         Available for Emoji Variation Sequences for UTS #51.
         Used with Emoji Version 16.0 and subsequent minor revisions (if any).
         """
-        return self._variation  # type: ignore
+        return self._store.variation_of(self._index)  # type: ignore
 
     @property
     def characters(self) -> Sequence[EmojiCharacter]:
-        """List of emoji character objects that make up the emoji sequence."""
-        return list(self._characters)
+        """Emoji character objects that make up the emoji sequence, in an immutable tuple shared with the instance"""
+        if self._characters is None:
+            characters = self._store.characters
+            if characters is None:
+                self._characters = tuple(EmojiCharacter.from_hex(n) for n in self.code_points)
+            else:  # resolved in the data the sequence was loaded with
+                self._characters = tuple(characters[n] for n in self.code_points)
+        return self._characters
 
     @property
     def hex(self) -> str:
@@ -260,7 +691,9 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
         Example:
             ``"0xa9 0xfe0f"``
         """
-        return " ".join(c.hex for c in self.characters)
+        if self._hex is None:
+            self._hex = " ".join(hex(n) for n in self.code_points)
+        return self._hex
 
     @property
     def string(self) -> str:
@@ -270,17 +703,25 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
     @property
     def regex(self) -> str:
         """Regular expression string of the Emoji Sequence"""
-        return self._regex
+        return "".join(code_point_to_regex(n) for n in self.code_points)
 
     @property
-    def regex_pattern(self):
-        """Compiled regular expression pattern of the Emoji Sequence"""
+    def regex_pattern(self) -> Pattern[str]:
+        """Compiled regular expression pattern of the Emoji Sequence
+
+        It's compiled on the first access.
+        """
+        if self._regex_pat is None:
+            with phase(SEQUENCE_REGEX):
+                self._regex_pat = re.compile(self.regex)
         return self._regex_pat
 
     @property
     def code_points(self) -> Sequence[int]:
-        """List of unicode integer value of the characters who make up this Emoji Sequence"""
-        return list(self._code_points)
+        """Unicode integer values of the characters who make up this Emoji Sequence, in an immutable tuple shared with the instance"""
+        if self._code_points is None:
+            self._code_points = self._store.code_points_of(self._index)
+        return self._code_points
 
     @property
     def code_points_string(self) -> str:
@@ -288,10 +729,13 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
 
         eg: ``"00A9 FE0F"``
         """
-        return " ".join(c.code_point_string for c in self.characters)
+        if self._code_points_string is None:
+            self._code_points_string = " ".join(f"{n:04X}" for n in self.code_points)
+        return self._code_points_string
 
     @classmethod
-    def find_all(cls, s: str) -> Sequence[Tuple[EmojiSequence, int, int]]:
+    @_metrics.observed
+    def find_all(cls, s: str, *, offsets: Offsets = "code_point") -> Sequence[Tuple[EmojiSequence, int, int]]:
         """Find all emoji sequences in a string and return them in a list.
 
         Each item in the returned list is the same as the ``yield`` result of :meth:`find`.
@@ -304,14 +748,20 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
 
             [x for x in EmojiSequence.find(s)]
         """
-        return list(cls.find(s))
+        return list(cls.find(s, offsets=offsets))
 
     @classmethod
-    def find(cls, s: str) -> Iterator[Tuple[EmojiSequence, int, int]]:
+    @_metrics.observed
+    def find(cls, s: str, *, offsets: Offsets = "code_point") -> Iterator[Tuple[EmojiSequence, int, int]]:
         """Return an iterator that yields all emoji sequences in a string without storing them all simultaneously.
 
         Args:
             s (str): The string to search for emoji sequences.
+            offsets (str): Unit of the start and end positions:
+
+                - ``"code_point"``: Indices of the string in Python, the default.
+                - ``"utf-16"``: UTF-16 code units, e.g., indices of the same string in JavaScript.
+                - ``"utf-8"``: Bytes of the string encoded in UTF-8.
 
         Yields:
             : A 3-member tuple for each matched emoji sequence, where:
@@ -319,6 +769,70 @@ class EmojiSequence(metaclass=MetaClass):  # pyright: ignore[reportGeneralTypeIs
                 - The first member is the found :class:`EmojiSequence` object.
                 - The second member is the start position of the emoji sequence in the string.
                 - The third member is the end position of the emoji sequence in the string.
+
+        Raises:
+            ValueError: If ``offsets`` is not one of the above.
+
+        Note:
+            Sequences are matched leftmost-longest, the same as :attr:`pattern`.
+            It walks a trie of the loaded sequences instead of running the pattern,
+            and takes time linear in the length of the string for any input:
+            each character is visited at most as many times as the code points of the longest sequence.
+            UTF-16 and UTF-8 offsets are counted along the way, by encoding each piece of the string between the matches once.
+        """
+        yield from _find(_snapshot.current, s, offsets)
+
+    @classmethod
+    @_metrics.observed
+    def find_spans(cls, s: str, *, offsets: Offsets = "code_point") -> List[Tuple[int, int]]:
+        """Find all emoji sequences in a string, and return their ``(start, end)`` positions in a list.
+
+        It's the same as the positions of :meth:`find_all`, see :meth:`find` for the ``offsets`` argument,
+        e.g., the spans of a string sent to JavaScript::
+
+            EmojiSequence.find_spans("Hi 👋🏽!", offsets="utf-16")  # [(3, 7)]
+        """
+        return [(start, end) for _, start, end in _find(_snapshot.current, s, offsets)]
+
+    @classmethod
+    @_metrics.observed
+    def find_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> Iterator[Tuple[EmojiSequence, int, int]]:
+        """Return an iterator that yields all emoji sequences in UTF-8 encoded text, without decoding it.
+
+        Args:
+            data: UTF-8 encoded text, a bytes-like object, e.g., a :class:`memoryview` of an :mod:`mmap`, which is not copied.
+
+        Yields:
+            : The same as :meth:`find`, but the start and end positions are byte offsets in ``data``.
+
+        Note:
+            It walks a trie of the UTF-8 encoded sequences byte by byte, built on its first call after loading.
+            Invalid UTF-8 is not checked, bytes that are not of an encoded sequence are skipped.
+        """
+        yield from _scan_bytes(_snapshot.current, data)
+
+    @classmethod
+    @_metrics.observed(matches=lambda out: len(out) // 3)
+    def find_ids(cls, s: str, out: Optional[array] = None) -> array:
+        """Find all emoji sequences in a string, and write them as compact integer triples into an array.
+
+        For each matched emoji sequence, three unsigned integers ``(id, start, end)`` are appended to the array, where:
+
+        - ``id`` is the :attr:`id` of the found :class:`EmojiSequence` object.
+        - ``start`` is the start position of the emoji sequence in the string.
+        - ``end`` is the end position of the emoji sequence in the string.
+
+        Args:
+            s (str): The string to search for emoji sequences.
+            out (array): An :class:`array.array` of typecode ``"I"`` to append the triples to.
+                A new one is created if it's ``None``.
+
+        Returns:
+            The array that the triples were appended to.
+
+        Tip:
+            The returned array can be viewed as a NumPy ``uint32`` buffer of shape ``(n, 3)`` without copying::
+
+                numpy.frombuffer(EmojiSequence.find_ids(s), dtype=numpy.uint32).reshape(-1, 3)
         """
-        for m in cls.pattern.finditer(s):
-            yield cls.from_string(m.group()), m.start(), m.end()
+        return _find_ids(_snapshot.current, s, out)
@@ -0,0 +1,242 @@
+"""Packed lookup tables of emoji data, shared by processes through shared memory or a memory-mapped file
+
+Each process that loads emoji data holds its own copy of the character properties and sequence keys.
+Instead, one process may :meth:`~SharedTables.publish` packed tables into a :class:`multiprocessing.shared_memory.SharedMemory` segment or a file,
+and any number of local processes :meth:`~SharedTables.attach` to it read-only.
+Lookups of the attached tables read straight from the mapping, without loading or copying emoji data.
+
+Note:
+    The tables are a separate lookup API, of only character properties, sequence keys and whether they are RGI.
+    :class:`.EmojiCharacter`, :class:`.EmojiSequence` and the predicates of :mod:`.definitions` don't read them,
+    a process that calls those has to load emoji data itself (see :func:`.load_emoji_data`).
+    To share fully loaded emoji data with forked workers instead, see :func:`.freeze_emoji_data`.
+
+Example:
+    ::
+
+        # in the master process
+        from emoji_data import load_emoji_data
+        from emoji_data.shared import SharedTables
+
+        load_emoji_data()
+        tables = SharedTables.publish("emoji-tables")
+
+        # in worker processes
+        from emoji_data import EmojiCharProperty
+        from emoji_data.shared import SharedTables
+
+        tables = SharedTables.attach("emoji-tables")
+        tables.has_property("👍", EmojiCharProperty.EBASE)  # True
+        "👍🏿" in tables  # True
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from multiprocessing import shared_memory
+from os import PathLike
+from typing import Any, Optional, Tuple, Union
+
+from .character import PROPERTY_BITS, EmojiCharacter, EmojiCharProperty
+from .sequence import EmojiSequence
+
+__all__ = ["SharedTables"]
+
+_MAGIC = b"EMJT"
+_FORMAT_VERSION = 1
+_BYTE_ORDER = 1 if sys.byteorder == "little" else 2
+# magic, format version, byte order, count of property ranges, count of sequence keys, bytes of sequence keys
+_HEADER = struct.Struct("=4sIIIII")
+
+_KEY_RGI = 1
+
+
+def _pack() -> bytes:
+    # Character properties: contiguous ranges of the same property bits, covering all code points from 0.
+    starts, bits = array("I", [0]), array("I", [0])
+    prev_cp = -1
+    for cp in sorted(EmojiCharacter.keys()):
+        b = 0
+        for p in EmojiCharacter[cp].properties:
+            b |= PROPERTY_BITS[p]
+        if cp != prev_cp + 1 and bits[-1]:  # close the previous range before a gap
+            starts.append(prev_cp + 1)
+            bits.append(0)
+        if b != bits[-1]:
+            if starts[-1] == cp:
+                bits[-1] = b
+            else:
+                starts.append(cp)
+                bits.append(b)
+        prev_cp = cp
+    if bits[-1]:
+        starts.append(prev_cp + 1)
+        bits.append(0)
+    # Sequence keys: UTF-32-BE encoded, so that byte order is code point order, sorted for binary search.
+    rgi = EmojiSequence.rgi_keys()
+    keys = sorted((k.encode("utf-32-be"), _KEY_RGI if k in rgi else 0) for k in EmojiSequence.keys())
+    key_offsets = array("I", [0])
+    for k, _ in keys:
+        key_offsets.append(key_offsets[-1] + len(k))
+    blob = b"".join(k for k, _ in keys)
+    flags = bytes(f for _, f in keys)
+    header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, _BYTE_ORDER, len(starts), len(keys), len(blob))
+    return b"".join((header, starts.tobytes(), bits.tobytes(), key_offsets.tobytes(), blob, flags))
+
+
+class SharedTables:
+    """Read-only packed lookup tables of emoji character properties and emoji sequence keys
+
+    Don't instantiate it directly, use :meth:`publish`, :meth:`publish_file`, :meth:`attach` or :meth:`attach_file`.
+    """
+
+    def __init__(self, buffer: memoryview, owner: Any = None, shm: Optional[shared_memory.SharedMemory] = None):
+        self._owner = owner
+        self._shm = shm
+        magic, fmt, byte_order, n_ranges, n_keys, blob_size = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or fmt != _FORMAT_VERSION:
+            raise ValueError("Not a packed emoji tables buffer, or of an unsupported format version")
+        if byte_order != _BYTE_ORDER:
+            raise ValueError("Packed emoji tables buffer is of a different byte order")
+        self._buf = buffer.toreadonly()
+        pos = _HEADER.size
+        self._starts = self._buf[pos : pos + 4 * n_ranges].cast("I")
+        pos += 4 * n_ranges
+        self._bits = self._buf[pos : pos + 4 * n_ranges].cast("I")
+        pos += 4 * n_ranges
+        self._key_offsets = self._buf[pos : pos + 4 * (n_keys + 1)].cast("I")
+        pos += 4 * (n_keys + 1)
+        self._keys = self._buf[pos : pos + blob_size]
+        pos += blob_size
+        self._key_flags = self._buf[pos : pos + n_keys]
+        self._n_keys = n_keys
+
+    @classmethod
+    def publish(cls, name: Optional[str] = None) -> SharedTables:
+        """Pack the loaded emoji data into a new shared memory segment.
+
+        :class:`.EmojiCharacter` and :class:`.EmojiSequence` **MUST** be loaded first, see :func:`.load_emoji_data`.
+
+        Args:
+            name: Name of the segment. A random one is generated if it's ``None``, see :attr:`name`.
+
+        Returns:
+            Tables on the segment. The publisher owns the segment, and should :meth:`close` it with ``unlink=True`` when it's not needed anymore.
+        """
+        data = _pack()
+        shm = shared_memory.SharedMemory(name, create=True, size=len(data))
+        buf = memoryview(shm.buf)  # type: ignore[arg-type]
+        buf[: len(data)] = data
+        return cls(buf[: len(data)], shm, shm)
+
+    @classmethod
+    def publish_file(cls, path: Union[str, PathLike]):
+        """Pack the loaded emoji data into a file, to be memory-mapped by :meth:`attach_file`.
+
+        :class:`.EmojiCharacter` and :class:`.EmojiSequence` **MUST** be loaded first, see :func:`.load_emoji_data`.
+        """
+        with open(path, "wb") as fp:
+            fp.write(_pack())
+
+    @classmethod
+    def attach(cls, name: str) -> SharedTables:
+        """Attach to a shared memory segment published by :meth:`publish`, read-only."""
+        if sys.version_info >= (3, 13):  # pragma: no cover
+            shm = shared_memory.SharedMemory(name, track=False)
+        else:  # pragma: no cover
+            shm = shared_memory.SharedMemory(name)
+            # Before Python 3.13, the resource tracker unlinks the segment when an attached process exits.
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        return cls(memoryview(shm.buf), shm)  # type: ignore[arg-type]
+
+    @classmethod
+    def attach_file(cls, path: Union[str, PathLike]) -> SharedTables:
+        """Memory-map a file written by :meth:`publish_file`, read-only."""
+        with open(path, "rb") as fp:
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(memoryview(mm), mm)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self, unlink: bool = False):
+        """Release the mapping.
+
+        Args:
+            unlink: Also destroy the shared memory segment. Only the publisher should do it.
+        """
+        for mv in (self._starts, self._bits, self._key_offsets, self._keys, self._key_flags, self._buf):
+            mv.release()
+        if self._owner is not None:
+            self._owner.close()
+        if unlink and self._shm is not None:
+            self._shm.unlink()
+
+    @property
+    def name(self) -> Optional[str]:
+        """Name of the shared memory segment, ``None`` for a memory-mapped file"""
+        return None if self._shm is None else self._shm.name
+
+    def __len__(self) -> int:
+        """Count of emoji sequence keys"""
+        return self._n_keys
+
+    def property_bits(self, c: Union[str, int]) -> int:
+        """Get the property bitmask of a character, whose bits are defined in :data:`.PROPERTY_BITS`.
+
+        Args:
+            c: A single character, or its code point.
+        """
+        cp = ord(c) if isinstance(c, str) else c
+        return self._bits[bisect_right(self._starts, cp) - 1]  # type: ignore[arg-type]
+
+    def properties(self, c: Union[str, int]) -> Tuple[EmojiCharProperty, ...]:
+        """Get the properties of a character, the same as :attr:`.EmojiCharacter.properties` but in the order of :class:`.EmojiCharProperty`.
+
+        Args:
+            c: A single character, or its code point.
+        """
+        b = self.property_bits(c)
+        return tuple(p for p, bit in PROPERTY_BITS.items() if b & bit)
+
+    def has_property(self, c: Union[str, int], prop: EmojiCharProperty) -> bool:
+        """Test a property of a character.
+
+        Args:
+            c: A single character, or its code point.
+            prop: The property to test.
+        """
+        return bool(self.property_bits(c) & PROPERTY_BITS[prop])
+
+    def _find_key(self, s: str) -> int:
+        key = s.encode("utf-32-be", "surrogatepass")
+        offsets, keys = self._key_offsets, self._keys
+        lo, hi = 0, self._n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            k = keys[offsets[mid] : offsets[mid + 1]].tobytes()
+            if k < key:
+                lo = mid + 1
+            elif k > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def __contains__(self, s: object) -> bool:
+        """Test if a string is a key of :class:`.EmojiSequence`."""
+        return isinstance(s, str) and self._find_key(s) >= 0
+
+    def is_rgi(self, s: str) -> bool:
+        """Test if a string is an RGI emoji sequence, the same as :meth:`.EmojiSequence.is_rgi`."""
+        i = self._find_key(s)
+        return i >= 0 and bool(self._key_flags[i] & _KEY_RGI)
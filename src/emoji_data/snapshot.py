@@ -0,0 +1,126 @@
+"""Immutable snapshots of loaded emoji data
+
+All the data built by loading (the internal dictionaries of :class:`.EmojiCharacter` and :class:`.EmojiSequence`,
+the store, IDs, RGI keys and matcher of sequences, and the patterns of :mod:`.definitions`) is held by a :class:`Snapshot`,
+which is never modified after it's published.
+
+Loading and releasing build a new snapshot off to the side, then publish it by a single assignment of :data:`current`.
+Readers take :data:`current` once per call, and use that snapshot all through the call,
+so that they see either the old data or the new data, but never a mix of them or a half-built one,
+even with free-threaded CPython builds running them in parallel.
+
+Note:
+    Some attributes are computed on their first access, e.g., :attr:`.EmojiSequence.pattern` and :attr:`.EmojiSequence.characters`.
+    Threads racing on the first access may compute them more than once, but they always store equal values.
+    :func:`.freeze_emoji_data` computes them all in advance.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Mapping, Optional, Pattern, Sequence, Tuple, final
+
+from .store import SequenceStore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .character import EmojiCharacter
+    from .sequence import EmojiSequence
+
+__all__ = ["Snapshot", "EMPTY", "current", "publish", "lock"]
+
+NEVER = re.compile(r"(?!)")
+"""A pattern that never matches"""
+
+
+@final
+class Snapshot:
+    """Loaded emoji data, read-only once it's published
+
+    Don't instantiate it directly, loading functions build it. Use :meth:`replace` to derive a new one.
+    """
+
+    __slots__ = (
+        "characters",
+        "sequences",
+        "store",
+        "sequences_by_id",
+        "rgi_keys",
+        "trie",
+        "trie_starts",
+        "patterns",
+        "character_bits",
+        "character_classes",
+        "sequence_starts",
+        "frozen",
+        "pattern",
+        "byte_trie",
+        "__weakref__",
+    )
+
+    def __init__(self) -> None:
+        self.characters: Mapping[int, EmojiCharacter] = MappingProxyType({})
+        """Internal dictionary of :class:`.EmojiCharacter`, keyed by code point"""
+        self.sequences: Mapping[str, EmojiSequence] = MappingProxyType({})
+        """Internal dictionary of :class:`.EmojiSequence`, keyed by string"""
+        self.store = SequenceStore()
+        """Columnar storage of the sequences, see :meth:`.EmojiSequence.store`"""
+        self.sequences_by_id: Sequence[Optional[EmojiSequence]] = ()
+        """Sequences by :attr:`.EmojiSequence.id`, ``None`` for the filtered out ones"""
+        self.rgi_keys: FrozenSet[str] = frozenset()
+        """See :meth:`.EmojiSequence.rgi_keys`"""
+        self.trie: Dict[str, Any] = {}
+        """Matcher of :meth:`.EmojiSequence.find`"""
+        self.trie_starts: Pattern[str] = NEVER
+        """Character class of the first characters of the sequences"""
+        self.patterns: Mapping[str, Pattern[str]] = MappingProxyType({})
+        """Compiled patterns of :mod:`.definitions`"""
+        self.character_bits: Mapping[str, int] = MappingProxyType({})
+        """Property bits of each emoji character, for the state machine of :mod:`.definitions`"""
+        self.character_classes: Mapping[str, int] = MappingProxyType({})
+        """Class of each character in the state machine of :mod:`.definitions`"""
+        self.sequence_starts: Pattern[str] = NEVER
+        """Character class of the characters that may start an emoji sequence"""
+        self.frozen = False
+        """Whether it's frozen by :func:`.freeze_emoji_data`"""
+        self.pattern: Optional[Pattern[str]] = None
+        """Combined pattern of all the sequences, compiled on the first access of :attr:`.EmojiSequence.pattern`"""
+        self.byte_trie: Optional[Tuple[Dict[Any, Any], Pattern[bytes]]] = None
+        """Matcher of :meth:`.EmojiSequence.find_bytes` and the class of its first bytes, built on its first call"""
+
+    def replace(self, **changes: Any) -> Snapshot:
+        """Return a copy with some of the fields replaced, leaving this snapshot unchanged.
+
+        The combined :attr:`pattern` and the :attr:`byte_trie` are dropped if the sequences are replaced,
+        and the copy is not :attr:`frozen`.
+        """
+        changes.setdefault("frozen", False)
+        if "sequences" in changes:
+            changes.setdefault("pattern", None)
+            changes.setdefault("byte_trie", None)
+        new = Snapshot.__new__(Snapshot)
+        for name in Snapshot.__slots__[:-1]:
+            setattr(new, name, changes.pop(name) if name in changes else getattr(self, name))
+        if changes:
+            raise TypeError(f"Unknown snapshot fields: {sorted(changes)}")
+        return new
+
+
+EMPTY = Snapshot()
+"""The snapshot of nothing loaded"""
+
+current: Snapshot = EMPTY
+"""The published snapshot, read by all the classes and functions of the package"""
+
+lock = threading.RLock()
+"""Serializes loading and releasing, each of which reads :data:`current`, builds a new snapshot and publishes it.
+
+Readers never take it.
+"""
+
+
+def publish(snapshot: Snapshot):
+    """Make a snapshot the :data:`current` one, by a single reference assignment"""
+    global current
+    current = snapshot
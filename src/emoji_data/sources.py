@@ -0,0 +1,227 @@
+"""Sources of the Unicode® emoji data files
+
+Loading reads the data files (see :data:`.SOURCE_DATA_FILES`) and the packed binary data file (see :mod:`.packed`)
+from the package's ``data`` directory by default.
+A :data:`DataSource` tells where to read them from instead, it's any of:
+
+- A path of a directory.
+- A path of a zip or tar archive, whose top level members are read at once, see :func:`archive_source`.
+- A :class:`zipfile.ZipFile` or :class:`tarfile.TarFile`, the same.
+- A :class:`importlib.resources.abc.Traversable` of a directory, e.g., ``importlib.resources.files("my_package") / "emoji"``.
+- A mapping of file names to in-memory buffers (``bytes``, ``bytearray``, ``memoryview`` or ``str``), see :class:`BufferSource`.
+- A callable taking a file name and returning a binary file-like object, see :class:`ProviderSource`.
+
+Example:
+    ::
+
+        from emoji_data import EmojiDatabase, load_emoji_data
+
+        load_emoji_data(source="/path/to/emoji-17.0.zip")
+        db = EmojiDatabase.load({"emoji-data.txt": data, "emoji-sequences.txt": ..., ...})
+        db = EmojiDatabase.load(lambda name: s3.open(f"emoji/17.0/{name}", "rb"))
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tarfile
+import zipfile
+from os import PathLike
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Mapping, Union, final
+
+if sys.version_info < (3, 9):  # pragma: no cover
+    import importlib_resources  # type: ignore[import-not-found]
+else:  # pragma: no cover
+    import importlib.resources as importlib_resources
+
+__all__ = ["DataSource", "BufferSource", "ProviderSource", "archive_source", "data_source"]
+
+Buffer = Union[bytes, bytearray, memoryview, str]
+"""Content of an in-memory data file, ``str`` is encoded in UTF-8"""
+
+DataSource = Union[
+    str,
+    "PathLike[str]",
+    "zipfile.ZipFile",
+    "tarfile.TarFile",
+    Mapping[str, Buffer],
+    Callable[[str], BinaryIO],
+    Any,  # Traversable
+]
+"""Where to read the data files from, see the module's documentation"""
+
+
+@final
+class _BufferResource:
+    # A Traversable-like file of a BufferSource
+    __slots__ = ("_buffers", "name")
+
+    def __init__(self, buffers: Mapping[str, Buffer], name: str):
+        self._buffers = buffers
+        self.name = name
+
+    def is_file(self) -> bool:
+        return self.name in self._buffers
+
+    def is_dir(self) -> bool:
+        return False
+
+    def buffer(self) -> memoryview:
+        """The content without copying it"""
+        try:
+            buffer = self._buffers[self.name]
+        except KeyError:
+            raise FileNotFoundError(self.name) from None
+        return memoryview(buffer.encode("utf-8") if isinstance(buffer, str) else buffer)
+
+    def read_bytes(self) -> bytes:
+        buffer = self._buffers.get(self.name)
+        if isinstance(buffer, bytes):
+            return buffer
+        return self.buffer().tobytes()
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        buffer = self._buffers.get(self.name)
+        if isinstance(buffer, str):
+            return buffer
+        return str(self.buffer(), encoding)
+
+
+@final
+class BufferSource:
+    """Data files in memory, read from a mapping of file names to buffers
+
+    The buffers are not copied, ``bytes`` and ``memoryview`` ones (e.g., of an :mod:`mmap`) are read in place.
+    """
+
+    __slots__ = ("_buffers",)
+
+    def __init__(self, buffers: Mapping[str, Buffer]):
+        self._buffers = buffers
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {sorted(self._buffers)!r}>"
+
+    def joinpath(self, name: str) -> _BufferResource:
+        return _BufferResource(self._buffers, name)
+
+    def is_dir(self) -> bool:
+        return True
+
+    def iterdir(self) -> Iterator[_BufferResource]:
+        return (_BufferResource(self._buffers, name) for name in self._buffers)
+
+
+@final
+class _ProvidedResource:
+    # A Traversable-like file of a ProviderSource
+    __slots__ = ("_provider", "name")
+
+    def __init__(self, provider: Callable[[str], BinaryIO], name: str):
+        self._provider = provider
+        self.name = name
+
+    def is_file(self) -> bool:
+        try:
+            fp = self._provider(self.name)
+        except (FileNotFoundError, KeyError):
+            return False
+        if fp is None:  # e.g., `TarFile.extractfile` of a directory
+            return False
+        fp.close()
+        return True
+
+    def is_dir(self) -> bool:
+        return False
+
+    def read_bytes(self) -> bytes:
+        fp = self._provider(self.name)
+        if fp is None:
+            raise FileNotFoundError(self.name)
+        with fp:
+            return fp.read()
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        return self.read_bytes().decode(encoding)
+
+
+@final
+class ProviderSource:
+    """Data files read from a callable, which takes a file name and returns a binary file-like object
+
+    The file object is closed after reading. The callable raises :class:`FileNotFoundError` or :class:`KeyError`,
+    or returns ``None``, for a missing file.
+    """
+
+    __slots__ = ("_provider",)
+
+    def __init__(self, provider: Callable[[str], BinaryIO]):
+        self._provider = provider
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self._provider!r}>"
+
+    def joinpath(self, name: str) -> _ProvidedResource:
+        return _ProvidedResource(self._provider, name)
+
+    def is_dir(self) -> bool:
+        return True
+
+
+def archive_source(archive: Union[str, PathLike, zipfile.ZipFile, tarfile.TarFile], at: str = "") -> BufferSource:
+    """Read all the files of a zip or tar archive at once into memory.
+
+    Args:
+        archive: Path of the archive file, or an opened :class:`zipfile.ZipFile` or :class:`tarfile.TarFile`, which is left open.
+        at: Directory of the data files in the archive, e.g., ``"emoji/17.0/"``. They are at the top level if it's empty.
+
+    Returns:
+        The files directly in the directory, without the ones in its subdirectories.
+    """
+    prefix = at.rstrip("/") + "/" if at else ""
+    buffers: Dict[str, bytes] = {}
+    if isinstance(archive, zipfile.ZipFile):
+        for info in archive.infolist():
+            name = info.filename[len(prefix) :]
+            if info.filename.startswith(prefix) and name and "/" not in name and not info.is_dir():
+                buffers[name] = archive.read(info)
+    elif isinstance(archive, tarfile.TarFile):
+        for member in archive.getmembers():
+            name = member.name[len(prefix) :]
+            if member.name.startswith(prefix) and name and "/" not in name and member.isfile():
+                fp = archive.extractfile(member)
+                if fp is not None:
+                    with fp:
+                        buffers[name] = fp.read()
+    elif zipfile.is_zipfile(archive):
+        with zipfile.ZipFile(archive) as zf:
+            return archive_source(zf, at)
+    else:
+        with tarfile.open(archive) as tf:
+            return archive_source(tf, at)
+    return BufferSource(buffers)
+
+
+def data_source(source: DataSource = None):
+    """Return a :class:`importlib.resources.abc.Traversable` like object of the data files of a source
+
+    Args:
+        source: See :data:`DataSource`. It's the package's ``data`` directory if ``None``.
+    """
+    if source is None:
+        return importlib_resources.files(__package__).joinpath("data")
+    if isinstance(source, (str, PathLike)):
+        if os.path.isfile(source):
+            return archive_source(source)
+        return Path(source)
+    if isinstance(source, (zipfile.ZipFile, tarfile.TarFile)):
+        return archive_source(source)
+    if isinstance(source, Mapping):
+        return BufferSource(source)
+    if hasattr(source, "joinpath"):  # Traversable, BufferSource or ProviderSource
+        return source
+    if callable(source):
+        return ProviderSource(source)
+    raise TypeError(f"Argument `source` expects a data source, but actual is {type(source)}")
@@ -0,0 +1,131 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+__all__ = ["SequenceStore"]
+
+
+class _Names:
+    """A small table of distinct strings, encoded as integer codes"""
+
+    __slots__ = ("names", "_codes")
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def encode(self, name: str) -> int:
+        try:
+            return self._codes[name]
+        except KeyError:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+            return code
+
+
+class SequenceStore:
+    """Columnar storage of emoji sequences
+
+    Code points of all the sequences are stored one after another in a single contiguous :class:`array.array`,
+    and the sequence at row ``i`` takes ``code_points[offsets[i]:offsets[i+1]]``.
+    The low-cardinality string fields (``type_field``, ``version`` and ``variation``) are stored in parallel arrays of small integer codes, which index into tables of their distinct values.
+
+    :class:`.EmojiSequence` objects are thin views into a row of the store.
+    The arrays can be viewed by NumPy without copying, e.g., ``numpy.frombuffer(store.code_points, dtype=numpy.uint32)``.
+    """
+
+    __slots__ = (
+        "code_points",
+        "offsets",
+        "type_fields",
+        "versions",
+        "variations",
+        "descriptions",
+        "characters",
+        "_type_field_names",
+        "_version_names",
+        "_variation_names",
+    )
+
+    def __init__(self):
+        self.code_points = array("I")
+        """Code points of all the sequences, one after another"""
+        self.offsets = array("I", [0])
+        """Start offsets of each sequence in :attr:`code_points`, followed by the end offset of the last one"""
+        self.type_fields = array("B")
+        """Codes of ``type_field`` of each sequence, see :attr:`type_field_names`"""
+        self.versions = array("B")
+        """Codes of ``version`` of each sequence, see :attr:`version_names`"""
+        self.variations = array("B")
+        """Codes of ``variation`` of each sequence, see :attr:`variation_names`"""
+        self.descriptions: List[str] = []
+        """Description of each sequence"""
+        self.characters: Optional[Mapping[int, Any]] = None
+        """Emoji characters that the sequences are made of, keyed by code point, or ``None`` if the store is not a loaded one"""
+        self._type_field_names = _Names()
+        self._version_names = _Names()
+        self._variation_names = _Names()
+
+    def __len__(self) -> int:
+        return len(self.descriptions)
+
+    @property
+    def type_field_names(self) -> List[str]:
+        """Distinct ``type_field`` values, indexed by codes in :attr:`type_fields`"""
+        return self._type_field_names.names
+
+    @property
+    def version_names(self) -> List[str]:
+        """Distinct ``version`` values, indexed by codes in :attr:`versions`"""
+        return self._version_names.names
+
+    @property
+    def variation_names(self) -> List[str]:
+        """Distinct ``variation`` values, indexed by codes in :attr:`variations`"""
+        return self._variation_names.names
+
+    def append(
+        self, code_points: Iterable[int], type_field: str = "", version: str = "", variation: str = "", description: str = ""
+    ) -> int:
+        """Append a sequence as a new row
+
+        Returns:
+            Index of the new row
+        """
+        self.code_points.extend(code_points)
+        self.offsets.append(len(self.code_points))
+        self.type_fields.append(self._type_field_names.encode(type_field))
+        self.versions.append(self._version_names.encode(version))
+        self.variations.append(self._variation_names.encode(variation))
+        self.descriptions.append(description)
+        return len(self.descriptions) - 1
+
+    def update(self, index: int, type_field: str = "", version: str = "", variation: str = "", description: str = ""):
+        """Replace fields other than code points of the row at ``index``"""
+        self.type_fields[index] = self._type_field_names.encode(type_field)
+        self.versions[index] = self._version_names.encode(version)
+        self.variations[index] = self._variation_names.encode(variation)
+        self.descriptions[index] = description
+
+    def length_of(self, index: int) -> int:
+        """Number of code points of the row at ``index``"""
+        return self.offsets[index + 1] - self.offsets[index]
+
+    def code_points_of(self, index: int) -> Tuple[int, ...]:
+        """Code points of the row at ``index``"""
+        return tuple(self.code_points[self.offsets[index] : self.offsets[index + 1]])
+
+    def type_field_of(self, index: int) -> str:
+        """``type_field`` of the row at ``index``"""
+        return self._type_field_names.names[self.type_fields[index]]
+
+    def version_of(self, index: int) -> str:
+        """``version`` of the row at ``index``"""
+        return self._version_names.names[self.versions[index]]
+
+    def variation_of(self, index: int) -> str:
+        """``variation`` of the row at ``index``"""
+        return self._variation_names.names[self.variations[index]]
+
+    def description_of(self, index: int) -> str:
+        """``description`` of the row at ``index``"""
+        return self.descriptions[index]
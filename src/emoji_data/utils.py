@@ -1,28 +1,31 @@
-import sys
-from typing import Iterable, Iterator, Tuple, Union
+from typing import Iterable, Iterator, List, Tuple, Union
 
-if sys.version_info < (3, 9):  # pragma: no cover
-    import importlib_resources  # type: ignore[import-not-found]
-else:  # pragma: no cover
-    import importlib.resources as importlib_resources
+from .profiling import READ, phase
+from .sources import DataSource, data_source
 
+__all__ = ["emoji_data_lines", "code_points_to_string", "code_point_to_regex", "code_points_to_character_class"]
 
-__all__ = ["emoji_data_lines", "code_points_to_string", "code_point_to_regex"]
 
+def emoji_data_lines(data_file: str, source: DataSource = None) -> Iterator[Tuple[str, str]]:
+    """Iterate over ``(content, comment)`` of the data lines of a Unicode® emoji data file, skipping blank and comment lines
 
-def emoji_data_lines(data_file: str) -> Iterator[Tuple[str, str]]:
-    with importlib_resources.files(__package__).joinpath("data").joinpath(data_file).open(encoding="utf-8") as fp:
-        for line in fp:
-            line = line.strip()
-            if not line or line[0] in "#;":
-                continue
-            parts = [s.strip() for s in line.split("#", 1)]
-            content = parts[0]
-            try:
-                comment = parts[1]
-            except IndexError:
-                comment = ""
-            yield content, comment
+    Args:
+        data_file: Name of the data file, e.g., ``"emoji-data.txt"``.
+        source: Where to read the data file from, the package's data directory if ``None``, see :data:`.DataSource`.
+    """
+    with phase(READ):
+        text = data_source(source).joinpath(data_file).read_text(encoding="utf-8")
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        parts = [s.strip() for s in line.split("#", 1)]
+        content = parts[0]
+        try:
+            comment = parts[1]
+        except IndexError:
+            comment = ""
+        yield content, comment
 
 
 def code_points_to_string(code_points: Union[int, str, Iterable[Union[int, str]]]) -> str:
@@ -35,3 +38,19 @@ def code_points_to_string(code_points: Union[int, str, Iterable[Union[int, str]]
 
 def code_point_to_regex(code_point: int) -> str:
     return rf"\U{code_point:08X}" if code_point > 0xFFFF else rf"\u{code_point:04X}"
+
+
+def code_points_to_character_class(code_points: Iterable[int]) -> str:
+    """Regular expression character class of the code points, e.g., ``"[\\u0023\\u0030-\\u0039]"``
+
+    Consecutive code points are written as ranges, since :mod:`re` tests a long list of single characters one by one.
+    """
+    ranges: List[List[int]] = []
+    for cp in sorted(set(code_points)):
+        if ranges and ranges[-1][1] == cp - 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return "[{}]".format(
+        "".join(code_point_to_regex(a) if a == b else f"{code_point_to_regex(a)}-{code_point_to_regex(b)}" for a, b in ranges)
+    )
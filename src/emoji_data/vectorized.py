@@ -0,0 +1,148 @@
+"""NumPy vectorized classification of code points
+
+Convert strings to ``uint32`` code point arrays, and classify every code point by :class:`.EmojiCharProperty` bitmasks through a lookup table, without a Python loop per character.
+
+Note:
+    - This module requires `NumPy <https://numpy.org/>`_, which is an optional dependency of the package (``pip install emoji-data[numpy]``).
+      It is not imported by the top-level package, import it explicitly as ``emoji_data.vectorized``.
+    - :meth:`.EmojiCharacter.initial` **MUST** be called first before building the lookup table.
+
+Example:
+    ::
+
+        from emoji_data import EmojiCharProperty, load_emoji_data
+        from emoji_data.vectorized import has_property, property_masks
+
+        load_emoji_data()
+        masks = property_masks("Hi 👋🏽!")
+        has_property(masks, EmojiCharProperty.EMOD)  # array([False, False, False, False,  True, False])
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from . import snapshot as _snapshot
+from .character import PROPERTY_BITS, EmojiCharacter, EmojiCharProperty
+
+__all__ = [
+    "PROPERTY_BITS",
+    "code_points",
+    "code_points_batch",
+    "property_table",
+    "release_property_table",
+    "property_masks",
+    "property_masks_batch",
+    "has_property",
+]
+
+_MAX_CODE_POINT = 0x10FFFF
+
+_PROPERTY_TABLE: Optional[Tuple[Mapping[int, EmojiCharacter], np.ndarray]] = None
+"""The cached lookup table, and the internal dictionary of characters it was built from"""
+
+
+def code_points(s: str) -> np.ndarray:
+    """Convert a string to an array of its code points.
+
+    Args:
+        s: The string to convert.
+
+    Returns:
+        A 1-D ``uint32`` array, whose length is ``len(s)``.
+    """
+    return np.frombuffer(s.encode("utf-32-le", "surrogatepass"), dtype="<u4").astype(np.uint32, copy=False)
+
+
+def code_points_batch(strings: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert a batch of strings to one concatenated array of code points.
+
+    Args:
+        strings: The strings to convert.
+
+    Returns:
+        A 2-member tuple, where:
+
+        - The first member is a 1-D ``uint32`` array of the code points of all the strings, concatenated.
+        - The second member is a 1-D ``intp`` array of ``n + 1`` offsets for ``n`` strings,
+          code points of the ``i``-th string are ``cps[offsets[i]:offsets[i+1]]``.
+    """
+    strings = list(strings)
+    offsets = np.zeros(len(strings) + 1, dtype=np.intp)
+    np.cumsum(np.fromiter((len(s) for s in strings), dtype=np.intp, count=len(strings)), out=offsets[1:])
+    return code_points("".join(strings)), offsets
+
+
+def property_table() -> np.ndarray:
+    """Get the lookup table of emoji character properties.
+
+    The table is built from :class:`.EmojiCharacter` data on the first call, and cached then.
+    It's built again after emoji data is reloaded.
+
+    Returns:
+        A read-only 1-D ``uint8`` array indexed by code point (``0`` to ``0x10FFFF``),
+        each value is the bitwise OR of :data:`.PROPERTY_BITS` of the character's properties.
+    """
+    global _PROPERTY_TABLE
+    characters = _snapshot.current.characters
+    cached = _PROPERTY_TABLE
+    if cached is not None and cached[0] is characters:
+        return cached[1]
+    table = np.zeros(_MAX_CODE_POINT + 1, dtype=np.uint8)
+    for p, bit in PROPERTY_BITS.items():
+        cps = np.fromiter((c.code_point for c in characters.values() if p in c.properties), dtype=np.intp)
+        table[cps] |= bit
+    table.flags.writeable = False
+    if characters:
+        _PROPERTY_TABLE = characters, table
+    return table
+
+
+def release_property_table():
+    """Release the cached lookup table of :func:`property_table`"""
+    global _PROPERTY_TABLE
+    _PROPERTY_TABLE = None
+
+
+def property_masks(value: Union[str, np.ndarray]) -> np.ndarray:
+    """Get emoji character property bitmasks of each code point.
+
+    Args:
+        value: A string, or an integer array of code points.
+
+    Returns:
+        A ``uint8`` array of the same shape as the code points, whose bits are defined in :data:`.PROPERTY_BITS`.
+    """
+    cps = code_points(value) if isinstance(value, str) else np.asarray(value)
+    return property_table()[cps]
+
+
+def property_masks_batch(strings: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Get emoji character property bitmasks of each code point in a batch of strings.
+
+    Args:
+        strings: The strings to classify.
+
+    Returns:
+        A 2-member tuple, where:
+
+        - The first member is a 1-D ``uint8`` array of bitmasks for the concatenated code points of all the strings.
+        - The second member is the offsets array, the same as :func:`code_points_batch`.
+    """
+    cps, offsets = code_points_batch(strings)
+    return property_table()[cps], offsets
+
+
+def has_property(masks: np.ndarray, prop: EmojiCharProperty) -> np.ndarray:
+    """Test a property on bitmasks returned by :func:`property_masks`.
+
+    Args:
+        masks: Bitmasks array.
+        prop: The property to test.
+
+    Returns:
+        A boolean array of the same shape as ``masks``.
+    """
+    return (masks & PROPERTY_BITS[prop]) != 0
@@ -1,4 +1,5 @@
 import unittest
+from array import array
 
 from emoji_data import EmojiCharacter, EmojiCharProperty, code_points_to_string, emoji_data_lines
 from emoji_data.definitions import (
@@ -37,6 +38,21 @@ class CharacterTestCase(unittest.TestCase):
             s = code_points_to_string(code_points)
             self.assertTrue(all(ord(c) in EmojiCharacter for c in s))
 
+    def test_from_hex_many(self):
+        values = [0x1F600, 0x23, 0x41, 0x1F44B]
+        self.assertListEqual(
+            EmojiCharacter.from_hex_many(values, strict=False),
+            [EmojiCharacter.from_hex(0x1F600), EmojiCharacter.from_hex(0x23), None, EmojiCharacter.from_hex(0x1F44B)],
+        )
+        expected = [EmojiCharacter.from_hex(0x1F600), EmojiCharacter.from_hex(0x23)]
+        self.assertListEqual(EmojiCharacter.from_hex_many(array("I", [0x1F600, 0x23])), expected)
+        self.assertListEqual(EmojiCharacter.from_hex_many(["1F600", "0023"]), expected)
+        self.assertListEqual(EmojiCharacter.from_hex_many(c for c in (0x1F600, 0x23)), expected)
+        self.assertListEqual(EmojiCharacter.from_hex_many([]), [])
+        with self.assertRaises(KeyError) as ctx:
+            EmojiCharacter.from_hex_many(["1F600", "0041"])
+        self.assertEqual(ctx.exception.args, ("0041",))
+
     def test_character_properties(self):
         # 测试特定字符的属性
         # 测试区域指示符
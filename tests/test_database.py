@@ -0,0 +1,89 @@
+import shutil
+import unittest
+from array import array
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from emoji_data import EmojiCharacter, EmojiDatabase, EmojiSequence, SequenceKind, load_emoji_data, snapshot, unload_emoji_data
+from emoji_data.packed import SOURCE_DATA_FILES
+from emoji_data.sources import data_source
+
+
+class DatabaseTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = EmojiDatabase.load()
+
+    def tearDown(self):
+        unload_emoji_data()
+
+    def test_independent(self):
+        self.assertEqual(len(EmojiSequence), 0)
+        self.assertEqual(len(EmojiCharacter), 0)
+        self.assertIn("😀", self.db.sequences)
+        self.assertIn(0x1F600, self.db.characters)
+        self.assertTrue(self.db.patterns)
+        load_emoji_data()
+        self.assertIsNot(EmojiSequence.from_string("😀"), self.db.sequences["😀"])
+        self.assertEqual(len(EmojiSequence), len(self.db.sequences))
+        self.assertEqual(EmojiSequence.rgi_keys(), self.db.rgi_keys)
+
+    def test_characters_of_own_database(self):
+        seq = self.db.sequences["👋🏽"]
+        self.assertEqual(len(EmojiCharacter), 0)
+        self.assertTrue(all(c is self.db.characters[c.code_point] for c in seq.characters))
+
+    def test_find(self):
+        text = "Hi 👋🏽 and 👨‍👩‍👧!"
+        found = self.db.find_all(text)
+        self.assertListEqual([(m.string, i, j) for m, i, j in found], [("👋🏽", 3, 5), ("👨‍👩‍👧", 10, 15)])
+        self.assertListEqual(list(self.db.find(text)), found)
+        ids = self.db.find_ids(text)
+        self.assertEqual(ids, array("I", [found[0][0].id, 3, 5, found[1][0].id, 10, 15]))  # type: ignore[list-item]
+        self.assertIs(self.db.from_id(ids[0]), found[0][0])
+        self.assertTrue(self.db.pattern.fullmatch("👋🏽"))
+        self.assertListEqual(EmojiSequence.find_all(text), [])
+        self.assertListEqual(self.db.find_spans(text, offsets="utf-16"), [(3, 7), (12, 20)])
+        self.assertListEqual(list(self.db.find_bytes(text.encode())), self.db.find_all(text, offsets="utf-8"))
+        self.assertListEqual(list(EmojiSequence.find_bytes(text.encode())), [])
+
+    def test_classify_sequence(self):
+        self.assertIn(SequenceKind.EMOJI_ZWJ_SEQUENCE, self.db.classify_sequence("👨‍👩‍👧"))
+        self.assertTrue(self.db.is_rgi("👨‍👩‍👧"))
+        self.assertFalse(self.db.is_rgi("a"))
+
+    def test_base_shares_pieces(self):
+        flags = EmojiDatabase.load(type_fields=["RGI_Emoji_Flag_Sequence"], variations=False, base=self.db)
+        self.assertIs(flags.characters, self.db.characters)
+        self.assertIs(flags.patterns, self.db.patterns)
+        self.assertIn("🇨🇳", flags.sequences)
+        self.assertNotIn("😀", flags.sequences)
+        self.assertEqual(flags.sequences["🇨🇳"].id, self.db.sequences["🇨🇳"].id)
+        # The base keeps all of its sequences
+        self.assertIn("😀", self.db.sequences)
+
+    def test_data_dir(self):
+        with TemporaryDirectory() as tmp:
+            for name in SOURCE_DATA_FILES:
+                shutil.copyfile(str(data_source().joinpath(name)), Path(tmp, name))
+            db = EmojiDatabase.load(tmp)
+        self.assertEqual(db.sequences.keys(), self.db.sequences.keys())
+        self.assertEqual(db.characters.keys(), self.db.characters.keys())
+
+    def test_publish_and_default(self):
+        default = EmojiDatabase.default()
+        self.assertIs(EmojiDatabase.default(), default)
+        self.assertEqual(len(default.sequences), 0)
+        self.db.publish()
+        self.assertIs(snapshot.current, self.db.snapshot)
+        self.assertIs(EmojiSequence.from_string("😀"), self.db.sequences["😀"])
+        self.assertIs(default.sequences, self.db.sequences)
+        # A database wrapping a snapshot keeps it after the default one changes
+        kept = EmojiDatabase(snapshot.current)
+        unload_emoji_data()
+        self.assertEqual(len(default.sequences), 0)
+        self.assertIn("😀", kept.sequences)
+
+
+if __name__ == "__main__":
+    unittest.main()
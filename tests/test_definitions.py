@@ -1,12 +1,23 @@
 import unittest
 
 from emoji_data import (
+    EmojiSequence,
+    code_points_to_string,
+    emoji_data_lines,
     load_emoji_data,
     unload_emoji_data,
 )
 from emoji_data.definitions import (
     QualifiedType,
+    SequenceKind,
+    are_rgi_emoji_sequences,
+    cache_clear,
+    cache_info,
+    classify_sequence,
     detect_qualified,
+    disable_cache,
+    enable_cache,
+    find_emoji_sequences,
     get_emoji_patterns,
     initial_emoji_patterns,
     is_basic_emoji_character,
@@ -23,10 +34,13 @@ from emoji_data.definitions import (
     is_emoji_presentation_selector,
     is_emoji_presentation_sequence,
     is_emoji_sequence,
+    is_emoji_tag_sequence,
     is_emoji_zwj_element,
     is_emoji_zwj_sequence,
     is_extended_pictographic_character,
     is_regional_indicator,
+    is_rgi_emoji_sequence,
+    is_tag_base,
     is_tag_spec,
     is_tag_term,
     is_text_presentation_selector,
@@ -161,6 +175,15 @@ class DefinitionsTestCase(unittest.TestCase):
         # 由于标签序列比较特殊，我们暂时跳过详细测试
         pass
 
+    def test_is_emoji_tag_sequence_rgi(self):
+        s = "🏴󠁧󠁢󠁥󠁮󠁧󠁿"  # England: black flag, 5 tag_spec, tag_end
+        self.assertTrue(is_emoji_tag_sequence(s))
+        self.assertTrue(is_rgi_emoji_sequence(s))
+        self.assertFalse(is_emoji_tag_sequence(s[0] + s[-1]))  # no tag_spec
+        self.assertFalse(is_emoji_tag_sequence(s[:-1]))  # no tag_end
+        self.assertFalse(is_emoji_tag_sequence(s[1:]))  # no tag_base
+        self.assertTrue(is_tag_base("👍🏿"))
+
     def test_is_emoji_keycap_sequence(self):
         # 测试按键序列
         self.assertTrue(is_emoji_keycap_sequence("1️⃣"))
@@ -232,6 +255,93 @@ class DefinitionsTestCase(unittest.TestCase):
         zwj_sequence = "👨‍👩‍👧"
         self.assertEqual(detect_qualified(zwj_sequence), QualifiedType.FULLY_QUALIFIED)
 
+    def test_is_rgi_emoji_sequence(self):
+        for s in ("😀", "☺️", "1️⃣", "🇺🇸", "👍🏿", "👨‍👩‍👧", "🏴󠁧󠁢󠁥󠁮󠁧󠁿", "🏻"):
+            self.assertTrue(is_rgi_emoji_sequence(s), s)
+        # well-formed, but not RGI
+        for s in ("😀‍😀", "🇦🇦", "☺"):
+            self.assertFalse(is_rgi_emoji_sequence(s), s)
+            self.assertTrue(classify_sequence(s), s)
+        # text style variation sequence is not RGI
+        self.assertIn("☺︎", EmojiSequence)
+        self.assertFalse(is_rgi_emoji_sequence("☺︎"))
+        for code_points, status in (
+            (x.strip() for x in content.split(";", 1)) for content, _ in emoji_data_lines("emoji-test.txt")
+        ):
+            s = code_points_to_string(code_points)
+            self.assertEqual(is_rgi_emoji_sequence(s), status in ("fully-qualified", "component"), s)
+
+    def test_are_rgi_emoji_sequences(self):
+        self.assertListEqual(are_rgi_emoji_sequences(["😀", "a", "😀‍😀", "👍🏿"]), [True, False, False, True])
+        self.assertListEqual(are_rgi_emoji_sequences([]), [])
+
+    def test_classify_sequence(self):
+        self.assertEqual(classify_sequence(""), SequenceKind(0))
+        self.assertEqual(classify_sequence("abc"), SequenceKind(0))
+        kinds = classify_sequence("👍🏿")
+        self.assertIn(SequenceKind.EMOJI_MODIFIER_SEQUENCE, kinds)
+        self.assertIn(SequenceKind.EMOJI_CORE_SEQUENCE, kinds)
+        self.assertNotIn(SequenceKind.EMOJI_ZWJ_SEQUENCE, kinds)
+        self.assertEqual(classify_sequence("👨‍👩‍👧"), SequenceKind.EMOJI_ZWJ_SEQUENCE | SequenceKind.EMOJI_SEQUENCE)
+
+    def test_classify_sequence_cross_check(self):
+        # classify_sequence must agree with the regular expressions
+        patterns = get_emoji_patterns()
+        samples = set()
+        for content, _ in emoji_data_lines("emoji-test.txt"):
+            s = code_points_to_string(content.split(";", 1)[0])
+            samples.update((s, s[:-1], s[1:], s + "\u200d", "\u200d" + s, s + "\ufe0e", s + "\U000e0061\U000e007f"))
+        for s in sorted(samples):
+            kinds = classify_sequence(s)
+            for kind in SequenceKind:
+                if kind == SequenceKind.BASIC_EMOJI:
+                    continue
+                self.assertEqual(
+                    kind in kinds,
+                    patterns[kind.name].fullmatch(s) is not None,
+                    f"{kind} of {s!r}({' '.join(f'{ord(c):04X}' for c in s)})",
+                )
+
+    def test_find_emoji_sequences(self):
+        self.assertListEqual(list(find_emoji_sequences("")), [])
+        self.assertListEqual(list(find_emoji_sequences("abc 123 © ☺︎")), [])
+        self.assertListEqual(list(find_emoji_sequences("1©", text_default=True)), [("1", 0, 1), ("©", 1, 2)])
+        # RGI and non-RGI but well-formed sequences
+        s = "x👍🏿y👨‍👩‍👧🦖‍🔥🇦🇦🇦#️⃣🏴\U000e0061\U000e0062\U000e007f"
+        self.assertListEqual(
+            [t for t, _, _ in find_emoji_sequences(s)],
+            ["👍🏿", "👨‍👩‍👧", "🦖‍🔥", "🇦🇦", "🇦", "#️⃣", "🏴\U000e0061\U000e0062\U000e007f"],
+        )
+        for t, i, j in find_emoji_sequences(s):
+            self.assertEqual(s[i:j], t)
+        keys = [k for k in EmojiSequence.rgi_keys() if len(k) > 1]
+        self.assertListEqual([t for t, _, _ in find_emoji_sequences(" ".join(keys))], keys)
+
+    def test_find_emoji_sequences_cross_check(self):
+        # find_emoji_sequences must find the leftmost-longest full matches of the regular expression
+        patterns = get_emoji_patterns()
+        sequence, text = patterns["EMOJI_SEQUENCE"], patterns["TEXT_PRESENTATION_SEQUENCE"]
+
+        def find(s):
+            i = 0
+            while i < len(s):
+                if text.match(s, i):
+                    i += 2
+                    continue
+                end = max((j for j in range(i + 1, len(s) + 1) if sequence.fullmatch(s, i, j)), default=i)
+                if end > i:
+                    yield s[i:end], i, end
+                    i = end
+                else:
+                    i += 1
+
+        strings = []
+        for content, _ in emoji_data_lines("emoji-test.txt"):
+            strings.append(code_points_to_string(content.split(";", 1)[0]))
+        for sep in ("", " ", "\u200d", "\ufe0e", "\ufe0f", "\U000e0061", "\U000e007f", "\U0001f3fb", "\U0001f1e6"):
+            s = sep.join(strings[::97])
+            self.assertListEqual(list(find_emoji_sequences(s, text_default=True)), list(find(s)), repr(sep))
+
     def test_edge_cases(self):
         # 测试异常处理
         with self.assertRaises((TypeError, AttributeError)):
@@ -240,5 +350,54 @@ class DefinitionsTestCase(unittest.TestCase):
             is_emoji_character(123)  # type: ignore
 
 
+class CacheTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_emoji_data()
+
+    def setUp(self):
+        enable_cache(maxsize=2)
+
+    def tearDown(self):
+        disable_cache()
+
+    @classmethod
+    def tearDownClass(cls):
+        unload_emoji_data()
+
+    def test_disabled(self):
+        disable_cache()
+        self.assertDictEqual(dict(cache_info()), {})
+        self.assertTrue(is_emoji_zwj_sequence("👨‍👩‍👧"))
+
+    def test_hits_misses_evictions(self):
+        for s in ("😀", "😀", "👨‍👩‍👧", "😀", "🇺🇸", "👨‍👩‍👧"):
+            self.assertTrue(is_emoji_sequence(s))
+            self.assertIs(detect_qualified(s), QualifiedType.FULLY_QUALIFIED)
+        for info in cache_info().values():
+            self.assertEqual((info.hits, info.misses, info.evictions, info.maxsize, info.currsize), (2, 4, 2, 2, 2))
+
+    def test_cached_results(self):
+        for s in ("😀", "a", "😀‍😀", "☺", "1️⃣", ""):
+            expected = classify_sequence(s)
+            self.assertEqual(classify_sequence(s), expected)
+            self.assertEqual(classify_sequence(s), expected)
+        self.assertIs(detect_qualified("☺"), QualifiedType.UNQUALIFIED)
+        self.assertIs(detect_qualified("☺"), QualifiedType.UNQUALIFIED)
+
+    def test_cache_clear(self):
+        is_emoji_sequence("😀")
+        cache_clear()
+        self.assertEqual(cache_info()["classify_sequence"], (0, 0, 0, 2, 0))
+        is_emoji_sequence("😀")
+        release_emoji_patterns()
+        self.assertEqual(cache_info()["classify_sequence"].currsize, 0)
+        initial_emoji_patterns()
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            enable_cache(0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,145 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from emoji_data import (
+    EmojiCharacter,
+    EmojiSequence,
+    freeze_emoji_data,
+    get_emoji_patterns,
+    is_emoji_character,
+    is_emoji_flag_sequence,
+    is_emoji_modifier,
+    load_emoji_data,
+    snapshot,
+    unload_emoji_data,
+)
+
+# Load emoji data (frozen or not) in a parent process, then fork a child who runs a garbage collection and reads the data.
+# The child prints kB of its private memory growth.
+FORK_SCRIPT = """
+import gc, os, sys
+
+from emoji_data import EmojiSequence, load_emoji_data
+
+
+def private_kb():
+    total = 0
+    with open("/proc/self/smaps_rollup") as fp:
+        for line in fp:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+load_emoji_data(freeze=sys.argv[1] == "1")
+r, w = os.pipe()
+pid = os.fork()
+if pid == 0:
+    before = private_kb()
+    gc.collect()
+    for m in EmojiSequence.values():
+        m.string
+    os.write(w, str(private_kb() - before).encode())
+    os._exit(0)
+os.waitpid(pid, 0)
+print(os.read(r, 64).decode())
+"""
+
+
+class FreezeTestCase(unittest.TestCase):
+    def tearDown(self):
+        unload_emoji_data()
+
+    def test_read_only(self):
+        load_emoji_data(freeze=True)
+        self.assertTrue(EmojiCharacter.frozen)
+        self.assertTrue(EmojiSequence.frozen)
+        m = EmojiSequence.from_string("😀")
+        with self.assertRaises(TypeError):
+            EmojiSequence[m.string] = m
+        with self.assertRaises(TypeError):
+            del EmojiCharacter[0x1F600]
+        self.assertEqual([x[0] for x in EmojiSequence.find_all("a😀b")], [m])
+        self.assertIs(EmojiSequence.from_id(m.id), m)  # type: ignore[arg-type]
+
+    def test_lazy_attributes(self):
+        load_emoji_data(freeze=True)
+        for seq in EmojiSequence.values():
+            for name in ("_code_points", "_characters", "_hex", "_code_points_string", "_regex_pat"):
+                self.assertIsNotNone(getattr(seq, name), name)
+        self.assertIsNotNone(snapshot.current.pattern)
+
+    def test_unload_after_freeze(self):
+        load_emoji_data()
+        freeze_emoji_data()
+        unload_emoji_data()
+        self.assertFalse(EmojiSequence.frozen)
+        self.assertEqual(len(EmojiSequence), 0)
+        load_emoji_data()
+        self.assertFalse(EmojiSequence.frozen)
+        self.assertIn("😀", EmojiSequence)
+
+    @unittest.skipUnless(
+        hasattr(os, "fork") and os.path.exists("/proc/self/smaps_rollup"), "requires fork() and Linux /proc/self/smaps_rollup"
+    )
+    def test_private_memory_after_fork(self):
+        growth = {}
+        for freeze in (False, True):
+            output = subprocess.run(
+                [sys.executable, "-c", FORK_SCRIPT, str(int(freeze))], check=True, capture_output=True, text=True
+            ).stdout
+            growth[freeze] = int(output)
+        # Without freezing, a collection in the child process touches every tracked object of the data.
+        self.assertLess(growth[True], growth[False])
+
+
+class SelectiveLoadTestCase(unittest.TestCase):
+    def tearDown(self):
+        unload_emoji_data()
+
+    def test_type_fields(self):
+        type_fields = {"RGI_Emoji_Flag_Sequence", "Emoji_Keycap_Sequence"}
+        load_emoji_data()
+        expected = [k for k in EmojiSequence.rgi_keys() if EmojiSequence[k].type_field in type_fields]
+        ids = {k: EmojiSequence[k].id for k in expected}
+        n_rows = len(EmojiSequence.store())
+        unload_emoji_data()
+
+        load_emoji_data(type_fields=type_fields, variations=False, patterns=["EMOJI_CHARACTER"])
+        self.assertGreater(len(EmojiSequence), 0)
+        self.assertCountEqual(EmojiSequence.keys(), expected)
+        self.assertSetEqual(EmojiSequence.rgi_keys(), set(expected))
+        # IDs are the same as of a full load, and the ones filtered out are not found
+        self.assertDictEqual({k: EmojiSequence[k].id for k in expected}, ids)
+        self.assertEqual(len(EmojiSequence.store()), n_rows)
+        self.assertIs(EmojiSequence.from_id(ids["🇨🇳"]), EmojiSequence["🇨🇳"])  # type: ignore[arg-type]
+        with self.assertRaises(KeyError):
+            EmojiSequence.from_id(next(i for i in range(n_rows) if i not in ids.values()))
+        self.assertListEqual([m.string for m, _, _ in EmojiSequence.find("😀🇨🇳#️⃣©️")], ["🇨🇳", "#️⃣"])
+        self.assertListEqual(list(get_emoji_patterns()), ["EMOJI_CHARACTER"])
+        self.assertTrue(is_emoji_character("😀"))
+        self.assertTrue(is_emoji_flag_sequence("🇨🇳"))
+        with self.assertRaises(KeyError):
+            is_emoji_modifier("🏿")
+
+    def test_variations_only(self):
+        load_emoji_data(type_fields=[])
+        self.assertGreater(len(EmojiSequence), 0)
+        self.assertTrue(all(m.variation for m in EmojiSequence.values()))
+        self.assertSetEqual(EmojiSequence.rgi_keys(), set())
+
+    def test_characters_only(self):
+        load_emoji_data(sequences=False)
+        self.assertEqual(len(EmojiSequence), 0)
+        self.assertGreater(len(EmojiCharacter), 0)
+        self.assertTrue(is_emoji_modifier("🏿"))
+
+    def test_unknown_pattern(self):
+        with self.assertRaises(ValueError):
+            load_emoji_data(patterns=["NO_SUCH_PATTERN"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import unittest
+from importlib import import_module
+
+import emoji_data
+
+# Print modules newly imported by `import emoji_data` in a fresh interpreter
+IMPORT_SCRIPT = """
+import sys
+
+before = set(sys.modules)
+import emoji_data
+
+print(" ".join(sorted(set(sys.modules) - before)))
+"""
+
+
+class LazyImportTestCase(unittest.TestCase):
+    def test_names(self):
+        for module, names in emoji_data._LAZY_NAMES.items():
+            self.assertListEqual(names, import_module(f"emoji_data.{module}").__all__, module)
+
+    def test_attributes(self):
+        from emoji_data.character import EmojiCharacter
+        from emoji_data.definitions import is_emoji_character
+
+        self.assertIs(emoji_data.EmojiCharacter, EmojiCharacter)
+        self.assertIs(emoji_data.is_emoji_character, is_emoji_character)
+        self.assertIn("EmojiSequence", dir(emoji_data))
+        with self.assertRaises(AttributeError):
+            emoji_data.no_such_name  # type: ignore[attr-defined]
+
+    def test_star_import(self):
+        namespace: dict = {}
+        exec("from emoji_data import *", namespace)
+        self.assertIn("load_emoji_data", namespace)
+        self.assertIn("__version__", namespace)
+
+    def test_import_cost(self):
+        output = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], check=True, capture_output=True, text=True).stdout
+        imported = set(output.split())
+        self.assertIn("emoji_data", imported)
+        # Neither submodules nor heavy standard modules are imported until a public name is accessed.
+        for name in ("emoji_data.character", "emoji_data.definitions", "re", "enum", "typing", "importlib.resources"):
+            self.assertNotIn(name, imported)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from emoji_data import (
+    EmojiSequence,
+    QualifiedType,
+    are_rgi_emoji_sequences,
+    detect_qualified,
+    find_emoji_sequences,
+    is_emoji_character,
+    is_emoji_flag_sequence,
+    is_qualified_emoji_character,
+    load_emoji_data,
+    unload_emoji_data,
+)
+from emoji_data.metrics import CallMetrics, MetricsAggregator, get_metrics_sink, set_metrics_sink
+
+
+class MetricsTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_emoji_data()
+
+    @classmethod
+    def tearDownClass(cls):
+        unload_emoji_data()
+
+    def setUp(self):
+        self.aggregator = MetricsAggregator()
+        set_metrics_sink(self.aggregator)
+
+    def tearDown(self):
+        set_metrics_sink(None)
+
+    def test_disabled(self):
+        set_metrics_sink(None)
+        self.assertIsNone(get_metrics_sink())
+        self.assertTrue(is_emoji_character("😀"))
+        self.assertEqual(len(EmojiSequence.find_all("😀a😀")), 2)
+        self.assertDictEqual(self.aggregator.snapshot(), {})
+
+    def test_predicates(self):
+        self.assertTrue(is_emoji_character("😀"))
+        self.assertFalse(is_emoji_character("a"))
+        self.assertTrue(is_emoji_flag_sequence("🇨🇳"))
+        self.assertTrue(is_qualified_emoji_character("a😀", 1))
+        self.assertIs(detect_qualified("☺"), QualifiedType.UNQUALIFIED)
+        self.assertIs(detect_qualified("☺️"), QualifiedType.FULLY_QUALIFIED)
+        snapshot = self.aggregator.snapshot()
+        # Functions called inside an observed one are not reported on their own
+        self.assertSetEqual(
+            set(snapshot), {"is_emoji_character", "is_emoji_flag_sequence", "is_qualified_emoji_character", "detect_qualified"}
+        )
+        self.assertEqual(snapshot["is_emoji_character"][:3], (2, 2, 1))
+        self.assertEqual(snapshot["is_emoji_flag_sequence"][:3], (1, 2, 1))
+        self.assertEqual(snapshot["detect_qualified"][:3], (2, 3, 1))
+        self.assertTrue(all(m.seconds > 0 for m in snapshot.values()))
+
+    def test_find(self):
+        s = "hi 😀 and 👨‍👩‍👧!"
+        self.assertEqual(len(EmojiSequence.find_all(s)), 2)
+        self.assertEqual(len(list(EmojiSequence.find(s))), 2)
+        it = EmojiSequence.find(s)
+        next(it)
+        it.close()
+        snapshot = self.aggregator.snapshot()
+        self.assertSetEqual(set(snapshot), {"EmojiSequence.find_all", "EmojiSequence.find"})
+        self.assertEqual(snapshot["EmojiSequence.find_all"][:3], (1, len(s), 2))
+        self.assertEqual(snapshot["EmojiSequence.find"][:3], (2, 2 * len(s), 3))
+
+    def test_batch_and_ids(self):
+        s = "hi 😀 and 👨‍👩‍👧!"
+        self.assertEqual(len(EmojiSequence.find_ids(s)), 6)
+        self.assertEqual(are_rgi_emoji_sequences(iter(["😀", "a", "🇨🇳"])), [True, False, True])
+        self.assertEqual(len(list(find_emoji_sequences(s=s, text_default=True))), 2)
+        snapshot = self.aggregator.snapshot()
+        self.assertSetEqual(set(snapshot), {"EmojiSequence.find_ids", "are_rgi_emoji_sequences", "find_emoji_sequences"})
+        self.assertEqual(snapshot["EmojiSequence.find_ids"][:3], (1, len(s), 2))
+        self.assertEqual(snapshot["are_rgi_emoji_sequences"][:3], (1, 3, 2))
+        self.assertEqual(snapshot["find_emoji_sequences"][:3], (1, len(s), 2))
+
+    def test_wrapped(self):
+        self.assertEqual(is_emoji_character.__name__, "is_emoji_character")
+        self.assertIn("emoji character", is_emoji_character.__doc__)  # type: ignore[operator]
+
+    def test_custom_sink(self):
+        received = []
+        set_metrics_sink(received.append)
+        is_emoji_flag_sequence("🇨🇳")
+        self.assertEqual(len(received), 1)
+        self.assertIsInstance(received[0], CallMetrics)
+        self.assertEqual(received[0].function, "is_emoji_flag_sequence")
+        self.aggregator.reset()
+        self.assertDictEqual(self.aggregator.snapshot(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import sys
+import unittest
+import unittest.mock
+from importlib.resources import files
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from emoji_data import EmojiCharacter, EmojiSequence
+from emoji_data import snapshot as _snapshot
+from emoji_data.database import _build_snapshot
+from emoji_data.packed import (
+    PACKED_DATA_FILE,
+    TABLES_MODULE,
+    PackedData,
+    pack_emoji_data,
+    read_packed_data,
+    source_digest,
+    source_sizes,
+    write_tables_module,
+)
+
+
+def snapshot():
+    characters = [(c.code_point, c.properties, c.version, c.description) for c in EmojiCharacter.values()]
+    sequences = [
+        (seq.id, seq.string, seq.code_points, seq.type_field, seq.version, seq.variation, seq.description)
+        for seq in EmojiSequence.values()
+    ]
+    return characters, sequences, EmojiSequence.rgi_keys()
+
+
+class PackedDataTestCase(unittest.TestCase):
+    def tearDown(self):
+        EmojiSequence.release()
+        EmojiCharacter.release()
+
+    def test_up_to_date(self):
+        packed = read_packed_data()
+        self.assertIsNotNone(packed)
+        self.assertEqual(packed.digest, source_digest())  # type: ignore[union-attr]
+        self.assertEqual(packed.sizes, source_sizes())  # type: ignore[union-attr]
+        shipped = files("emoji_data").joinpath("data").joinpath(PACKED_DATA_FILE).read_bytes()
+        self.assertEqual(pack_emoji_data(), shipped, "run scripts/download.py or write_packed_data() to regenerate it")
+
+    def test_pack_keeps_loaded(self):
+        EmojiSequence.initial()
+        expected = snapshot()
+        pack_emoji_data()
+        self.assertEqual(snapshot(), expected)
+
+    def test_same_as_text(self):
+        _snapshot.publish(_build_snapshot(_snapshot.EMPTY, None, patterns=[]))
+        expected = snapshot()
+        EmojiSequence.release()
+        EmojiCharacter.release()
+        EmojiSequence.initial()
+        self.assertEqual(snapshot(), expected)
+
+    def test_tables_module(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp, f"{TABLES_MODULE}.py")
+            write_tables_module(path)
+            spec = spec_from_file_location(f"emoji_data.{TABLES_MODULE}", path)
+            module = module_from_spec(spec)  # type: ignore[arg-type]
+            spec.loader.exec_module(module)  # type: ignore[union-attr]
+        packed = read_packed_data()
+        tables = PackedData.from_module(module)
+        self.assertEqual(tables.digest, packed.digest)  # type: ignore[union-attr]
+        self.assertListEqual(list(tables.characters()), list(packed.characters()))  # type: ignore[union-attr]
+        self.assertListEqual(list(tables.sequences()), list(packed.sequences()))  # type: ignore[union-attr]
+        # The tables module is preferred to the packed binary data file when it's importable
+        sys.modules[module.__name__] = module
+        try:
+            self.assertIs(read_packed_data()._characters, module.CHARACTERS)  # type: ignore[union-attr]
+            # and isn't kept imported after it's read
+            self.assertNotIn(module.__name__, sys.modules)
+        finally:
+            sys.modules.pop(module.__name__, None)
+
+    def test_stale(self):
+        packed = read_packed_data()
+        packed.sizes = tuple(n + 1 for n in packed.sizes)  # type: ignore[union-attr]
+        with (
+            unittest.mock.patch("emoji_data.packed._read_tables_module", return_value=packed),
+            unittest.mock.patch("emoji_data.packed._read_packed_file", return_value=packed),
+        ):
+            self.assertIsNone(read_packed_data())
+            self.assertIs(read_packed_data(check=False), packed)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            PackedData.from_buffer(memoryview(bytes(128)))
+
+
+if __name__ == "__main__":
+    unittest.main()
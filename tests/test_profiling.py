@@ -0,0 +1,67 @@
+import json
+import time
+import unittest
+
+from emoji_data import EmojiCharacter, EmojiSequence, load_emoji_data, reset_stats, stats, unload_emoji_data
+from emoji_data.profiling import PARSE, PHASES, READ, phase
+
+
+class StatsTestCase(unittest.TestCase):
+    def setUp(self):
+        reset_stats()
+
+    def tearDown(self):
+        unload_emoji_data()
+
+    def test_phases(self):
+        load_emoji_data()
+        phases = stats(memory=False).phases
+        self.assertListEqual(list(phases), list(PHASES))
+        self.assertGreaterEqual(phases["read"].calls, 1)
+        for name in ("character_registry", "sequence_registry", "definitions_patterns", "sequence_pattern"):
+            self.assertEqual(phases[name].calls, 1, name)
+            self.assertGreater(phases[name].seconds, 0, name)
+        self.assertEqual(phases["sequence_regex"].calls, 0)
+        m = EmojiSequence.from_string("😀")
+        m.regex_pattern
+        m.regex_pattern
+        self.assertEqual(stats(memory=False).phases["sequence_regex"].calls, 1)
+        reset_stats()
+        self.assertTrue(all(p.calls == 0 and p.seconds == 0 for p in stats(memory=False).phases.values()))
+
+    def test_parse_text(self):
+        EmojiCharacter._build(None)
+        phases = stats(memory=False).phases
+        self.assertEqual(phases["parse"].calls, 1)
+        self.assertEqual(phases["read"].calls, 1)
+        self.assertEqual(phases["character_registry"].calls, 1)
+
+    def test_nested(self):
+        with phase(PARSE):
+            with phase(READ):
+                time.sleep(0.05)
+        phases = stats(memory=False).phases
+        self.assertGreaterEqual(phases["read"].seconds, 0.05)
+        self.assertLess(phases["parse"].seconds, 0.05)
+
+    def test_registries(self):
+        self.assertTrue(all(r.objects == 0 for r in stats().registries.values()))
+        load_emoji_data()
+        report = stats()
+        self.assertEqual(report.registries["EmojiCharacter"].objects, len(EmojiCharacter))
+        self.assertEqual(report.registries["EmojiSequence"].objects, len(EmojiSequence))
+        self.assertGreater(report.registries["definitions"].objects, 0)
+        for r in report.registries.values():
+            self.assertGreater(r.bytes, 0)
+        self.assertTrue(all(r.bytes == 0 for r in stats(memory=False).registries.values()))
+        json.dumps(report._asdict())
+
+    def test_log(self):
+        load_emoji_data()
+        with self.assertLogs("emoji_data", "INFO") as cm:
+            stats(memory=False, log=True)
+        self.assertEqual(len(cm.output), len(PHASES) + 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import os
 import unittest
-from typing import ClassVar, MutableSequence, Tuple
+from array import array
+from typing import ClassVar, MutableSequence, Set, Tuple
 
 from emoji_data import (
     EmojiCharacter,
@@ -16,8 +17,10 @@ from emoji_data import (
     is_emoji_presentation_sequence,
     is_emoji_zwj_sequence,  # 添加这一行
     load_emoji_data,
+    snapshot,
     unload_emoji_data,
 )
+from emoji_data.profiling import _sizeof
 
 
 class SequenceTestCase(unittest.TestCase):
@@ -179,6 +182,25 @@ class SequencePatternTestCase(unittest.TestCase):
         cnt = sum(1 for _ in EmojiSequence.find(s))
         self.assertEqual(cnt, 2)
 
+    def test_find_same_as_pattern(self):
+        keys = sorted(EmojiSequence.keys())
+        strings = [
+            "".join(keys),
+            " ".join(keys),
+            "x".join(keys),
+            "\u200d".join(keys),
+            "👨\u200d" * 100,
+            "🇦" * 101,
+            "🏴" + "\U000e0067" * 100,
+            "👍" + "\U0001f3fb" * 100,
+            "#" + "\ufe0f" * 100 + "\u20e3",
+        ]
+        for s in strings:
+            self.assertListEqual(
+                [(m.string, i, j) for m, i, j in EmojiSequence.find(s)],
+                [(m.group(), m.start(), m.end()) for m in EmojiSequence.pattern.finditer(s)],
+            )
+
     # 添加更多测试用例
     def test_emoji_zwj_sequence(self):
         # 测试ZWJ序列，如家庭表情符号
@@ -218,5 +240,180 @@ class SequencePatternTestCase(unittest.TestCase):
         self.assertIn("👍🏿", emoji_strings)  # 修饰符序列
 
 
+class SequenceAccessorTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_emoji_data()
+
+    def test_immutable_accessors(self):
+        m = EmojiSequence.from_string("👨‍👩‍👧")
+        self.assertIsInstance(m.code_points, tuple)
+        self.assertIsInstance(m.characters, tuple)
+        self.assertIs(m.code_points, m.code_points)
+        self.assertIs(m.characters, m.characters)
+        self.assertIsInstance(m.characters[0].properties, tuple)
+        self.assertEqual(m.hex, " ".join(c.hex for c in m.characters))
+        self.assertIs(m.hex, m.hex)
+        self.assertEqual(m.code_points_string, "1F468 200D 1F469 200D 1F467")
+        self.assertIs(m.code_points_string, m.code_points_string)
+
+
+class SequenceStoreTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_emoji_data()
+
+    def test_rows(self):
+        store = EmojiSequence.store()
+        self.assertEqual(len(store), len(EmojiSequence))
+        self.assertEqual(len(store.offsets), len(store) + 1)
+        self.assertEqual(store.offsets[-1], len(store.code_points))
+        for m in EmojiSequence.values():
+            i = m.id
+            self.assertEqual(store.code_points_of(i), m.code_points)  # type: ignore[arg-type]
+            self.assertEqual(store.type_field_names[store.type_fields[i]], m.type_field)  # type: ignore[index]
+            self.assertEqual(store.version_names[store.versions[i]], m.version)  # type: ignore[index]
+            self.assertEqual(store.variation_names[store.variations[i]], m.variation)  # type: ignore[index]
+            self.assertEqual(store.descriptions[i], m.description)  # type: ignore[index]
+            self.assertEqual(len(m), len(m.code_points))
+
+    def test_variation_replaces_fields(self):
+        # "☺️" is Basic_Emoji in emoji-sequences.txt, then defined again in emoji-variation-sequences.txt
+        m = EmojiSequence.from_string("☺️")
+        self.assertEqual(m.variation, "emoji style")
+        self.assertEqual(m.type_field, "")
+
+    def test_standalone(self):
+        m = EmojiSequence([0x1F468, 0x200D, 0x1F469], "RGI_Emoji_ZWJ_Sequence", "E2.0", "", "test")
+        self.assertIsNone(m.id)
+        self.assertEqual(m.string, "👨‍👩")
+        self.assertEqual(m.code_points, (0x1F468, 0x200D, 0x1F469))
+        self.assertEqual((m.type_field, m.version, m.variation, m.description), ("RGI_Emoji_ZWJ_Sequence", "E2.0", "", "test"))
+        with self.assertRaises(KeyError):
+            EmojiSequence([0x41])
+
+
+class SequenceIdTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_emoji_data()
+
+    def test_dense_ids(self):
+        ids = sorted(m.id for m in EmojiSequence.values())  # type: ignore[type-var]
+        self.assertListEqual(ids, list(range(len(EmojiSequence))))
+
+    def test_from_id(self):
+        for m in EmojiSequence.values():
+            self.assertIs(EmojiSequence.from_id(m.id), m)  # type: ignore[arg-type]
+        with self.assertRaises(KeyError):
+            EmojiSequence.from_id(len(EmojiSequence))
+        with self.assertRaises(KeyError):
+            EmojiSequence.from_id(-1)
+
+    def test_reproducible_ids(self):
+        ids = {k: m.id for k, m in EmojiSequence.items()}
+        unload_emoji_data()
+        load_emoji_data()
+        self.assertDictEqual(ids, {k: m.id for k, m in EmojiSequence.items()})
+
+    def test_from_many(self):
+        strings = ["👋🏽", "a", "😀"]
+        found = EmojiSequence.from_string_many(strings, strict=False)
+        self.assertListEqual(found, [EmojiSequence.from_string("👋🏽"), None, EmojiSequence.from_string("😀")])
+        with self.assertRaises(KeyError) as ctx:
+            EmojiSequence.from_string_many(iter(strings))
+        self.assertEqual(ctx.exception.args, ("a",))
+        values = ["1F44B 1F3FD", (0x1F44B, 0x1F3FD), [0x1F600], array("I", [0x1F600])]
+        expected = [EmojiSequence.from_string("👋🏽")] * 2 + [EmojiSequence.from_string("😀")] * 2
+        self.assertListEqual(EmojiSequence.from_hex_many(values), expected)
+        self.assertListEqual(EmojiSequence.from_hex_many(["1F600", "0041"], strict=False), [expected[2], None])
+        with self.assertRaises(KeyError) as ctx:
+            EmojiSequence.from_hex_many(["1F600", "0041 0042"])
+        self.assertEqual(ctx.exception.args, ("0041 0042",))
+
+    def test_find_ids(self):
+        text = "Hello 👨‍👩‍👧 world! 🇺🇸 How are you? 1️⃣ and 👍🏿"
+        expected = [(m.id, p0, p1) for m, p0, p1 in EmojiSequence.find_all(text)]
+        arr = EmojiSequence.find_ids(text)
+        self.assertEqual(arr.typecode, "I")
+        self.assertListEqual([tuple(arr[i : i + 3]) for i in range(0, len(arr), 3)], expected)
+        # append to an existing array
+        out = array("I", [1, 2, 3])
+        self.assertIs(EmojiSequence.find_ids(text, out), out)
+        self.assertEqual(len(out), 3 + len(arr))
+        with self.assertRaises(TypeError):
+            EmojiSequence.find_ids(text, array("L"))
+
+
+class SequenceOffsetsTestCase(unittest.TestCase):
+    text = "Hi 👋🏽, 中文 👨‍👩‍👧 \ud800 ©️ and #️⃣!"
+
+    @classmethod
+    def setUpClass(cls):
+        load_emoji_data()
+
+    def test_code_points(self):
+        spans = EmojiSequence.find_spans(self.text)
+        self.assertListEqual(spans, [(i, j) for _, i, j in EmojiSequence.find_all(self.text)])
+        self.assertListEqual([self.text[i:j] for i, j in spans], ["👋🏽", "👨‍👩‍👧", "©️", "#️⃣"])
+
+    def test_encoded(self):
+        for offsets, encoding, width in (("utf-16", "utf-16-le", 2), ("utf-8", "utf-8", 1)):
+            encoded = self.text.encode(encoding, "surrogatepass")
+            found = EmojiSequence.find_all(self.text, offsets=offsets)  # type: ignore[arg-type]
+            self.assertListEqual(
+                [encoded[i * width : j * width].decode(encoding) for _, i, j in found], ["👋🏽", "👨‍👩‍👧", "©️", "#️⃣"]
+            )
+            self.assertListEqual(list(EmojiSequence.find(self.text, offsets=offsets)), found)  # type: ignore[arg-type]
+            self.assertListEqual(EmojiSequence.find_spans(self.text, offsets=offsets), [(i, j) for _, i, j in found])  # type: ignore[arg-type]
+        self.assertListEqual(EmojiSequence.find_spans("Hi 👋🏽!", offsets="utf-16"), [(3, 7)])
+        self.assertListEqual(EmojiSequence.find_spans("no emoji", offsets="utf-8"), [])
+        with self.assertRaises(ValueError):
+            EmojiSequence.find_spans(self.text, offsets="utf-32")  # type: ignore[arg-type]
+
+    def test_bytes(self):
+        data = self.text.encode("utf-8", "surrogatepass")
+        expected = EmojiSequence.find_all(self.text, offsets="utf-8")
+        self.assertListEqual(list(EmojiSequence.find_bytes(data)), expected)
+        self.assertListEqual(list(EmojiSequence.find_bytes(bytearray(data))), expected)
+        self.assertListEqual(list(EmojiSequence.find_bytes(memoryview(data))), expected)
+        # A truncated sequence at the end, and bytes out of a sequence
+        self.assertListEqual([m.string for m, _, _ in EmojiSequence.find_bytes("👋🏽".encode() + b"\xf0\x9f\x91")], ["👋🏽"])
+        self.assertListEqual(list(EmojiSequence.find_bytes(b"\x80\x9f\x98\x80 \xff")), [])
+
+
+class MemoryFootprintTestCase(unittest.TestCase):
+    # Approximate total size of EmojiCharacter and EmojiSequence registries, measured on CPython 3.11 is about 2.1 MiB,
+    # it was about 6 MiB before the classes had __slots__ and shared strings, and sequences were backed by a columnar store.
+    # The trie of `EmojiSequence.find` takes about 1 MiB more.
+    MAX_REGISTRIES_SIZE = 3.5 * 1024 * 1024
+
+    @classmethod
+    def setUpClass(cls):
+        load_emoji_data()
+
+    def test_slots(self):
+        for obj in (EmojiCharacter.from_hex(0x1F600), EmojiSequence.from_hex(0x1F600)):
+            self.assertFalse(hasattr(obj, "__dict__"), f"{obj!r}")
+
+    def test_shared_strings(self):
+        versions = {m.version for m in EmojiSequence.values()}
+        self.assertEqual(len({id(m.version) for m in EmojiSequence.values()}), len(versions))
+        type_fields = {m.type_field for m in EmojiSequence.values()}
+        self.assertEqual(len({id(m.type_field) for m in EmojiSequence.values()}), len(type_fields))
+
+    def test_registries_size(self):
+        seen: Set[int] = set()
+        size = sum(
+            _sizeof(registry, seen)
+            for registry in (
+                EmojiCharacter.__data_dict__,  # pyright: ignore[reportGeneralTypeIssues]
+                EmojiSequence.__data_dict__,  # pyright: ignore[reportGeneralTypeIssues]
+                snapshot.current.trie,
+            )
+        )
+        self.assertLess(size, self.MAX_REGISTRIES_SIZE)
+
+
 if __name__ == "__main__":
     unittest.main()
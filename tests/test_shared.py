@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from emoji_data import EmojiCharacter, EmojiCharProperty, EmojiSequence, load_emoji_data, unload_emoji_data
+from emoji_data.shared import SharedTables
+
+# Attach to the segment in another process which never loads emoji data.
+ATTACH_SCRIPT = """
+import sys
+
+from emoji_data import EmojiCharProperty, EmojiSequence
+from emoji_data.shared import SharedTables
+
+assert len(EmojiSequence) == 0
+tables = SharedTables.attach(sys.argv[1])
+print(
+    len(tables),
+    tables.has_property("👍", EmojiCharProperty.EBASE),
+    "👨‍👩‍👧" in tables,
+    "a" in tables,
+    tables.is_rgi("☺︎"),
+)
+tables.close()
+"""
+
+
+class SharedTablesTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_emoji_data()
+
+    @classmethod
+    def tearDownClass(cls):
+        unload_emoji_data()
+
+    def assert_tables(self, tables: SharedTables):
+        self.assertEqual(len(tables), len(EmojiSequence))
+        # Properties are looked up by ranges, so that the characters and their neighbours cover every boundary
+        code_points = {0, 0x10FFFF, *range(0, 0x110000, 0x1001)}
+        for cp in EmojiCharacter.keys():
+            code_points.update((cp - 1, cp, cp + 1))
+        for cp in sorted(code_points):
+            try:
+                expected = set(EmojiCharacter[cp].properties)
+            except KeyError:
+                expected = set()
+            self.assertSetEqual(set(tables.properties(cp)), expected, f"{cp:04X}")
+        self.assertTrue(tables.has_property("🏿", EmojiCharProperty.EMOD))
+        self.assertFalse(tables.has_property("A", EmojiCharProperty.EMOJI))
+        for k in EmojiSequence.keys():
+            self.assertIn(k, tables)
+            self.assertEqual(tables.is_rgi(k), EmojiSequence.is_rgi(k))
+        for s in ("", "a", "😀‍😀", "🇦🇦", None):
+            self.assertNotIn(s, tables)
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "emoji.tables")
+            SharedTables.publish_file(path)
+            with SharedTables.attach_file(path) as tables:
+                self.assertIsNone(tables.name)
+                self.assert_tables(tables)
+
+    def test_shared_memory(self):
+        tables = SharedTables.publish()
+        try:
+            self.assert_tables(tables)
+            output = subprocess.run(
+                [sys.executable, "-c", ATTACH_SCRIPT, tables.name], check=True, capture_output=True, text=True
+            ).stdout
+            self.assertEqual(output.split(), [str(len(EmojiSequence)), "True", "True", "False", "False"])
+        finally:
+            tables.close(unlink=True)
+
+    def test_invalid_buffer(self):
+        with self.assertRaises(ValueError):
+            SharedTables(memoryview(bytes(64)))
+
+
+if __name__ == "__main__":
+    unittest.main()
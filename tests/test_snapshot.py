@@ -0,0 +1,188 @@
+import gc
+import threading
+import unittest
+import weakref
+
+from emoji_data import (
+    EmojiCharacter,
+    EmojiSequence,
+    cache_info,
+    disable_cache,
+    enable_cache,
+    is_emoji_sequence,
+    load_emoji_data,
+    reload_emoji_data,
+    snapshot,
+    unload_emoji_data,
+)
+
+
+class SnapshotTestCase(unittest.TestCase):
+    def tearDown(self):
+        unload_emoji_data()
+
+    def test_read_only(self):
+        load_emoji_data()
+        m = EmojiSequence.from_string("😀")
+        with self.assertRaises(TypeError):
+            EmojiSequence[m.string] = m  # type: ignore[index]
+        with self.assertRaises(TypeError):
+            del EmojiCharacter[0x1F600]  # type: ignore[attr-defined]
+        self.assertIs(EmojiSequence.from_string("😀"), m)
+
+    def test_replace(self):
+        load_emoji_data()
+        snap = snapshot.current
+        _ = EmojiSequence.pattern
+        self.assertIsNotNone(snap.pattern)
+        # Patterns are derived from the sequences, they don't outlive them
+        self.assertIsNone(snap.replace(sequences=snapshot.EMPTY.sequences).pattern)
+        self.assertIs(snap.replace(frozen=True).pattern, snap.pattern)
+        list(EmojiSequence.find_bytes(b"\xf0\x9f\x98\x80"))
+        self.assertIsNotNone(snap.byte_trie)
+        self.assertIsNone(snap.replace(sequences=snapshot.EMPTY.sequences).byte_trie)
+        with self.assertRaises(TypeError):
+            snap.replace(no_such_field=None)
+
+    def test_release_keeps_old_snapshot(self):
+        load_emoji_data()
+        snap = snapshot.current
+        n = len(snap.sequences)
+        unload_emoji_data()
+        self.assertIsNot(snapshot.current, snap)
+        self.assertEqual(len(EmojiSequence), 0)
+        # Readers holding the old snapshot still see all of it
+        self.assertEqual(len(snap.sequences), n)
+        self.assertIn("😀", snap.sequences)
+
+    def test_concurrent_initial(self):
+        results = []
+
+        def load():
+            load_emoji_data()
+            results.append(snapshot.current.sequences)
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Loaded only once, all the threads see the same data
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(r is results[0] for r in results))
+
+    def test_concurrent_readers(self):
+        text = "hi 😀 and 👨‍👩‍👧 and 🇨🇳!" * 20
+        load_emoji_data()
+        expected = EmojiSequence.find_all(text)
+        stop = threading.Event()
+        errors = []
+        partial = []
+
+        def read():
+            while not stop.is_set():
+                try:
+                    found = EmojiSequence.find_all(text)
+                except Exception as e:  # pragma: no cover
+                    errors.append(e)
+                    return
+                # Either all of the old data or nothing, never a half-built matcher
+                if found and [(m.string, i, j) for m, i, j in found] != [(m.string, i, j) for m, i, j in expected]:
+                    partial.append(found)  # pragma: no cover
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for t in readers:
+            t.start()
+        try:
+            for _ in range(5):
+                unload_emoji_data()
+                load_emoji_data()
+        finally:
+            stop.set()
+            for t in readers:
+                t.join()
+        self.assertListEqual(errors, [])
+        self.assertListEqual(partial, [])
+
+    def test_load_publishes_once(self):
+        published = []
+        publish = snapshot.publish
+
+        def spy(snap):
+            published.append(snap)
+            publish(snap)
+
+        snapshot.publish = spy
+        try:
+            load_emoji_data()
+        finally:
+            snapshot.publish = publish
+        self.assertEqual(len(published), 1)
+        snap = published[0]
+        self.assertTrue(snap.characters and snap.patterns and snap.sequences)
+
+    def test_reload(self):
+        load_emoji_data(type_fields=["RGI_Emoji_Flag_Sequence"], variations=False)
+        old = snapshot.current
+        m = EmojiSequence.from_string("🇨🇳")
+        ref = weakref.ref(old)
+        reload_emoji_data()
+        self.assertIsNot(snapshot.current, old)
+        self.assertNotIn("😀", old.sequences)
+        self.assertIn("😀", EmojiSequence)
+        self.assertIsNot(EmojiSequence.from_string("🇨🇳"), m)
+        # Nothing but this test references the old data
+        del old, m
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_reload_clears_cache(self):
+        load_emoji_data()
+        enable_cache(16)
+        try:
+            is_emoji_sequence("😀")
+            self.assertEqual(cache_info()["classify_sequence"].currsize, 1)
+            reload_emoji_data()
+            self.assertEqual(cache_info()["classify_sequence"].currsize, 0)
+            self.assertTrue(is_emoji_sequence("😀"))
+        finally:
+            disable_cache()
+
+    def test_concurrent_reload(self):
+        text = "hi 😀 and 👨‍👩‍👧 and 🇨🇳!" * 20
+        load_emoji_data()
+        expected = [(m.string, i, j) for m, i, j in EmojiSequence.find_all(text)]
+        stop = threading.Event()
+        errors = []
+        wrong = []
+
+        def read():
+            while not stop.is_set():
+                try:
+                    found = [(m.string, i, j) for m, i, j in EmojiSequence.find_all(text)]
+                    EmojiSequence.from_string("😀")
+                    EmojiCharacter.from_character("😀")
+                    ok = is_emoji_sequence("👨‍👩‍👧")
+                except Exception as e:  # pragma: no cover
+                    errors.append(e)
+                    return
+                # Never an empty registry nor a matcher of nothing
+                if found != expected or not ok:
+                    wrong.append(found)  # pragma: no cover
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for t in readers:
+            t.start()
+        try:
+            for _ in range(5):
+                reload_emoji_data()
+        finally:
+            stop.set()
+            for t in readers:
+                t.join()
+        self.assertListEqual(errors, [])
+        self.assertListEqual(wrong, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
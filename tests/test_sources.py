@@ -0,0 +1,101 @@
+import io
+import tarfile
+import unittest
+import zipfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from emoji_data import EmojiDatabase, EmojiSequence, emoji_data_lines, load_emoji_data, unload_emoji_data
+from emoji_data.packed import PACKED_DATA_FILE, SOURCE_DATA_FILES, read_packed_data
+from emoji_data.sources import BufferSource, ProviderSource, archive_source, data_source
+
+
+def package_files(packed: bool = False):
+    names = SOURCE_DATA_FILES + (PACKED_DATA_FILE,) if packed else SOURCE_DATA_FILES
+    return {name: data_source().joinpath(name).read_bytes() for name in names}
+
+
+class SourcesTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.files = package_files()
+        cls.keys = EmojiDatabase.load().sequences.keys()
+
+    def tearDown(self):
+        unload_emoji_data()
+
+    def assertLoads(self, source):
+        db = EmojiDatabase.load(source)
+        self.assertEqual(db.sequences.keys(), self.keys)
+
+    def test_buffers(self):
+        self.assertLoads(self.files)
+        self.assertLoads({name: memoryview(data) for name, data in self.files.items()})
+        self.assertLoads({name: data.decode("utf-8") for name, data in self.files.items()})
+
+    def test_buffers_packed(self):
+        files = package_files(packed=True)
+        self.assertIsNone(read_packed_data(source=self.files))
+        packed = read_packed_data(source=files)
+        self.assertIsNotNone(packed)
+        self.assertListEqual(list(packed.sequences()), list(read_packed_data().sequences()))  # type: ignore[union-attr]
+        self.assertLoads(files)
+
+    def test_emoji_data_lines(self):
+        source = BufferSource({"emoji-data.txt": "# comment\n\n0023 ; Emoji # E0.0 [1] (#️) hash sign\n"})
+        self.assertListEqual(list(emoji_data_lines("emoji-data.txt", source)), [("0023 ; Emoji", "E0.0 [1] (#️) hash sign")])
+        with self.assertRaises(FileNotFoundError):
+            list(emoji_data_lines("emoji-sequences.txt", source))
+
+    def test_provider(self):
+        opened = []
+
+        def provider(name):
+            opened.append(name)
+            return io.BytesIO(self.files[name])
+
+        self.assertIsInstance(data_source(provider), ProviderSource)
+        self.assertLoads(provider)
+        self.assertTrue(set(opened) >= set(SOURCE_DATA_FILES))
+        self.assertFalse(data_source(provider).joinpath(PACKED_DATA_FILE).is_file())
+
+    def test_zip(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp, "emoji.zip")
+            with zipfile.ZipFile(path, "w") as zf:
+                for name, data in self.files.items():
+                    zf.writestr(f"emoji/17.0/{name}", data)
+                zf.writestr("emoji/17.0/old/emoji-data.txt", b"")
+            with zipfile.ZipFile(path) as zf:
+                self.assertLoads(archive_source(zf, "emoji/17.0"))
+                self.assertLoads(zipfile.Path(zf, "emoji/17.0/"))
+            top = Path(tmp, "top.zip")
+            with zipfile.ZipFile(top, "w") as zf:
+                for name, data in self.files.items():
+                    zf.writestr(name, data)
+            self.assertLoads(top)
+            self.assertLoads(str(top))
+            load_emoji_data(source=top)
+        self.assertEqual(len(EmojiSequence), len(self.keys))
+
+    def test_tar(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp, "emoji.tar.gz")
+            with tarfile.open(path, "w:gz") as tf:
+                for name, data in self.files.items():
+                    info = tarfile.TarInfo(name)
+                    info.size = len(data)
+                    tf.addfile(info, io.BytesIO(data))
+            source = archive_source(path)
+            self.assertTrue(all(source.joinpath(name).is_file() for name in self.files))
+            self.assertLoads(path)
+            with tarfile.open(path) as tf:
+                self.assertLoads(tf)
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            data_source(42)
+
+
+if __name__ == "__main__":
+    unittest.main()
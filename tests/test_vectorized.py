@@ -0,0 +1,77 @@
+import unittest
+
+from emoji_data import EmojiCharacter, EmojiCharProperty, load_emoji_data, unload_emoji_data
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+else:
+    from emoji_data.vectorized import (
+        PROPERTY_BITS,
+        code_points,
+        code_points_batch,
+        has_property,
+        property_masks,
+        property_masks_batch,
+        property_table,
+        release_property_table,
+    )
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class VectorizedTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_emoji_data()
+
+    @classmethod
+    def tearDownClass(cls):
+        release_property_table()
+        unload_emoji_data()
+
+    def test_code_points(self):
+        s = "a👨‍👩‍👧😀\ud800"
+        cps = code_points(s)
+        self.assertEqual(cps.dtype, np.uint32)
+        self.assertListEqual(cps.tolist(), [ord(c) for c in s])
+
+    def test_code_points_batch(self):
+        strings = ["abc", "", "🇺🇸", "这是😀"]
+        cps, offsets = code_points_batch(strings)
+        self.assertListEqual(offsets.tolist(), [0, 3, 3, 5, 8])
+        for i, s in enumerate(strings):
+            self.assertListEqual(cps[offsets[i] : offsets[i + 1]].tolist(), [ord(c) for c in s])
+
+    def test_property_table(self):
+        table = property_table()
+        self.assertEqual(len(table), 0x110000)
+        self.assertFalse(table.flags.writeable)
+        for c in EmojiCharacter.values():
+            for p, bit in PROPERTY_BITS.items():
+                self.assertEqual(bool(table[c.code_point] & bit), p in c.properties, f"{c!r} {p}")
+
+    def test_released_by_unload(self):
+        self.assertIs(property_table(), property_table())
+        unload_emoji_data()
+        try:
+            self.assertFalse(property_table().any())
+        finally:
+            load_emoji_data()
+
+    def test_property_masks(self):
+        s = "Hi 👋🏽!"
+        masks = property_masks(s)
+        self.assertListEqual(has_property(masks, EmojiCharProperty.EMOD).tolist(), [False] * 4 + [True, False])
+        self.assertListEqual(has_property(masks, EmojiCharProperty.EBASE).tolist(), [False] * 3 + [True, False, False])
+        self.assertListEqual(property_masks(code_points(s)).tolist(), masks.tolist())
+
+    def test_property_masks_batch(self):
+        strings = ["a😀", "🇺🇸"]
+        masks, offsets = property_masks_batch(strings)
+        self.assertListEqual(offsets.tolist(), [0, 2, 4])
+        self.assertListEqual(masks.tolist(), property_masks("".join(strings)).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()